@@ -0,0 +1,3 @@
+"""
+Výkonnostní testy - generátory syntetických grafů a měření jednotlivých fází.
+"""
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Deterministické generátory syntetických grafů ve formátu .tg.
+
+Každý generátor je funkce (n, seed) -> iterátor řádků .tg souboru, takže
+i grafy s 10^6 uzly se zapisují proudově bez držení celého souboru v paměti.
+Stejné n a seed dají vždy stejný soubor.
+
+Použití z příkazové řádky:
+    python benchmarks/generators.py er 1000 er_1000.tg
+    python benchmarks/generators.py binary_tree 255 strom.tg --seed 7
+"""
+
+import math
+import random
+import sys
+
+
+def _node_lines(names):
+    """Řádky s definicemi uzlů."""
+    for name in names:
+        yield f"u {name};"
+
+
+def _weight(rng):
+    """Náhodná kladná celočíselná váha hrany."""
+    return rng.randint(1, 9)
+
+
+def erdos_renyi(n, seed=0, avg_degree=4):
+    """
+    Náhodný neorientovaný graf G(n, m) s průměrným stupněm avg_degree.
+    
+    Hrany se losují jako náhodné dvojice různých uzlů (bez opakování),
+    takže generování zůstává lineární i pro velká n.
+    """
+    rng = random.Random(seed)
+    names = [f"N{i}" for i in range(n)]
+    yield from _node_lines(names)
+    
+    if n < 2:
+        return
+    m = min(n * avg_degree // 2, n * (n - 1) // 2)
+    seen = set()
+    while len(seen) < m:
+        a = rng.randrange(n)
+        b = rng.randrange(n)
+        if a == b:
+            continue
+        key = (a, b) if a < b else (b, a)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield f"h {names[a]} - {names[b]} {_weight(rng)};"
+
+
+def grid(n, seed=0):
+    """
+    Čtvercová mřížka s přibližně n uzly (neorientovaná, ohodnocená).
+    """
+    rng = random.Random(seed)
+    side = max(1, math.isqrt(n))
+    names = [[f"G{r}_{c}" for c in range(side)] for r in range(side)]
+    yield from _node_lines(name for row in names for name in row)
+    
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                yield f"h {names[r][c]} - {names[r][c + 1]} {_weight(rng)};"
+            if r + 1 < side:
+                yield f"h {names[r][c]} - {names[r + 1][c]} {_weight(rng)};"
+
+
+def scale_free(n, seed=0, links=2):
+    """
+    Orientovaný bezškálový graf (Barabási-Albert).
+    
+    Každý nový uzel vytvoří `links` hran do již existujících uzlů, které
+    se vybírají úměrně jejich stupni.
+    """
+    rng = random.Random(seed)
+    names = [f"S{i}" for i in range(n)]
+    yield from _node_lines(names)
+    
+    # Seznam konců hran - uzel se v něm vyskytuje tolikrát, jaký má stupeň
+    targets = []
+    for i in range(1, n):
+        chosen = set()
+        while len(chosen) < min(links, i):
+            if targets and rng.random() < 0.9:
+                chosen.add(rng.choice(targets))
+            else:
+                chosen.add(rng.randrange(i))
+        for j in sorted(chosen):
+            yield f"h {names[i]} > {names[j]} {_weight(rng)};"
+            targets.extend((i, j))
+
+
+def complete(n, seed=0):
+    """Úplný neorientovaný graf K_n."""
+    rng = random.Random(seed)
+    names = [f"K{i}" for i in range(n)]
+    yield from _node_lines(names)
+    
+    for i in range(n):
+        for j in range(i + 1, n):
+            yield f"h {names[i]} - {names[j]} {_weight(rng)};"
+
+
+def bipartite(n, seed=0, avg_degree=4):
+    """
+    Náhodný bipartitní graf s partitami velikosti n/2.
+    """
+    rng = random.Random(seed)
+    left = [f"L{i}" for i in range(n // 2)]
+    right = [f"R{i}" for i in range(n - n // 2)]
+    yield from _node_lines(left + right)
+    
+    if not left or not right:
+        return
+    m = min(n * avg_degree // 2, len(left) * len(right))
+    seen = set()
+    while len(seen) < m:
+        key = (rng.randrange(len(left)), rng.randrange(len(right)))
+        if key in seen:
+            continue
+        seen.add(key)
+        yield f"h {left[key[0]]} - {right[key[1]]} {_weight(rng)};"
+
+
+def binary_tree(n, seed=0, missing=0.1):
+    """
+    Binární strom v haldovém rozložení: n příkazů 'u', vynechané uzly 'u *'.
+    
+    Uzel i má potomky 2i+1 a 2i+2; potomci vynechaného uzlu jsou také
+    vynechaní.
+    """
+    rng = random.Random(seed)
+    present = []
+    for i in range(n):
+        parent_present = i == 0 or present[(i - 1) // 2]
+        keep = parent_present and (i == 0 or rng.random() >= missing)
+        present.append(keep)
+        yield f"u T{i} {rng.randint(1, 99)};" if keep else "u *;"
+
+
+def dense_multigraph(n, seed=0, density=0.1, multiplicity=3):
+    """
+    Hustý neorientovaný multigraf s označenými hranami a smyčkami.
+    
+    Každá dvojice uzlů je spojena s pravděpodobností `density` jednou až
+    `multiplicity` rovnoběžnými hranami; každý desátý uzel má smyčku.
+    """
+    rng = random.Random(seed)
+    names = [f"M{i}" for i in range(n)]
+    yield from _node_lines(names)
+    
+    label = 0
+    for i in range(n):
+        if i % 10 == 0:
+            label += 1
+            yield f"h {names[i]} - {names[i]} {_weight(rng)} :e{label};"
+        for j in range(i + 1, n):
+            if rng.random() >= density:
+                continue
+            for _ in range(rng.randint(1, multiplicity)):
+                label += 1
+                yield f"h {names[i]} - {names[j]} {_weight(rng)} :e{label};"
+
+
+# Generátory podle názvu: funkce (n, seed) -> iterátor řádků
+GENERATORS = {
+    'er': erdos_renyi,
+    'grid': grid,
+    'scale_free': scale_free,
+    'complete': complete,
+    'bipartite': bipartite,
+    'binary_tree': binary_tree,
+    'multigraph': dense_multigraph,
+}
+
+
+def write_graph(filepath, generator, n, seed=0):
+    """
+    Zapíše vygenerovaný graf do souboru.
+    
+    Args:
+        filepath (str): Cesta k výstupnímu souboru
+        generator (str): Název generátoru z GENERATORS
+        n (int): Počet uzlů
+        seed (int): Semínko náhodného generátoru
+    
+    Returns:
+        int: Počet zapsaných řádků
+    
+    Raises:
+        KeyError: Pokud generátor neexistuje
+    """
+    if generator not in GENERATORS:
+        raise KeyError(f"Neznámý generátor: {generator} (dostupné: {', '.join(GENERATORS)})")
+    
+    count = 0
+    with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for line in GENERATORS[generator](n, seed):
+            f.write(line)
+            f.write("\n")
+            count += 1
+    return count
+
+
+def main():
+    """Vygeneruje jeden graf podle argumentů příkazové řádky."""
+    argv = sys.argv[1:]
+    seed = 0
+    if '--seed' in argv:
+        i = argv.index('--seed')
+        seed = int(argv[i + 1])
+        del argv[i:i + 2]
+    
+    if len(argv) != 3:
+        print("Použití: python generators.py <generátor> <počet_uzlů> <výstup.tg> [--seed N]")
+        print(f"Generátory: {', '.join(GENERATORS)}")
+        sys.exit(1)
+    
+    generator, n, output = argv[0], int(argv[1]), argv[2]
+    try:
+        lines = write_graph(output, generator, n, seed)
+    except KeyError as e:
+        print(f"Chyba: {e.args[0]}")
+        sys.exit(1)
+    print(f"Zapsáno {lines} řádků do {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Paměťová náročnost grafu - zpráva po komponentách a benchmark špičky RSS.
+
+Zpráva pro jeden soubor (kolik bajtů zabírají hrany, seznamy sousedů,
+jednotlivé matice z build_all_matrices, popisky, ...):
+    python benchmarks/memory_report.py data/grafy/02.tg
+    python benchmarks/memory_report.py velky.tg --no-matrices
+
+Benchmark - špička RSS v závislosti na velikosti grafu. Každé měření běží
+v samostatném procesu, protože špičku RSS nelze v procesu vynulovat:
+    python benchmarks/memory_report.py --benchmark --output pamet.json
+    python benchmarks/memory_report.py --benchmark --output nova.json --compare pamet.json
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Přidání rodičovského adresáře do sys.path pro import src modulů
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph import load_graph
+from src.matrices import MatrixBuilder
+from src.memory import memory_report
+from benchmarks.generators import GENERATORS, write_graph
+from benchmarks.run_benchmarks import compare_results, print_comparison, DEFAULT_THRESHOLD
+
+try:
+    import resource
+except ImportError:
+    # Windows - špičku RSS neumíme zjistit, benchmark hlásí jen velikosti struktur
+    resource = None
+
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+
+# Matice (n² paměti, Floyd-Warshall n³ času) sestavujeme jen do této velikosti
+DEFAULT_MAX_MATRIX_NODES = 200
+
+# Změny menší než 1 MB se při porovnání ignorují
+MIN_COMPARABLE_BYTES = 1 << 20
+
+MB = 1 << 20
+
+
+def peak_rss():
+    """
+    Špička rezidentní paměti procesu.
+    
+    Returns:
+        int: Bajty nebo None, pokud ji platforma neposkytuje
+    """
+    # Linux: VmHWM patří jen tomuto procesu (ru_maxrss se dědí přes exec
+    # z rodiče, který mohl předtím generovat velký graf)
+    try:
+        with open('/proc/self/status', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux vrací kilobajty, macOS bajty
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _format_bytes(size):
+    """Velikost v čitelných jednotkách."""
+    if size >= MB:
+        return f"{size / MB:.2f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} kB"
+    return f"{size} B"
+
+
+def print_report(report):
+    """Vypíše zprávu memory_report() jako tabulku po sekcích."""
+    total = report['total'] or 1
+    titles = {'graph': 'GRAF', 'matrices': 'MATICE (build_all_matrices)', 'builder': 'CACHE BUILDERU'}
+    for section, title in titles.items():
+        if section not in report:
+            continue
+        entries = report[section]
+        print(f"\n{title} - celkem {_format_bytes(sum(entries.values()))}")
+        print("-" * 60)
+        for name, size in entries.items():
+            print(f"  {name:<38} {_format_bytes(size):>12} {size / total * 100:>6.1f} %")
+    print(f"\nNamedMatrixRow (dočasně na každý přístup m['A']): {report['row_wrapper']} B")
+    print(f"Celkem: {_format_bytes(report['total'])}")
+
+
+def measure(filepath, max_matrix_nodes=DEFAULT_MAX_MATRIX_NODES):
+    """
+    Jedno měření benchmarku (volá se v samostatném procesu).
+    
+    Returns:
+        dict: Špičky RSS po načtení a po sestavení matic, velikosti struktur
+    """
+    result = {'peak_rss_start': peak_rss()}
+    
+    graph = load_graph(filepath)
+    result['peak_rss_load'] = peak_rss()
+    result['nodes'] = graph.get_node_count()
+    result['edges'] = graph.get_edge_count()
+    
+    builder = matrices = None
+    if result['nodes'] <= max_matrix_nodes:
+        builder = MatrixBuilder(graph)
+        matrices = builder.build_all_matrices()
+    result['peak_rss_total'] = peak_rss()
+    
+    # Průchod strukturami sám alokuje - měříme ho až po špičkách RSS
+    report = memory_report(graph, builder, matrices)
+    result['graph_bytes'] = sum(report['graph'].values())
+    result['matrices_bytes'] = sum(report.get('matrices', {}).values()) if matrices else None
+    result['components'] = {**report['graph'], **report.get('matrices', {})}
+    return result
+
+
+def run_benchmark(generators, sizes, max_matrix_nodes=DEFAULT_MAX_MATRIX_NODES, seed=0, log=print):
+    """
+    Změří špičku RSS pro všechny kombinace generátor × velikost.
+    
+    Returns:
+        dict: {'meta': {...}, 'results': {'generátor/n': {...}}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for generator in generators:
+            for n in sizes:
+                path = str(Path(tmpdir) / f"{generator}_{n}.tg")
+                write_graph(path, generator, n, seed)
+                
+                output = subprocess.run(
+                    [sys.executable, __file__, '--measure', path, str(max_matrix_nodes)],
+                    capture_output=True, text=True, check=True,
+                ).stdout
+                entry = json.loads(output.strip().splitlines()[-1])
+                entry.update({'generator': generator, 'size': n})
+                results[f"{generator}/{n}"] = entry
+                
+                rss = entry['peak_rss_total']
+                log(f"{generator}/{n}: {entry['nodes']} uzlů, {entry['edges']} hran, "
+                    f"graf {_format_bytes(entry['graph_bytes'])}, "
+                    f"špička RSS {_format_bytes(rss) if rss else 'neznámá'}")
+    
+    meta = {'sizes': list(sizes), 'generators': list(generators), 'seed': seed,
+            'max_matrix_nodes': max_matrix_nodes, 'rss_available': resource is not None}
+    return {'meta': meta, 'results': results}
+
+
+def _option(argv, name, default):
+    """Vyjme z argumentů volbu s hodnotou."""
+    if name in argv:
+        i = argv.index(name)
+        if i + 1 >= len(argv):
+            raise ValueError(f"Volba {name} vyžaduje hodnotu")
+        value = argv[i + 1]
+        del argv[i:i + 2]
+        return value
+    return default
+
+
+def main():
+    """Spuštění z příkazové řádky."""
+    argv = sys.argv[1:]
+    
+    if argv and argv[0] == '--measure':
+        # Podřízený proces benchmarku - výsledek jako JSON na poslední řádek
+        print(json.dumps(measure(argv[1], int(argv[2]))))
+        return
+    
+    if not argv or argv[0] in ('-h', '--help'):
+        print(__doc__)
+        print("Volby benchmarku: --sizes --generators --max-matrix-nodes --seed "
+              "--output --compare --threshold")
+        sys.exit(0 if argv else 1)
+    
+    if argv[0] == '--benchmark':
+        argv = argv[1:]
+        try:
+            sizes = [int(n) for n in _option(argv, '--sizes', ','.join(map(str, DEFAULT_SIZES))).split(',')]
+            generators = _option(argv, '--generators', 'er,grid,scale_free').split(',')
+            max_matrix_nodes = int(_option(argv, '--max-matrix-nodes', DEFAULT_MAX_MATRIX_NODES))
+            seed = int(_option(argv, '--seed', 0))
+            output = _option(argv, '--output', None)
+            compare = _option(argv, '--compare', None)
+            threshold = float(_option(argv, '--threshold', DEFAULT_THRESHOLD))
+            for name in generators:
+                if name not in GENERATORS:
+                    raise ValueError(f"Neznámý generátor: {name}")
+            if argv:
+                raise ValueError(f"Neznámé argumenty: {' '.join(argv)}")
+        except ValueError as e:
+            print(f"Chyba v parametrech: {e}")
+            sys.exit(1)
+        
+        results = run_benchmark(generators, sizes, max_matrix_nodes, seed)
+        
+        if output:
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+            print(f"\nVýsledky uloženy do: {output}")
+        
+        if compare:
+            with open(compare, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+            regressions = 0
+            for metric in ('peak_rss_total', 'graph_bytes'):
+                print(f"\nPorovnání: {metric}")
+                rows = compare_results(baseline, results, metric, MIN_COMPARABLE_BYTES)
+                regressions += print_comparison(rows, threshold, unit='MB', scale=1 / MB)
+            if regressions:
+                sys.exit(1)
+        return
+    
+    filepath = argv[0]
+    if not Path(filepath).exists():
+        print(f"Soubor nenalezen: {filepath}")
+        sys.exit(1)
+    
+    graph = load_graph(filepath)
+    builder = matrices = None
+    if '--no-matrices' not in argv:
+        builder = MatrixBuilder(graph)
+        matrices = builder.build_all_matrices()
+    
+    print(f"Graf: {filepath} ({graph.get_node_count()} uzlů, {graph.get_edge_count()} hran)")
+    print_report(memory_report(graph, builder, matrices))
+    rss = peak_rss()
+    if rss is not None:
+        print(f"Špička RSS procesu: {_format_bytes(rss)}")
+
+
+if __name__ == "__main__":
+    main()
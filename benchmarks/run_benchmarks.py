@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Sada výkonnostních testů nad syntetickými grafy.
+
+Pro každý generátor a velikost grafu změří parsování, sestavení Graph,
+všechny metody MatrixBuilder a všechny kontroly GraphAnalyzer. Výsledky se
+ukládají do JSON, aby šlo běhy porovnat a najít regrese.
+
+Použití:
+    python benchmarks/run_benchmarks.py --output vysledky.json
+    python benchmarks/run_benchmarks.py --sizes 10,100,1000,10000 --generators er,grid
+    python benchmarks/run_benchmarks.py --output novy.json --compare vysledky.json
+
+Úlohy, jejichž odhadovaná náročnost přesáhne --max-work (např. O(n³)
+Floyd-Warshall na 10^5 uzlech), se přeskočí a v JSON jsou označené jako
+'skipped'.
+
+Sada měří i čas startu - importy balíčku a skriptů (python -X importtime
+v novém interpretu). Výsledky jsou pod klíči 'startup/...' a při --compare
+se hlídají stejně jako ostatní úlohy. Vypnutí: --startup 0.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Přidání rodičovského adresáře do sys.path pro import src modulů
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parser import GraphParser
+from src.graph import Graph
+from src.matrices import MatrixBuilder
+from src.analyzer import GraphAnalyzer
+from src import formats
+from benchmarks.generators import GENERATORS, write_graph
+
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_REPEAT = 3
+
+# Maximální odhadovaný počet elementárních kroků jedné úlohy
+DEFAULT_MAX_WORK = 5 * 10 ** 7
+
+# Relativní zpomalení, od kterého se změna hlásí jako regrese
+DEFAULT_THRESHOLD = 0.25
+
+# Časy kratší než tato mez (v sekundách) se při porovnání ignorují - jen šum
+MIN_COMPARABLE_TIME = 0.0005
+
+# Kořen repozitáře - pracovní adresář při měření startu
+ROOT = Path(__file__).parent.parent
+
+
+def _script(path):
+    """Kód, který provede jen importy skriptu (bez volání main)."""
+    return f"import runpy; runpy.run_path({path!r}, run_name='benchmark')"
+
+
+# Měření startu: název -> kód spuštěný v novém interpretu
+STARTUP_TARGETS = {
+    'import_src': 'import src',
+    'import_graph': 'import src.graph',
+    'import_visualizer': 'import src.visualizer',
+    'main': _script('main.py'),
+    'run': _script('scripts/run.py'),
+    'analyze_properties': _script('scripts/analyze_properties.py'),
+    'analyze_matrices': _script('scripts/analyze_matrices.py'),
+}
+
+# Generátory, jejichž velikost roste kvadraticky s n - omezujeme počet uzlů
+MAX_NODES = {
+    'complete': 2000,
+    'multigraph': 2000,
+}
+
+
+def _work(complexity, n, m):
+    """Odhad počtu kroků úlohy dané složitosti."""
+    return {
+        'linear': n + m,
+        'quadratic': n * n,
+        'incidence': n * m,
+        'bfs_all': n * (n + m),
+        'cubic': n ** 3,
+    }[complexity]
+
+
+def _builder_task(method, *args, workers=1):
+    """Úloha volající metodu nového MatrixBuilder (bez cache z předchozích opakování)."""
+    def setup(context):
+        return MatrixBuilder(context['graph'], workers=workers)
+    
+    def run(builder):
+        return getattr(builder, method)(*args)
+    
+    return setup, run
+
+
+def _analyzer_task(method):
+    """Úloha volající kontrolu nového GraphAnalyzer."""
+    def setup(context):
+        return GraphAnalyzer(context['graph'])
+    
+    def run(analyzer):
+        return getattr(analyzer, method)()
+    
+    return setup, run
+
+
+def _writer_task(function):
+    """Úloha zapisující graf do souborového formátu (výstup se zahazuje)."""
+    def setup(context):
+        return context['graph']
+    
+    def run(graph):
+        with open(os.devnull, 'w', encoding='utf-8') as f:
+            function(graph, f)
+    
+    return setup, run
+
+
+def _connected_complexity(context):
+    """Souvislost orientovaného grafu spouští BFS z každého uzlu."""
+    return 'bfs_all' if context['graph'].is_directed() else 'linear'
+
+
+# Úlohy: název -> (složitost nebo funkce kontext -> složitost, setup, run)
+TASKS = {
+    'parse': ('linear', lambda context: context['path'],
+              lambda path: GraphParser().parse_file(path)),
+    'graph': ('linear', lambda context: context['parsed'],
+              lambda parsed: Graph(*parsed)),
+    
+    'adjacency_matrix': ('quadratic', *_builder_task('adjacency_matrix')),
+    'weighted_adjacency_matrix': ('quadratic', *_builder_task('weighted_adjacency_matrix')),
+    'signed_matrix': ('quadratic', *_builder_task('signed_matrix')),
+    'adjacency_matrix_powers': ('cubic', *_builder_task('adjacency_matrix_powers', 3)),
+    'incidence_matrix': ('incidence', *_builder_task('incidence_matrix')),
+    'distance_matrix': ('cubic', *_builder_task('distance_matrix')),
+    'predecessor_matrix': ('cubic', *_builder_task('predecessor_matrix')),
+    # Blokový Floyd-Warshall ve všech jádrech (od MatrixBuilder.PARALLEL_MIN_NODES uzlů)
+    'distance_matrix_parallel': ('cubic', *_builder_task('distance_matrix',
+                                                         workers=os.cpu_count() or 1)),
+    'reachability_matrix': ('quadratic', *_builder_task('reachability_matrix')),
+    'walk_counts': ('linear', *_builder_task('walk_counts', [0], 3)),
+    'incident_edges_table': ('linear', *_builder_task('incident_edges_table')),
+    'neighbor_list': ('linear', *_builder_task('neighbor_list')),
+    'node_and_edge_list': ('linear', *_builder_task('node_and_edge_list')),
+    
+    'is_weighted': ('linear', *_analyzer_task('is_weighted')),
+    'is_directed': ('linear', *_analyzer_task('is_directed')),
+    'is_connected': (_connected_complexity, *_analyzer_task('is_connected')),
+    'is_simple': ('linear', *_analyzer_task('is_simple')),
+    'is_loop_free': ('linear', *_analyzer_task('is_loop_free')),
+    'is_planar': ('linear', *_analyzer_task('is_planar')),
+    'is_finite': ('linear', *_analyzer_task('is_finite')),
+    'is_complete': ('linear', *_analyzer_task('is_complete')),
+    'is_regular': ('linear', *_analyzer_task('is_regular')),
+    'is_bipartite': ('linear', *_analyzer_task('is_bipartite')),
+    
+    'write_dot': ('linear', *_writer_task(formats.write_dot)),
+    'write_graphml': ('linear', *_writer_task(formats.write_graphml)),
+    'write_edge_list': ('linear', *_writer_task(formats.write_edge_list)),
+}
+
+
+def time_task(setup, run, context, repeat):
+    """
+    Změří úlohu - příprava (setup) se do času nezapočítává.
+    
+    Returns:
+        dict: {'min': s, 'median': s, 'runs': [s, ...]}
+    """
+    runs = []
+    for _ in range(repeat):
+        argument = setup(context)
+        start = time.perf_counter()
+        run(argument)
+        runs.append(time.perf_counter() - start)
+    return {'min': min(runs), 'median': statistics.median(runs), 'runs': runs}
+
+
+def run_suite(generators, sizes, repeat=DEFAULT_REPEAT, max_work=DEFAULT_MAX_WORK,
+              tasks=None, seed=0, log=print):
+    """
+    Spustí benchmarky pro všechny kombinace generátor × velikost.
+    
+    Args:
+        generators (list): Názvy generátorů z GENERATORS
+        sizes (list): Počty uzlů
+        repeat (int): Počet opakování každé úlohy
+        max_work (int): Úlohy s větší odhadovanou náročností se přeskočí
+        tasks (list): Názvy úloh z TASKS (výchozí všechny)
+        seed (int): Semínko generátorů
+        log (callable): Funkce pro průběžný výpis
+    
+    Returns:
+        dict: {'meta': {...}, 'results': {'generátor/n/úloha': {...}}}
+    """
+    tasks = tasks or list(TASKS)
+    results = {}
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for generator in generators:
+            for n in sizes:
+                if n > MAX_NODES.get(generator, n):
+                    log(f"{generator}/{n}: přeskočeno (max. {MAX_NODES[generator]} uzlů)")
+                    continue
+                
+                path = str(Path(tmpdir) / f"{generator}_{n}.tg")
+                write_graph(path, generator, n, seed)
+                
+                parsed = GraphParser().parse_file(path)
+                graph = Graph(*parsed)
+                context = {'path': path, 'parsed': parsed, 'graph': graph}
+                nodes, edges = graph.get_node_count(), graph.get_edge_count()
+                log(f"{generator}/{n}: {nodes} uzlů, {edges} hran")
+                
+                for name in tasks:
+                    complexity, setup, run = TASKS[name]
+                    if callable(complexity):
+                        complexity = complexity(context)
+                    key = f"{generator}/{n}/{name}"
+                    entry = {'generator': generator, 'size': n, 'task': name,
+                             'nodes': nodes, 'edges': edges, 'complexity': complexity}
+                    
+                    if _work(complexity, nodes, edges) > max_work:
+                        entry['skipped'] = True
+                        results[key] = entry
+                        continue
+                    
+                    entry.update(time_task(setup, run, context, repeat))
+                    results[key] = entry
+                    log(f"  {name:<28} {entry['min'] * 1000:>10.2f} ms")
+    
+    meta = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'seed': seed,
+        'sizes': list(sizes),
+        'generators': list(generators),
+    }
+    return {'meta': meta, 'results': results}
+
+
+def import_time(code):
+    """
+    Celkový čas importů kódu v novém interpretu podle python -X importtime.
+    
+    Sčítá kumulativní časy importů nejvyšší úrovně (vnořené jsou v nich
+    započtené), včetně importů při startu interpretu.
+    
+    Returns:
+        float: Čas v sekundách
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    total = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Importy nejvyšší úrovně mají před názvem jedinou mezeru, hlavička není číslo
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            total += int(cumulative)
+    return total / 1e6
+
+
+def measure_startup(repeat=DEFAULT_REPEAT, targets=None, log=print):
+    """
+    Změří čas startu - importy jednotlivých cílů bez startu samotného interpretu.
+    
+    Args:
+        repeat (int): Počet opakování každého cíle
+        targets (list): Názvy ze STARTUP_TARGETS (výchozí všechny)
+        log (callable): Funkce pro průběžný výpis
+    
+    Returns:
+        dict: {'startup/název': {...}} ve formátu výsledků run_suite()
+    """
+    # Importy při startu interpretu (site, encodings, ...) se odečtou
+    interpreter = min(import_time('pass') for _ in range(repeat))
+    results = {}
+    log(f"start: interpret {interpreter * 1000:.2f} ms")
+    for name in targets or STARTUP_TARGETS:
+        code = STARTUP_TARGETS[name]
+        # První spuštění jen zahřeje souborovou cache a zapíše .pyc
+        import_time(code)
+        runs = [max(import_time(code) - interpreter, 0.0) for _ in range(repeat)]
+        entry = {'task': name, 'complexity': 'startup',
+                 'min': min(runs), 'median': statistics.median(runs), 'runs': runs}
+        results[f"startup/{name}"] = entry
+        log(f"  {name:<28} {entry['min'] * 1000:>10.2f} ms")
+    return results
+
+
+def compare_results(baseline, current, metric='min', min_value=MIN_COMPARABLE_TIME):
+    """
+    Porovná dva běhy podle zvolené metriky každé úlohy.
+    
+    Args:
+        baseline (dict): Výsledek run_suite() (referenční běh)
+        current (dict): Výsledek run_suite() (nový běh)
+        metric (str): Porovnávaná hodnota položky (výchozí nejkratší čas 'min')
+        min_value (float): Hodnoty menší než tato mez se neporovnávají (šum)
+    
+    Returns:
+        list: [(klíč, stará hodnota, nová hodnota, poměr)] pro všechny porovnatelné
+              úlohy seřazené od největšího zhoršení
+    """
+    rows = []
+    old_results = baseline['results']
+    for key, entry in current['results'].items():
+        old = old_results.get(key)
+        if old is None or old.get(metric) is None or entry.get(metric) is None:
+            continue
+        if max(old[metric], entry[metric]) < min_value:
+            continue
+        ratio = entry[metric] / old[metric] if old[metric] > 0 else float('inf')
+        rows.append((key, old[metric], entry[metric], ratio))
+    rows.sort(key=lambda row: -row[3])
+    return rows
+
+
+def print_comparison(rows, threshold=DEFAULT_THRESHOLD, unit='ms', scale=1000):
+    """
+    Vypíše porovnání a vrátí počet regresí.
+    
+    Args:
+        rows (list): Výsledek compare_results()
+        threshold (float): Relativní zhoršení považované za regresi
+        unit (str): Jednotka ve výpisu
+        scale (float): Převod hodnoty na jednotku výpisu
+    
+    Returns:
+        int: Počet úloh zhoršených o více než threshold
+    """
+    regressions = 0
+    print(f"\n{'Úloha':<50} {f'před [{unit}]':>10} {f'po [{unit}]':>10} {'poměr':>7}")
+    print("-" * 80)
+    for key, old, new, ratio in rows:
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "  REGRESE"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            mark = "  zlepšení"
+        print(f"{key:<50} {old * scale:>10.2f} {new * scale:>10.2f} {ratio:>7.2f}{mark}")
+    print(f"\nRegresí (zhoršení > {threshold * 100:.0f} %): {regressions}")
+    return regressions
+
+
+def _parse_list(value, cast=str):
+    """Převede 'a,b,c' na seznam."""
+    return [cast(item) for item in value.split(',') if item.strip()]
+
+
+def main():
+    """Spuštění sady z příkazové řádky."""
+    options = {
+        '--sizes': ','.join(str(n) for n in DEFAULT_SIZES),
+        '--generators': ','.join(GENERATORS),
+        '--tasks': ','.join(TASKS),
+        '--repeat': str(DEFAULT_REPEAT),
+        '--max-work': str(DEFAULT_MAX_WORK),
+        '--threshold': str(DEFAULT_THRESHOLD),
+        '--seed': '0',
+        '--output': None,
+        '--compare': None,
+        '--startup': '1',
+    }
+    
+    argv = sys.argv[1:]
+    if argv and argv[0] in ('-h', '--help'):
+        print(__doc__)
+        print("Volby: " + " ".join(f"{name} <hodnota>" for name in options))
+        print(f"Generátory: {', '.join(GENERATORS)}")
+        print(f"Úlohy: {', '.join(TASKS)}")
+        sys.exit(0)
+    
+    i = 0
+    while i < len(argv):
+        if argv[i] not in options or i + 1 >= len(argv):
+            print(f"Neplatný argument: {argv[i]} (nápověda: --help)")
+            sys.exit(1)
+        options[argv[i]] = argv[i + 1]
+        i += 2
+    
+    try:
+        generators = _parse_list(options['--generators'])
+        tasks = _parse_list(options['--tasks'])
+        for name in generators:
+            if name not in GENERATORS:
+                raise ValueError(f"Neznámý generátor: {name}")
+        for name in tasks:
+            if name not in TASKS:
+                raise ValueError(f"Neznámá úloha: {name}")
+        sizes = _parse_list(options['--sizes'], int)
+        repeat = int(options['--repeat'])
+        max_work = int(float(options['--max-work']))
+        threshold = float(options['--threshold'])
+        seed = int(options['--seed'])
+    except ValueError as e:
+        print(f"Chyba v parametrech: {e}")
+        sys.exit(1)
+    
+    results = run_suite(generators, sizes, repeat, max_work, tasks, seed)
+    if options['--startup'] != '0':
+        results['results'].update(measure_startup(repeat))
+    
+    if options['--output']:
+        with open(options['--output'], 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\nVýsledky uloženy do: {options['--output']}")
+    
+    if options['--compare']:
+        with open(options['--compare'], 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare_results(baseline, results)
+        if print_comparison(rows, threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
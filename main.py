@@ -5,29 +5,153 @@ Hlavní interaktivní program pro analýzu grafů.
 Program načte graf a pak v cyklu nabízí různé operace.
 """
 
+import shutil
+import signal
 import sys
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from pathlib import Path
 
 # Přidání src do sys.path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.parser import GraphParser
-from src.graph import Graph
-from src.matrices import MatrixBuilder
+from src.parser import GraphParser, Node
+from src.graph import load_graph
+from src.matrices import MatrixBuilder, NamedMatrix
+from src.floyd_warshall import extract_workers_option
+from src.cache import MatrixCache, DEFAULT_CACHE_BUDGET
 from src.analyzer import GraphAnalyzer
+from src.printer import MatrixPrinter, format_labels
+from src.progress import Progress, ComputationCancelled
+from src import profiling
+
+
+# Od tohoto počtu buněk nabízíme zápis matice do souboru
+LARGE_MATRIX_CELLS = 10000
+
+# Na kterých částech grafu závisí matice v cache (pro rozdílové načítání)
+MATRIX_DEPENDENCIES = {
+    'adjacency': {'structure'},
+    'incidence': {'structure'},
+    'distance': {'structure', 'weights'},
+    'predecessor': {'structure', 'weights'},
+    'power': {'structure'},
+}
+
+
+# Matice předpočítávané na pozadí po načtení grafu (v tomto pořadí)
+PRECOMPUTE_MATRICES = ('adjacency', 'distance', 'predecessor')
+
+# Jak často (v sekundách) se při čekání na vlákno kontroluje zrušení
+LOCK_POLL_INTERVAL = 0.1
+
+
+def _edge_key(edge):
+    """Klíč hrany bez ohodnocení - pro rozpoznání změny váhy při rozdílovém načtení."""
+    return (edge.node1, edge.node2, edge.directed, edge.reverse, edge.label)
+
+
+class BackgroundPrecompute:
+    """
+    Předvýpočet matic ve vlákně na pozadí.
+    
+    Zatímco uživatel vybírá v menu (hlavní vlákno čeká na input()), vlákno
+    postupně spočítá matice z PRECOMPUTE_MATRICES a uloží je do cache
+    aplikace. Používáme vlákno, ne proces - sdílí builder i cache bez
+    kopírování grafu a hlavní vlákno mezitím procesor nepotřebuje.
+    """
+    
+    def __init__(self, app):
+        """
+        Args:
+            app (GraphInteractive): Aplikace, jejíž matice se předpočítávají
+        """
+        self.app = app
+        self.cancelled = threading.Event()
+        self.progress = Progress()  # Průběh právě počítané matice
+        self.current = None   # Právě počítaná matice
+        self.done = []        # Dokončené matice
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name='precompute', daemon=True)
+    
+    def start(self):
+        """Spustí vlákno s předvýpočtem."""
+        self.thread.start()
+    
+    def cancel(self):
+        """Zruší předvýpočet (i rozpočítanou matici) a počká na ukončení vlákna."""
+        self.cancelled.set()
+        self.progress.cancel()
+        self.thread.join()
+    
+    def is_running(self):
+        """Kontroluje, zda předvýpočet stále běží."""
+        return self.thread.is_alive()
+    
+    def status(self):
+        """
+        Textový stav předvýpočtu pro menu.
+        
+        Returns:
+            str: Popis stavu
+        """
+        total = len(PRECOMPUTE_MATRICES)
+        if self.error is not None:
+            return f"chyba ({self.error})"
+        if self.cancelled.is_set():
+            return "zrušen"
+        if self.current is not None:
+            if self.progress.active:
+                return f"počítám {self.current}: {self.progress.describe()} ({len(self.done)}/{total})"
+            return f"počítám {self.current} ({len(self.done)}/{total})"
+        return f"hotovo ({len(self.done)}/{total})"
+    
+    def _run(self):
+        """Tělo vlákna - postupně spočítá matice a uloží je do cache."""
+        for matrix_type in PRECOMPUTE_MATRICES:
+            if self.cancelled.is_set():
+                break
+            self.current = matrix_type
+            try:
+                self.app._get_cached_matrix(matrix_type, progress=self.progress)
+            except ComputationCancelled:
+                break
+            except Exception as e:
+                self.error = e
+                break
+            self.done.append(matrix_type)
+        self.current = None
 
 
 class GraphInteractive:
     """Interaktivní rozhraní pro práci s grafem."""
     
-    def __init__(self):
+    def __init__(self, cache_budget=DEFAULT_CACHE_BUDGET, workers=1):
+        """
+        Args:
+            cache_budget (int): Paměťový rozpočet cache matic v bajtech
+            workers (int): Počet procesů pro Floyd-Warshall (matice délek a předchůdců)
+        """
+        self.workers = workers
         self.graph = None
         self.builder = None
         self.analyzer = None
         self.filepath = None
+        # Příkazy posledního načtení {řádek: [Node/Edge]} pro rozdílové načítání
+        self.statements = None
+        
+        # Cache pro matice - klíč (verze grafu, druh matice, parametry)
+        # (odloženou matici zahodí i builder, aby se paměť opravdu uvolnila)
+        self.matrix_cache = MatrixCache(cache_budget, on_evict=self._release_matrix)
+        
+        # Předvýpočet na pozadí; zámky chrání cache a builder mezi vlákny
+        self.precompute = None
+        self._cache_lock = threading.Lock()
+        self._builder_lock = threading.RLock()
         
-        # Cache pro matice
-        self.cached_matrices = {}
+        # Token průběhu právě prováděné akce z menu (Ctrl+C ji zruší)
+        self.progress = None
     
     def nacti_graf(self):
         """Načtení grafu ze souboru."""
@@ -45,26 +169,219 @@ class GraphInteractive:
                 print(f"CHYBA: Soubor '{filepath}' neexistuje!")
                 continue
             
+            # Před změnou grafu musí předvýpočet skončit
+            self._stop_precompute()
+            
             try:
-                parser = GraphParser()
-                nodes, edges, is_binary_tree = parser.parse_file(filepath)
-                self.graph = Graph(nodes, edges, is_binary_tree)
-                self.builder = MatrixBuilder(self.graph)
-                self.analyzer = GraphAnalyzer(self.graph)
-                self.filepath = filepath
-                self.cached_matrices = {}  # Vyčištění cache
+                if self._reload_diff(filepath):
+                    self._start_precompute()
+                    return True
+                
+                self._load_full(filepath)
                 
                 print(f"\nGraf úspěšně načten!")
                 print(f"Soubor: {filepath}")
                 print(f"Uzly: {len(self.graph.nodes)} - {sorted(self.graph.nodes.keys())}")
                 print(f"Hrany: {len(self.graph.edges_list)}")
                 
+                self._start_precompute()
                 return True
                 
             except Exception as e:
                 print(f"CHYBA při načítání grafu: {e}")
                 continue
     
+    def _start_precompute(self):
+        """Spustí předvýpočet matic na pozadí."""
+        self.precompute = BackgroundPrecompute(self)
+        self.precompute.start()
+    
+    def _stop_precompute(self):
+        """Zruší běžící předvýpočet (např. před načtením jiného grafu)."""
+        if self.precompute is not None and self.precompute.is_running():
+            self.precompute.cancel()
+    
+    def _load_full(self, filepath):
+        """Načte celý soubor a sestaví graf, builder i analyzátor znovu."""
+        parser = GraphParser()
+        self.graph = load_graph(filepath, parser)
+        self.builder = MatrixBuilder(self.graph, workers=self.workers)
+        self.analyzer = GraphAnalyzer(self.graph)
+        self.filepath = filepath
+        self.matrix_cache.clear()  # Vyčištění cache
+        
+        # Příkazy posledního načtení pro rozdílové načítání: {řádek: [Node/Edge]}.
+        # Binární strom, duplicitní uzly nebo zahozené hrany rozdílově nenačítáme.
+        node_statements = sum(1 for _, obj in parser.statements if isinstance(obj, Node))
+        if self.graph.is_binary_tree or len(self.graph.nodes) != node_statements \
+                or len(self.graph.edges_list) != len(parser.edges):
+            self.statements = None
+        else:
+            self.statements = {}
+            for line, obj in parser.statements:
+                self.statements.setdefault(line, []).append(obj)
+    
+    def _reload_diff(self, filepath):
+        """
+        Rozdílové načtení téhož souboru - aplikuje jen přidané/odebrané řádky.
+        
+        Matice v cache, které změna prokazatelně neovlivní, zůstanou zachovány.
+        
+        Returns:
+            bool: True pokud se graf podařilo aktualizovat rozdílově,
+                  False pokud je nutné načíst celý soubor
+        """
+        if self.graph is None or self.statements is None:
+            return False
+        if Path(filepath).resolve() != Path(self.filepath).resolve():
+            return False
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f.read().strip().split('\n')]
+        
+        # Pouze příkazy 'u' a 'h' - bez nich by šlo o binární strom
+        lines = [line for line in lines if line.startswith('u ') or line.startswith('h ')]
+        if not any(line.startswith('h ') for line in lines):
+            return False
+        
+        new_counts = Counter(lines)
+        old_counts = Counter({line: len(objs) for line, objs in self.statements.items()})
+        removed = old_counts - new_counts
+        added = new_counts - old_counts
+        
+        if not removed and not added:
+            print("\nSoubor se od posledního načtení nezměnil - ponechávám graf i matice.")
+            return True
+        
+        version = self.graph.version
+        try:
+            affected = self._apply_diff(removed, added)
+        except Exception:
+            # Změnu nelze aplikovat rozdílově (např. odebraný uzel má hrany) -
+            # graf i příkazy mohou být napůl změněné, načte se celý soubor znovu
+            return False
+        
+        # Matice, na které změna nemá vliv, převedeme na novou verzi grafu
+        new_version = self.graph.version
+        
+        def carry_over(key):
+            old_version, kind, params = key
+            if old_version != version:
+                return None
+            if MATRIX_DEPENDENCIES.get(kind, {'structure', 'weights'}) & affected:
+                return None
+            return (new_version, kind, params)
+        
+        self.matrix_cache.rekey(carry_over)
+        
+        print(f"\nGraf aktualizován rozdílově (-{sum(removed.values())}/+{sum(added.values())} řádků)")
+        print(f"Soubor: {filepath}")
+        print(f"Uzly: {len(self.graph.nodes)}, hrany: {len(self.graph.edges_list)}")
+        kept = sorted({kind for _, kind, _ in self.matrix_cache.keys()})
+        if kept:
+            print(f"Zachované matice: {', '.join(kept)}")
+        return True
+    
+    def _apply_diff(self, removed, added):
+        """
+        Aplikuje odebrané a přidané příkazy na graf v paměti.
+        
+        Změna ohodnocení uzlu nebo hrany (stejný uzel / stejné koncové uzly,
+        směr a označení) se provede na místě, ostatní řádky odeberou nebo
+        přidají uzel či hranu.
+        
+        Args:
+            removed (Counter): Odebrané řádky s počtem výskytů
+            added (Counter): Přidané řádky s počtem výskytů
+            
+        Returns:
+            set: Ovlivněné části grafu - 'structure' a/nebo 'weights'
+            
+        Raises:
+            KeyError, ValueError: Pokud změnu nelze aplikovat rozdílově
+        """
+        parser = GraphParser()
+        affected = set()
+        
+        # Přidané řádky se parsují jako první - dokud se nezmění příkazy ani graf.
+        # Chybný řádek se přeskočí s varováním jako při načtení celého souboru.
+        parsed = []
+        for line, count in added.items():
+            try:
+                obj = parser.parse_statement(line)
+            except Exception as e:
+                print(f"Chyba při parsování řádku: {line}")
+                print(f"  {e}")
+                continue
+            # Každý výskyt řádku je samostatný objekt
+            parsed.append((line, obj))
+            parsed.extend((line, parser.parse_statement(line)) for _ in range(count - 1))
+        
+        added_nodes = {}
+        added_edges = defaultdict(list)
+        for line, obj in parsed:
+            if isinstance(obj, Node):
+                if obj.identifier in added_nodes:
+                    raise ValueError(f"Duplicitní uzel '{obj.identifier}'")
+                added_nodes[obj.identifier] = (line, obj)
+            else:
+                added_edges[_edge_key(obj)].append((line, obj))
+        
+        removed_nodes = {}
+        removed_edges = defaultdict(list)
+        for line, count in removed.items():
+            objs = self.statements[line]
+            for _ in range(count):
+                obj = objs.pop()
+                if isinstance(obj, Node):
+                    removed_nodes[obj.identifier] = obj
+                else:
+                    removed_edges[_edge_key(obj)].append(obj)
+            if not objs:
+                del self.statements[line]
+        
+        # Změna ohodnocení uzlu - uzel i jeho hrany zůstávají
+        for identifier in removed_nodes.keys() & added_nodes.keys():
+            node = removed_nodes.pop(identifier)
+            line, new_node = added_nodes.pop(identifier)
+            node.weight = new_node.weight
+            self.statements.setdefault(line, []).append(node)
+        
+        # Změna ohodnocení hrany - stejné koncové uzly, směr a označení
+        for key, edges in removed_edges.items():
+            candidates = added_edges.get(key)
+            while edges and candidates:
+                edge = edges.pop()
+                line, new_edge = candidates.pop()
+                if new_edge.weight != edge.weight:
+                    self.graph.set_edge_weight(edge, new_edge.weight)
+                    affected.add('weights')
+                self.statements.setdefault(line, []).append(edge)
+        
+        # Odebrání: nejprve hrany, potom uzly (bez zbývajících hran)
+        for edges in removed_edges.values():
+            for edge in edges:
+                self.graph.remove_edge(edge)
+                affected.add('structure')
+        for identifier in removed_nodes:
+            if self.graph.get_incident_edges(identifier):
+                raise ValueError(f"Odebraný uzel '{identifier}' má stále hrany")
+            self.graph.remove_node(identifier)
+            affected.add('structure')
+        
+        # Přidání: nejprve uzly, potom hrany
+        for line, node in added_nodes.values():
+            self.graph.add_node(node)
+            self.statements.setdefault(line, []).append(node)
+            affected.add('structure')
+        for edges in added_edges.values():
+            for line, edge in edges:
+                self.graph.add_edge(edge)
+                self.statements.setdefault(line, []).append(edge)
+                affected.add('structure')
+        
+        return affected
+    
     def zobraz_menu(self):
         """Zobrazí hlavní menu."""
         print("\n" + "=" * 70)
@@ -83,6 +400,8 @@ class GraphInteractive:
         print("\nOSTATNÍ:")
         print("  9) Načíst jiný graf")
         print("  0) Ukončit program")
+        if self.precompute is not None:
+            print(f"\nPředvýpočet matic na pozadí: {self.precompute.status()}")
         print("=" * 70)
     
     def vlastnosti_grafu(self):
@@ -96,7 +415,7 @@ class GraphInteractive:
         print("VLASTNOSTI GRAFU")
         print("=" * 70)
         
-        props = self.analyzer.analyze_all()
+        props = self.analyzer.analyze_all(self.progress)
         
         print(f"\nGraf: {self.filepath}")
         print(f"Uzlů: {len(self.graph.nodes)}")
@@ -160,6 +479,8 @@ class GraphInteractive:
                     if is_bipartite and 'partition' in value and value['partition']:
                         part = value['partition']
                         print(f"    Partice: {part[0]} | {part[1]}")
+                    elif value.get('odd_cycle'):
+                        print(f"    Lichý cyklus: {' - '.join(value['odd_cycle'])}")
             else:
                 # Jednoduché boolean vlastnosti
                 color = GREEN if value else RED
@@ -218,7 +539,7 @@ class GraphInteractive:
             if predecessors:
                 for pred in sorted(predecessors):
                     if self.graph.is_weighted():
-                        distance = dist_matrix[pred][node]
+                        distance = dist_matrix[pred, node]
                         if distance == float('inf'):
                             print(f"  - {pred} (vzdálenost: ∞)")
                         else:
@@ -239,7 +560,7 @@ class GraphInteractive:
             if successors:
                 for succ in sorted(successors):
                     if self.graph.is_weighted():
-                        distance = dist_matrix[node][succ]
+                        distance = dist_matrix[node, succ]
                         if distance == float('inf'):
                             print(f"  - {succ} (vzdálenost: ∞)")
                         else:
@@ -261,8 +582,8 @@ class GraphInteractive:
                 for neighbor in sorted(all_neighbors):
                     if self.graph.is_weighted():
                         # Zjistíme vzdálenost (může být z obou směrů)
-                        dist1 = dist_matrix[node][neighbor]
-                        dist2 = dist_matrix[neighbor][node]
+                        dist1 = dist_matrix[node, neighbor]
+                        dist2 = dist_matrix[neighbor, node]
                         distance = min(dist1, dist2)
                         if distance == float('inf'):
                             print(f"  - {neighbor} (vzdálenost: ∞)")
@@ -306,11 +627,7 @@ class GraphInteractive:
         edge_input = input("\nZadejte označení hrany (např. h1): ").strip()
         
         # Najdeme hranu podle labelu
-        found_edge = None
-        for edge in self.graph.edges_list:
-            if edge.label == edge_input:
-                found_edge = edge
-                break
+        found_edge = self.graph.get_edge_by_label(edge_input)
         
         if not found_edge:
             print(f"CHYBA: Hrana '{edge_input}' nenalezena!")
@@ -333,52 +650,143 @@ class GraphInteractive:
         if found_edge.node1 == found_edge.node2:
             print("POZOR: Jedná se o smyčku!")
     
-    def _get_cached_matrix(self, matrix_type):
-        """Získá matici z cache nebo ji vytvoří."""
-        if matrix_type not in self.cached_matrices:
-            if matrix_type == 'adjacency':
-                self.cached_matrices[matrix_type] = self.builder.adjacency_matrix()
-            elif matrix_type == 'incidence':
-                self.cached_matrices[matrix_type] = self.builder.incidence_matrix()
-            elif matrix_type == 'distance':
-                self.cached_matrices[matrix_type] = self.builder.distance_matrix()
-            elif matrix_type == 'predecessor':
-                self.cached_matrices[matrix_type] = self.builder.predecessor_matrix()
-        
-        return self.cached_matrices[matrix_type]
+    def _get_cached_matrix(self, matrix_type, progress=None, **params):
+        """
+        Získá matici z cache nebo ji vytvoří.
+        
+        Pokud matici právě počítá vlákno na pozadí, počká na její dokončení.
+        
+        Args:
+            matrix_type (str): 'adjacency', 'incidence', 'distance', 'predecessor' nebo 'power'
+            progress (Progress): Token průběhu (výchozí token aktuální akce z menu)
+            **params: Parametry matice (např. power=8 pro mocninu)
+        
+        Raises:
+            ComputationCancelled: Pokud byl výpočet nebo čekání zrušeno
+        """
+        if progress is None:
+            progress = self.progress
+        
+        version = self.graph.version
+        key = (version, matrix_type, tuple(sorted(params.items())))
+        
+        with self._cache_lock:
+            # Matice starších verzí grafu už nebudou potřeba
+            self.matrix_cache.retain(lambda key: key[0] == version)
+            matrix = self.matrix_cache.get(key)
+        if matrix is not None:
+            return matrix
+        
+        if not self._builder_lock.acquire(blocking=False):
+            precompute = self.precompute
+            if precompute is not None and precompute.is_running() \
+                    and threading.current_thread() is not precompute.thread:
+                print(f"Čekám na výpočet na pozadí ({precompute.status()})...")
+            if progress is None:
+                self._builder_lock.acquire()
+            else:
+                # Čekáme po krátkých úsecích, aby šlo čekání zrušit
+                progress.begin('čekání na předvýpočet')
+                while not self._builder_lock.acquire(timeout=LOCK_POLL_INTERVAL):
+                    progress.check()
+                progress.finish()
+        try:
+            # Mezitím ji mohlo spočítat vlákno na pozadí
+            with self._cache_lock:
+                matrix = self.matrix_cache.get(key)
+            if matrix is None:
+                matrix = self._build_matrix(matrix_type, progress, **params)
+                with self._cache_lock:
+                    self.matrix_cache.put(key, matrix)
+        finally:
+            self._builder_lock.release()
+        return matrix
+    
+    def _release_matrix(self, key):
+        """Builder zahodí svou kopii matice, kterou cache odložila na disk."""
+        version, matrix_type, _ = key
+        # Volá se z put() v _get_cached_matrix - zámek builderu už držíme
+        if self.builder is not None and version == self.graph.version:
+            self.builder.release(matrix_type)
+    
+    def _build_matrix(self, matrix_type, progress=None, power=None):
+        """Sestaví matici daného druhu pomocí builderu."""
+        if matrix_type == 'adjacency':
+            return self.builder.adjacency_matrix()
+        elif matrix_type == 'incidence':
+            return self.builder.incidence_matrix()
+        elif matrix_type == 'distance':
+            return self.builder.distance_matrix(progress)
+        elif matrix_type == 'predecessor':
+            return self.builder.predecessor_matrix(progress)
+        elif matrix_type == 'power':
+            adj_matrix = self._get_cached_matrix('adjacency', progress)
+            # Řádky kopírujeme - matice v cache může být odložená na disku
+            data = [list(row) for row in adj_matrix.raw()]
+            power_matrix_data = self.builder.matrix_power(data, power, progress)
+            return NamedMatrix(power_matrix_data, adj_matrix.row_labels(), adj_matrix.col_labels())
+        raise ValueError(f"Neznámý druh matice: {matrix_type}")
+    
+    @contextmanager
+    def _interruptible(self):
+        """
+        Provede akci z menu s tokenem průběhu v self.progress.
+        
+        Ctrl+C během výpočtu výpočet kooperativně zruší (výpočet skončí
+        ComputationCancelled v bezpečném bodě a graf i cache zůstanou
+        platné). Mimo výpočet se Ctrl+C chová jako dosud.
+        """
+        progress = Progress(callback=self._show_progress)
+        
+        def on_interrupt(signum, frame):
+            if progress.active:
+                progress.cancel()
+            else:
+                raise KeyboardInterrupt
+        
+        previous = signal.signal(signal.SIGINT, on_interrupt)
+        self.progress = progress
+        try:
+            yield progress
+        finally:
+            self.progress = None
+            signal.signal(signal.SIGINT, previous)
+    
+    @staticmethod
+    def _show_progress(progress):
+        """Vypíše průběh výpočtu s odhadem zbývajícího času na jeden řádek."""
+        print(f"\r  Průběh: {progress.describe()}   (Ctrl+C = zrušit)   ", end='', flush=True)
+        if not progress.active:
+            print()
     
     def zobraz_matici(self, matrix, title):
-        """Zobrazí matici v čitelném formátu."""
+        """
+        Zobrazí matici v čitelném formátu.
+        
+        Matice se vypisuje proudově po blocích sloupců podle šířky terminálu.
+        Velké matice lze místo terminálu zapsat rovnou do souboru.
+        """
         print(f"\n{title}")
         print("=" * 70)
         
         row_labels = matrix.row_labels()
         col_labels = matrix.col_labels()
-        raw_data = matrix.raw()
         
-        print(f"Rozměry: {len(raw_data)} řádků × {len(raw_data[0]) if raw_data else 0} sloupců")
-        print(f"Řádky: {row_labels}")
-        print(f"Sloupce: {col_labels}")
+        print(f"Rozměry: {len(row_labels)} řádků × {len(col_labels)} sloupců")
+        print(f"Řádky: {format_labels(row_labels)}")
+        print(f"Sloupce: {format_labels(col_labels)}")
         print()
         
-        # Hlavička
-        header = "    " + " ".join(f"{label:>4}" for label in col_labels)
-        print(header)
-        
-        # Řádky
-        for i, row in enumerate(raw_data):
-            label = f"{row_labels[i]:>3}:"
-            formatted_row = []
-            for val in row:
-                if val == float('inf'):
-                    formatted_row.append("  ∞ ")
-                elif isinstance(val, float):
-                    formatted_row.append(f"{val:>4.1f}")
-                elif val is None:
-                    formatted_row.append("  - ")
-                else:
-                    formatted_row.append(f"{val:>4}")
-            print(label + " ".join(formatted_row))
+        printer = MatrixPrinter(matrix, width=shutil.get_terminal_size().columns)
+        
+        if len(row_labels) * len(col_labels) > LARGE_MATRIX_CELLS:
+            path = input("Matice je velká. Zadejte soubor pro zápis (Enter = vypsat sem): ").strip()
+            if path:
+                printer.write_to_file(path)
+                print(f"Matice zapsána do souboru: {path}")
+                return
+        
+        printer.write(sys.stdout)
     
     def dotaz_na_hodnotu_matice(self, matrix, matrix_name):
         """Interaktivní dotazování na hodnoty v matici."""
@@ -407,7 +815,7 @@ class GraphInteractive:
                 continue
             
             # Získání hodnoty pomocí názvů
-            value = matrix[row_input][col_input]
+            value = matrix[row_input, col_input]
             
             # Formátování hodnoty
             if value == float('inf'):
@@ -446,13 +854,8 @@ class GraphInteractive:
                 # A^1 = A
                 matrix = self._get_cached_matrix('adjacency')
             else:
-                # Vypočítáme mocninu
-                adj_matrix = self._get_cached_matrix('adjacency')
-                power_matrix_data = self.builder.matrix_power(adj_matrix.raw(), n)
-                
-                # Vytvoříme NamedMatrix
-                from src.matrices import NamedMatrix
-                matrix = NamedMatrix(power_matrix_data, adj_matrix.row_labels(), adj_matrix.col_labels())
+                # Mocninu ukládáme do cache podle exponentu
+                matrix = self._get_cached_matrix('power', power=n)
             
             self.zobraz_matici(matrix, f"MATICE SOUSEDNOSTI^{n}")
             print(f"\nInterpretace: A^{n}[i][j] = počet cest délky {n} z uzlu i do uzlu j")
@@ -522,27 +925,29 @@ class GraphInteractive:
             
             volba = input("\nVaše volba: ").strip()
             
-            if volba == '1':
-                self.vlastnosti_grafu()
-            elif volba == '2':
-                self.vlastnosti_uzlu()
-            elif volba == '3':
-                self.vlastnosti_hrany()
-            elif volba == '4':
-                self.matice_sousednosti()
-            elif volba == '5':
-                self.mocnina_matice()
-            elif volba == '6':
-                self.matice_incidence()
-            elif volba == '7':
-                self.matice_delek()
-            elif volba == '8':
-                self.matice_predchudcu()
+            actions = {
+                '1': self.vlastnosti_grafu,
+                '2': self.vlastnosti_uzlu,
+                '3': self.vlastnosti_hrany,
+                '4': self.matice_sousednosti,
+                '5': self.mocnina_matice,
+                '6': self.matice_incidence,
+                '7': self.matice_delek,
+                '8': self.matice_predchudcu,
+            }
+            
+            if volba in actions:
+                try:
+                    with self._interruptible():
+                        actions[volba]()
+                except ComputationCancelled:
+                    print("\n\nVýpočet zrušen - načtený graf zůstává beze změny.")
             elif volba == '9':
                 if not self.nacti_graf():
                     print("\nUkončuji program.")
                     break
             elif volba == '0':
+                self._stop_precompute()
                 print("\nUkončuji program. Nashledanou!")
                 break
             else:
@@ -553,8 +958,14 @@ class GraphInteractive:
 
 def main():
     """Spuštění programu."""
+    argv, profile = profiling.extract_profile_flag(sys.argv[1:])
+    try:
+        _, workers = extract_workers_option(argv)
+    except ValueError as e:
+        print(f"Chyba v parametrech: {e}")
+        sys.exit(1)
     try:
-        app = GraphInteractive()
+        app = GraphInteractive(workers=workers)
         app.run()
     except KeyboardInterrupt:
         print("\n\nProgram přerušen uživatelem.")
@@ -564,6 +975,9 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if profile:
+            profiling.print_report()
 
 
 if __name__ == "__main__":
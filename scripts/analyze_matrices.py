@@ -17,56 +17,27 @@ from pathlib import Path
 # Přidání rodičovského adresáře do sys.path pro import src modulů
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.parser import GraphParser
-from src.graph import Graph
+from src.graph import load_graph
 from src.matrices import MatrixBuilder
+from src.floyd_warshall import extract_workers_option
+from src.printer import print_matrix_stream, parse_window, DEFAULT_WIDTH, FILE_BUFFER_SIZE
+from src import profiling
 
 
-def print_matrix(matrix, row_labels=None, col_labels=None, title="Matice", show_dimensions=True):
-    """Vypíše matici v čitelném formátu."""
-    # Pokud je matrix NamedMatrix, získáme surová data
-    from src.matrices import NamedMatrix
-    if isinstance(matrix, NamedMatrix):
-        if row_labels is None:
-            row_labels = matrix.row_labels()
-        if col_labels is None:
-            col_labels = matrix.col_labels()
-        matrix = matrix.raw()
-    
-    rows = len(matrix)
-    cols = len(matrix[0]) if matrix else 0
-    
-    print(f"\n{title}:")
-    if show_dimensions:
-        print(f"Rozměry: {rows} řádků × {cols} sloupců")
-    print("-" * 60)
+def print_matrix(matrix, row_labels=None, col_labels=None, title="Matice", show_dimensions=True,
+                 out=None, **options):
+    """
+    Vypíše matici v čitelném formátu.
     
-    # Hlavička se sloupci
-    if col_labels:
-        header = "    " + " ".join(f"{label:>4}" for label in col_labels)
-        print(header)
+    Výpis probíhá proudově po blocích sloupců (viz src.printer), takže ani
+    široké matice incidence nevytvoří jeden obří řádek.
     
-    # Řádky matice
-    for i, row in enumerate(matrix):
-        if row_labels:
-            label = f"{row_labels[i]:>3}:"
-        else:
-            label = f"{i:>3}:"
-        
-        # Formátování čísel
-        formatted_row = []
-        for val in row:
-            if val == float('inf'):
-                formatted_row.append("  ∞ ")
-            elif isinstance(val, float):
-                formatted_row.append(f"{val:>4.1f}")
-            elif val is None:
-                formatted_row.append("  - ")
-            else:
-                formatted_row.append(f"{val:>4}")
-        
-        print(label + " ".join(formatted_row))
-    print()
+    Args:
+        out: Výstupní souborový objekt (výchozí sys.stdout)
+        **options: width, rows, cols - šířka výstupu a okno řádků/sloupců
+    """
+    print_matrix_stream(matrix, title, out=out, show_dimensions=show_dimensions,
+                        row_labels=row_labels, col_labels=col_labels, **options)
 
 
 def get_matrix_element(matrix, row, col, row_labels=None, col_labels=None):
@@ -93,7 +64,7 @@ def get_matrix_element(matrix, row, col, row_labels=None, col_labels=None):
             col_labels = matrix.col_labels()
         
         try:
-            value = matrix[row][col]
+            value = matrix.get(row, col)
             
             # Zjistíme indexy pro zobrazení
             if isinstance(row, str):
@@ -160,30 +131,29 @@ def print_matrix_element(matrix, row, col, row_labels=None, col_labels=None, mat
     print(f"   (index: [{result['row_index']}][{result['col_index']}])")
 
 
-def analyze_matrices(filepath, matrix_index=None):
+def analyze_matrices(filepath, matrix_index=None, print_options=None, workers=1):
     """
     Načte graf a vytvoří jeho matice a seznamy.
     
     Args:
         filepath (str): Cesta k souboru s grafem
         matrix_index (tuple): (řádek, sloupec) pro zobrazení konkrétního prvku, None = zobrazit celé matice
+        print_options (dict): Parametry výpisu matic (out, width, rows, cols)
+        workers (int): Počet procesů pro Floyd-Warshall
     """
+    print_options = print_options or {}
     print(f"\nNačítám graf ze souboru: {filepath}")
     print("=" * 60)
     
-    # 1. Parsování
-    parser = GraphParser()
-    nodes, edges, is_binary_tree = parser.parse_file(filepath)
+    # 1. Načtení (binární strom přímo do BinaryTree, obecný graf přes parser)
+    graph = load_graph(filepath)
     
-    print(f"Načteno: {len(nodes)} uzlů, {len(edges)} hran")
-    if is_binary_tree:
+    print(f"Načteno: {len(graph.raw_nodes)} uzlů, {len(graph.raw_edges)} hran")
+    if graph.is_binary_tree:
         print("Typ: Binární strom")
     else:
         print("Typ: Obecný graf")
     
-    # 2. Vytvoření grafu
-    graph = Graph(nodes, edges, is_binary_tree)
-    
     # 3. Matice
     print("\n" + "=" * 60)
     if matrix_index:
@@ -193,7 +163,7 @@ def analyze_matrices(filepath, matrix_index=None):
         print("MATICE A SEZNAMY")
     print("=" * 60)
     
-    builder = MatrixBuilder(graph)
+    builder = MatrixBuilder(graph, workers=workers)
     nodes_list = sorted(graph.nodes.keys())
     
     # Matice sousednosti
@@ -202,7 +172,7 @@ def analyze_matrices(filepath, matrix_index=None):
         row, col = matrix_index
         print_matrix_element(adj_matrix, row, col, None, None, "a) Matice sousednosti")
     else:
-        print_matrix(adj_matrix, None, None, "a) Matice sousednosti")
+        print_matrix(adj_matrix, None, None, "a) Matice sousednosti", **print_options)
     
     # Znaménková matice
     sign_matrix = builder.signed_matrix()
@@ -210,7 +180,7 @@ def analyze_matrices(filepath, matrix_index=None):
         row, col = matrix_index
         print_matrix_element(sign_matrix, row, col, None, None, "b) Znaménková matice")
     else:
-        print_matrix(sign_matrix, None, None, "b) Znaménková matice")
+        print_matrix(sign_matrix, None, None, "b) Znaménková matice", **print_options)
     
     # Mocniny matice sousednosti
     if len(nodes_list) <= 10:  # Pouze pro menší grafy
@@ -220,7 +190,7 @@ def analyze_matrices(filepath, matrix_index=None):
                 row, col = matrix_index
                 print_matrix_element(matrix, row, col, None, None, f"c) Matice sousednosti^{power}")
             else:
-                print_matrix(matrix, None, None, f"c) Matice sousednosti^{power}")
+                print_matrix(matrix, None, None, f"c) Matice sousednosti^{power}", **print_options)
     else:
         if not matrix_index:
             print(f"\nc) Matice sousednosti^n: Vynecháno (graf má {len(nodes_list)} uzlů > 10)")
@@ -231,7 +201,7 @@ def analyze_matrices(filepath, matrix_index=None):
         row, col = matrix_index
         print_matrix_element(inc_matrix, row, col, None, None, "d) Matice incidence")
     else:
-        print_matrix(inc_matrix, None, None, "d) Matice incidence")
+        print_matrix(inc_matrix, None, None, "d) Matice incidence", **print_options)
     
     # Matice délek
     dist_matrix = builder.distance_matrix()
@@ -239,7 +209,7 @@ def analyze_matrices(filepath, matrix_index=None):
         row, col = matrix_index
         print_matrix_element(dist_matrix, row, col, None, None, "e) Matice délek (Floyd-Warshall)")
     else:
-        print_matrix(dist_matrix, None, None, "e) Matice délek (Floyd-Warshall)")
+        print_matrix(dist_matrix, None, None, "e) Matice délek (Floyd-Warshall)", **print_options)
     
     if not matrix_index:
         # Seznam sousedů
@@ -258,10 +228,16 @@ def analyze_matrices(filepath, matrix_index=None):
     return graph
 
 
-def interactive_matrix_selection(filepath):
+def interactive_matrix_selection(filepath, print_options=None, workers=1):
     """
     Interaktivní režim pro výběr matice a indexu.
+    
+    Args:
+        filepath (str): Cesta k souboru s grafem
+        print_options (dict): Parametry výpisu matic (out, width, rows, cols)
+        workers (int): Počet procesů pro Floyd-Warshall
     """
+    print_options = print_options or {}
     print("\n" + "=" * 60)
     print("INTERAKTIVNÍ VÝBĚR MATICE")
     print("=" * 60)
@@ -285,12 +261,10 @@ def interactive_matrix_selection(filepath):
     
     # Načtení grafu
     print(f"\nNačítám graf ze souboru: {filepath}")
-    parser = GraphParser()
-    nodes, edges, is_binary_tree = parser.parse_file(filepath)
-    graph = Graph(nodes, edges, is_binary_tree)
-    builder = MatrixBuilder(graph)
+    graph = load_graph(filepath)
+    builder = MatrixBuilder(graph, workers=workers)
     
-    print(f"Načteno: {len(nodes)} uzlů, {len(edges)} hran")
+    print(f"Načteno: {len(graph.raw_nodes)} uzlů, {len(graph.raw_edges)} hran")
     
     # Ptáme se, jestli chce konkrétní index
     print("\n" + "-" * 60)
@@ -320,7 +294,7 @@ def interactive_matrix_selection(filepath):
             row, col = matrix_index
             print_matrix_element(adj_matrix, row, col, None, None, "a) Matice sousednosti")
         else:
-            print_matrix(adj_matrix, None, None, "a) Matice sousednosti")
+            print_matrix(adj_matrix, None, None, "a) Matice sousednosti", **print_options)
     
     if choice == 'b' or choice == '*':
         sign_matrix = builder.signed_matrix()
@@ -328,7 +302,7 @@ def interactive_matrix_selection(filepath):
             row, col = matrix_index
             print_matrix_element(sign_matrix, row, col, None, None, "b) Znaménková matice")
         else:
-            print_matrix(sign_matrix, None, None, "b) Znaménková matice")
+            print_matrix(sign_matrix, None, None, "b) Znaménková matice", **print_options)
     
     if choice == 'c' or choice == '*':
         if len(nodes_list) <= 10:
@@ -338,7 +312,7 @@ def interactive_matrix_selection(filepath):
                     row, col = matrix_index
                     print_matrix_element(matrix, row, col, None, None, f"c) Matice sousednosti^{power}")
                 else:
-                    print_matrix(matrix, None, None, f"c) Matice sousednosti^{power}")
+                    print_matrix(matrix, None, None, f"c) Matice sousednosti^{power}", **print_options)
         else:
             print(f"\nc) Matice sousednosti^n: Vynecháno (graf má {len(nodes_list)} uzlů > 10)")
     
@@ -348,7 +322,7 @@ def interactive_matrix_selection(filepath):
             row, col = matrix_index
             print_matrix_element(inc_matrix, row, col, None, None, "d) Matice incidence")
         else:
-            print_matrix(inc_matrix, None, None, "d) Matice incidence")
+            print_matrix(inc_matrix, None, None, "d) Matice incidence", **print_options)
     
     if choice == 'e' or choice == '*':
         dist_matrix = builder.distance_matrix()
@@ -356,7 +330,7 @@ def interactive_matrix_selection(filepath):
             row, col = matrix_index
             print_matrix_element(dist_matrix, row, col, None, None, "e) Matice délek (Floyd-Warshall)")
         else:
-            print_matrix(dist_matrix, None, None, "e) Matice délek (Floyd-Warshall)")
+            print_matrix(dist_matrix, None, None, "e) Matice délek (Floyd-Warshall)", **print_options)
     
     if choice == 'h' or choice == '*':
         if not matrix_index:
@@ -370,9 +344,59 @@ def interactive_matrix_selection(filepath):
     print("=" * 60)
 
 
+def extract_print_options(argv):
+    """
+    Vyjme z argumentů volby výpisu matic.
+    
+    Podporované volby:
+        --rows <od:do>    Okno řádků
+        --cols <od:do>    Okno sloupců
+        --width <n>       Šířka výstupu (sloupce se dělí do bloků)
+        --output <soubor> Zápis matic přímo do souboru
+    
+    Args:
+        argv (list): Argumenty příkazové řádky (bez názvu skriptu)
+        
+    Returns:
+        tuple: (zbylé argumenty, slovník voleb, cesta k výstupu nebo None)
+    """
+    rest = []
+    options = {'width': DEFAULT_WIDTH}
+    output = None
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('--rows', '--cols', '--width', '--output'):
+            if i + 1 >= len(argv):
+                raise ValueError(f"Volba {arg} vyžaduje hodnotu")
+            value = argv[i + 1]
+            if arg == '--rows':
+                options['rows'] = parse_window(value)
+            elif arg == '--cols':
+                options['cols'] = parse_window(value)
+            elif arg == '--width':
+                options['width'] = int(value)
+            else:
+                output = value
+            i += 2
+        else:
+            rest.append(arg)
+            i += 1
+    return rest, options, output
+
+
 def main():
     """Hlavní funkce programu."""
-    if len(sys.argv) < 2:
+    args, profile = profiling.extract_profile_flag(sys.argv[1:])
+    try:
+        args, print_options, output = extract_print_options(args)
+        args, workers = extract_workers_option(args)
+    except ValueError as e:
+        print(f"❌ Chyba v parametrech: {e}")
+        sys.exit(1)
+    argv = [sys.argv[0]] + args
+    
+    if len(argv) < 2:
         print("Použití: python analyze_matrices.py <soubor_s_grafem> [režim]")
         print("")
         print("Režimy:")
@@ -380,43 +404,69 @@ def main():
         print("  --all            - Zobrazit všechny matice")
         print("  --all <r> <c>    - Zobrazit prvky všech matic na indexu [r][c]")
         print("")
+        print("Volby výpisu:")
+        print("  --rows <od:do>   - Zobrazit jen okno řádků")
+        print("  --cols <od:do>   - Zobrazit jen okno sloupců")
+        print(f"  --width <n>      - Šířka výstupu (výchozí {DEFAULT_WIDTH})")
+        print("  --output <soubor> - Zapsat matice do souboru")
+        print("")
+        print("Výpočet:")
+        print("  --workers <n>    - Matice délek ve více procesech (velké grafy, od "
+              f"{MatrixBuilder.PARALLEL_MIN_NODES} uzlů)")
+        print("  --profile        - Na konci vypsat časy a počty volání jednotlivých fází")
+        print("  --profile-memory - Jako --profile, navíc špička paměti (pomalejší běh)")
+        print("")
         print("Příklad:")
         print("  python analyze_matrices.py graph.tg")
         print("  python analyze_matrices.py graph.tg --all")
         print("  python analyze_matrices.py graph.tg --all 0 1")
+        print("  python analyze_matrices.py graph.tg --all --cols 0:40 --output matice.txt")
         print("")
         print("Indexování od 0!")
         sys.exit(1)
     
-    filepath = sys.argv[1]
+    filepath = argv[1]
     
     # Kontrola existence souboru
     if not Path(filepath).exists():
         print(f"❌ Soubor nenalezen: {filepath}")
         sys.exit(1)
     
+    out_file = None
     try:
+        if output:
+            try:
+                out_file = open(output, 'w', encoding='utf-8', buffering=FILE_BUFFER_SIZE)
+            except OSError as e:
+                # Vlastní hlášení - FileNotFoundError níže se týká vstupního souboru
+                print(f"❌ Nelze otevřít výstupní soubor {output}: {e}")
+                sys.exit(1)
+            print_options['out'] = out_file
+        
         # Režim --all (původní funkcionalita)
-        if len(sys.argv) >= 3 and sys.argv[2] == '--all':
+        if len(argv) >= 3 and argv[2] == '--all':
             matrix_index = None
             
             # Kontrola indexů
-            if len(sys.argv) >= 5:
+            if len(argv) >= 5:
                 try:
-                    row = int(sys.argv[3])
-                    col = int(sys.argv[4])
+                    row = int(argv[3])
+                    col = int(argv[4])
                     matrix_index = (row, col)
                     print(f"\n🔍 Režim přístupu k prvkům - Index [{row}][{col}]")
                 except ValueError:
                     print(f"❌ Chyba: Řádek a sloupec musí být celá čísla!")
-                    print(f"   Zadáno: řádek='{sys.argv[3]}', sloupec='{sys.argv[4]}'")
+                    print(f"   Zadáno: řádek='{argv[3]}', sloupec='{argv[4]}'")
                     sys.exit(1)
             
-            analyze_matrices(filepath, matrix_index)
+            analyze_matrices(filepath, matrix_index, print_options, workers)
         
         # Interaktivní režim (default)
         else:
-            interactive_matrix_selection(filepath)
+            interactive_matrix_selection(filepath, print_options, workers)
+        
+        if out_file:
+            print(f"\nMatice zapsány do souboru: {output}")
             
     except FileNotFoundError:
         print(f"❌ Soubor nenalezen: {filepath}")
@@ -429,6 +479,11 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if out_file:
+            out_file.close()
+        if profile:
+            profiling.print_report()
 
 
 if __name__ == "__main__":
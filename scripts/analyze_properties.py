@@ -14,10 +14,35 @@ from pathlib import Path
 # Přidání rodičovského adresáře do sys.path pro import src modulů
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.parser import GraphParser
-from src.graph import Graph
+from src.graph import load_graph
 from src.analyzer import GraphAnalyzer
-from src.visualizer import visualize_graph, TextVisualizer
+from src.views import extract_view_options
+from src import profiling
+
+
+def print_tree_metrics(tree):
+    """Vypíše metriky binárního stromu."""
+    metrics = tree.metrics()
+    
+    print("\n" + "=" * 60)
+    print("BINÁRNÍ STROM")
+    print("=" * 60)
+    print(f"\nUzlů: {metrics['nodes']} (pozic v haldě: {metrics['slots']})")
+    print(f"Výška: {metrics['height']}")
+    print(f"Listů: {metrics['leaves']}")
+    print(f"Úplný (complete): {'ANO' if metrics['complete'] else 'NE'}")
+    print(f"Dokonalý (perfect): {'ANO' if metrics['perfect'] else 'NE'}")
+    print(f"Plný (0 nebo 2 potomci): {'ANO' if metrics['full'] else 'NE'}")
+    print(f"Vyvážený: {'ANO' if metrics['balanced'] else 'NE'} (největší rozdíl výšek podstromů: {metrics['max_imbalance']})")
+    
+    if len(tree) <= 50:
+        def names(order):
+            return ', '.join(tree.label(i) for i in order)
+        
+        print(f"\nPreorder:  {names(tree.preorder())}")
+        print(f"Inorder:   {names(tree.inorder())}")
+        print(f"Postorder: {names(tree.postorder())}")
+        print(f"Po úrovních: {names(tree.level_order())}")
 
 
 def print_properties(properties):
@@ -61,6 +86,8 @@ def print_properties(properties):
         print(f"   Partition 2: {{{', '.join(sorted(p2))}}}")
     else:
         print(f"j) Bipartitní: NE")
+        if bipartite.get('odd_cycle'):
+            print(f"   Lichý cyklus: {' - '.join(bipartite['odd_cycle'])}")
 
 
 def print_node_info(graph, node_id):
@@ -94,7 +121,8 @@ def print_node_info(graph, node_id):
     print(f"s) d({node_id}) - Stupeň: {graph.get_degree(node_id)}")
 
 
-def analyze_properties(filepath, visualize=True, nodes_to_display=None):
+def analyze_properties(filepath, visualize=True, nodes_to_display=None, method='auto',
+                       view_options=None):
     """
     Načte graf a analyzuje jeho vlastnosti a uzly.
     
@@ -102,25 +130,27 @@ def analyze_properties(filepath, visualize=True, nodes_to_display=None):
         filepath (str): Cesta k souboru s grafem
         visualize (bool): Zda vizualizovat graf
         nodes_to_display (list): Seznam uzlů, pro které zobrazit detaily. None = nezobrazovat.
+        method (str): Metoda grafické vizualizace (viz visualize_graph)
+        view_options (dict): Pohled pro kreslení - focus, radius, collapse, max_nodes
+                             (viz extract_view_options)
     """
     print(f"\nNačítám graf ze souboru: {filepath}")
     print("=" * 60)
     
-    # 1. Parsování
-    parser = GraphParser()
-    nodes, edges, is_binary_tree = parser.parse_file(filepath)
+    # 1. Načtení (binární strom přímo do BinaryTree, obecný graf přes parser)
+    graph = load_graph(filepath)
     
-    print(f"Načteno: {len(nodes)} uzlů, {len(edges)} hran")
-    if is_binary_tree:
+    print(f"Načteno: {len(graph.raw_nodes)} uzlů, {len(graph.raw_edges)} hran")
+    if graph.is_binary_tree:
         print("Typ: Binární strom")
     else:
         print("Typ: Obecný graf")
     
-    # 2. Vytvoření grafu
-    graph = Graph(nodes, edges, is_binary_tree)
-    
     # 3. Vizualizace
     if visualize:
+        # Vizualizace (rozložení, formáty, pohledy) se importuje, až když je potřeba
+        from src.visualizer import visualize_graph, TextVisualizer
+        
         print("\n" + "=" * 60)
         print("VIZUALIZACE")
         print("=" * 60)
@@ -138,9 +168,18 @@ def analyze_properties(filepath, visualize=True, nodes_to_display=None):
         
         # Pokus o grafickou vizualizaci
         print("\nPokouším se vykreslit graf graficky...")
-        result = visualize_graph(graph, method='auto', output_file=str(output_path))
-        if not result.endswith('.png'):
-            print(result)  # Textová vizualizace jako fallback
+        try:
+            result = visualize_graph(graph, method=method, output_file=str(output_path),
+                                     **(view_options or {}))
+        except KeyError as e:
+            # Uzel zadaný přes --focus v grafu není
+            print(f"Varování: {e.args[0]}")
+        else:
+            if not result.endswith(('.png', '.svg')):
+                print(result)  # Textová vizualizace jako fallback
+    
+    if graph.tree is not None:
+        print_tree_metrics(graph.tree)
     
     # 4. Analýza vlastností
     analyzer = GraphAnalyzer(graph)
@@ -171,8 +210,29 @@ def analyze_properties(filepath, visualize=True, nodes_to_display=None):
 
 def main():
     """Hlavní funkce programu."""
-    if len(sys.argv) < 2:
-        print("Použití: python analyze_properties.py <soubor_s_grafem> [uzel1] [uzel2] ...")
+    argv, profile = profiling.extract_profile_flag(sys.argv)
+    try:
+        run_main(argv)
+    finally:
+        if profile:
+            profiling.print_report()
+
+
+def run_main(argv):
+    """Zpracuje argumenty (bez voleb --profile a --profile-memory) a spustí analýzu."""
+    # --svg: kreslit čistě v Pythonu do SVG bez importu matplotlib
+    # --no-vis: bez vizualizace (ani se neimportuje)
+    method = 'svg' if '--svg' in argv else 'auto'
+    visualize = '--no-vis' not in argv
+    # --focus/--radius/--collapse/--max-nodes: kreslit jen část grafu (viz views.py)
+    argv = [arg for arg in argv if arg not in ('--svg', '--no-vis')]
+    try:
+        argv, view_options = extract_view_options(argv)
+    except ValueError as e:
+        print(f"Chyba v parametrech: {e}")
+        sys.exit(1)
+    if len(argv) < 2:
+        print("Použití: python analyze_properties.py <soubor_s_grafem> [uzel1] [uzel2] ... [--svg] [--no-vis] [--focus <uzel>] [--radius <n>] [--collapse scc|components] [--max-nodes <n>] [--profile] [--profile-memory]")
         print("Příklad: python analyze_properties.py graph.tg A B C")
         print("         python analyze_properties.py graph.tg          (bez uzlů = nezobrazovat detaily uzlů)")
         
@@ -180,17 +240,19 @@ def main():
         test_file = str(Path(__file__).parent.parent / "data" / "grafy" / "01.tg")
         print(f"\nZkouším testovací soubor: {test_file}")
         try:
-            analyze_properties(test_file, nodes_to_display=None)
+            analyze_properties(test_file, visualize, nodes_to_display=None, method=method,
+                               view_options=view_options)
         except FileNotFoundError:
             print(f"Testovací soubor nenalezen: {test_file}")
             sys.exit(1)
     else:
-        filepath = sys.argv[1]
+        filepath = argv[1]
         # Uzly jsou všechny parametry od druhého dál
-        nodes_to_display = sys.argv[2:] if len(sys.argv) > 2 else None
+        nodes_to_display = argv[2:] if len(argv) > 2 else None
         
         try:
-            analyze_properties(filepath, nodes_to_display=nodes_to_display)
+            analyze_properties(filepath, visualize, nodes_to_display=nodes_to_display, method=method,
+                               view_options=view_options)
         except FileNotFoundError:
             print(f"Soubor nenalezen: {filepath}")
             sys.exit(1)
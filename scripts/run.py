@@ -16,44 +16,19 @@ from pathlib import Path
 # Přidání rodičovského adresáře do sys.path pro import src modulů
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.parser import GraphParser
-from src.graph import Graph
+from src.graph import load_graph
 from src.analyzer import GraphAnalyzer
 from src.matrices import MatrixBuilder
-from src.visualizer import visualize_graph, TextVisualizer
+from src.floyd_warshall import extract_workers_option
+from src.printer import print_matrix_stream
+from src.views import extract_view_options
+from src import profiling
 
 
 def print_matrix(matrix, row_labels=None, col_labels=None, title="Matice"):
-    """Vypíše matici v čitelném formátu."""
-    print(f"\n{title}:")
-    print("-" * 60)
-    
-    # Hlavička se sloupci
-    if col_labels:
-        header = "    " + " ".join(f"{label:>4}" for label in col_labels)
-        print(header)
-    
-    # Řádky matice
-    for i, row in enumerate(matrix):
-        if row_labels:
-            label = f"{row_labels[i]:>3}:"
-        else:
-            label = f"{i:>3}:"
-        
-        # Formátování čísel
-        formatted_row = []
-        for val in row:
-            if val == float('inf'):
-                formatted_row.append("  ∞ ")
-            elif isinstance(val, float):
-                formatted_row.append(f"{val:>4.1f}")
-            elif val is None:
-                formatted_row.append("  - ")
-            else:
-                formatted_row.append(f"{val:>4}")
-        
-        print(label + " ".join(formatted_row))
-    print()
+    """Vypíše matici v čitelném formátu (proudově po blocích sloupců)."""
+    print_matrix_stream(matrix, title, show_dimensions=False,
+                        row_labels=row_labels, col_labels=col_labels)
 
 
 def print_properties(properties):
@@ -97,6 +72,8 @@ def print_properties(properties):
         print(f"   Partition 2: {{{', '.join(sorted(p2))}}}")
     else:
         print(f"j) Bipartitní: NE")
+        if bipartite.get('odd_cycle'):
+            print(f"   Lichý cyklus: {' - '.join(bipartite['odd_cycle'])}")
 
 
 def print_node_info(graph, node_id):
@@ -146,7 +123,8 @@ def print_node_info(graph, node_id):
     print(f"s) d({node_id}) - Stupeň: {graph.get_degree(node_id)}")
 
 
-def analyze_graph(filepath, visualize=True, nodes_to_display=None):
+def analyze_graph(filepath, visualize=True, nodes_to_display=None, method='auto', workers=1,
+                  view_options=None):
     """
     Načte a analyzuje graf ze souboru.
     
@@ -154,25 +132,28 @@ def analyze_graph(filepath, visualize=True, nodes_to_display=None):
         filepath (str): Cesta k souboru s grafem
         visualize (bool): Zda vizualizovat graf
         nodes_to_display (list): Seznam uzlů, pro které zobrazit detaily. None = nezobrazovat.
+        method (str): Metoda grafické vizualizace (viz visualize_graph)
+        workers (int): Počet procesů pro Floyd-Warshall (matice délek)
+        view_options (dict): Pohled pro kreslení - focus, radius, collapse, max_nodes
+                             (viz extract_view_options)
     """
     print(f"\nNačítám graf ze souboru: {filepath}")
     print("=" * 60)
     
-    # 1. Parsování
-    parser = GraphParser()
-    nodes, edges, is_binary_tree = parser.parse_file(filepath)
+    # 1. Načtení (binární strom přímo do BinaryTree, obecný graf přes parser)
+    graph = load_graph(filepath)
     
-    print(f"Načteno: {len(nodes)} uzlů, {len(edges)} hran")
-    if is_binary_tree:
+    print(f"Načteno: {len(graph.raw_nodes)} uzlů, {len(graph.raw_edges)} hran")
+    if graph.is_binary_tree:
         print("Typ: Binární strom")
     else:
         print("Typ: Obecný graf")
     
-    # 2. Vytvoření grafu
-    graph = Graph(nodes, edges, is_binary_tree)
-    
     # 3. Vizualizace
     if visualize:
+        # Vizualizace (rozložení, formáty, pohledy) se importuje, až když je potřeba
+        from src.visualizer import visualize_graph, TextVisualizer
+        
         print("\n" + "=" * 60)
         print("VIZUALIZACE")
         print("=" * 60)
@@ -190,9 +171,15 @@ def analyze_graph(filepath, visualize=True, nodes_to_display=None):
         
         # Pokus o grafickou vizualizaci
         print("\nPokouším se vykreslit graf graficky...")
-        result = visualize_graph(graph, method='auto', output_file=str(output_path))
-        if not result.endswith('.png'):
-            print(result)  # Textová vizualizace jako fallback
+        try:
+            result = visualize_graph(graph, method=method, output_file=str(output_path),
+                                     **(view_options or {}))
+        except KeyError as e:
+            # Uzel zadaný přes --focus v grafu není
+            print(f"Varování: {e.args[0]}")
+        else:
+            if not result.endswith(('.png', '.svg')):
+                print(result)  # Textová vizualizace jako fallback
     
     # 4. Analýza vlastností
     analyzer = GraphAnalyzer(graph)
@@ -219,30 +206,26 @@ def analyze_graph(filepath, visualize=True, nodes_to_display=None):
     print("MATICE A SEZNAMY")
     print("=" * 60)
     
-    builder = MatrixBuilder(graph)
+    builder = MatrixBuilder(graph, workers=workers)
     
-    # Matice sousednosti
-    adj_matrix, nodes_list = builder.adjacency_matrix()
-    print_matrix(adj_matrix, nodes_list, nodes_list, "a) Matice sousednosti")
+    # Matice sousednosti (NamedMatrix nese popisky řádků i sloupců)
+    adj_matrix = builder.adjacency_matrix()
+    print_matrix(adj_matrix, title="a) Matice sousednosti")
     
     # Znaménková matice
-    sign_matrix, _ = builder.signed_matrix()
-    print_matrix(sign_matrix, nodes_list, nodes_list, "b) Znaménková matice")
+    print_matrix(builder.signed_matrix(), title="b) Znaménková matice")
     
     # Mocniny matice sousednosti
-    if len(nodes_list) <= 10:  # Pouze pro menší grafy
+    if len(adj_matrix) <= 10:  # Pouze pro menší grafy
         powers = builder.adjacency_matrix_powers(3)
-        for power, (matrix, _) in powers.items():
-            print_matrix(matrix, nodes_list, nodes_list, f"c) Matice sousednosti^{power}")
+        for power, matrix in powers.items():
+            print_matrix(matrix, title=f"c) Matice sousednosti^{power}")
     
-    # Matice incidence
-    inc_matrix, nodes_inc, edges_inc = builder.incidence_matrix()
-    edge_labels = [edge.label if edge.label else f"e{i}" for i, edge in enumerate(edges_inc)]
-    print_matrix(inc_matrix, nodes_inc, edge_labels, "d) Matice incidence")
+    # Matice incidence (sloupce = označení hran)
+    print_matrix(builder.incidence_matrix(), title="d) Matice incidence")
     
     # Matice délek
-    dist_matrix, _ = builder.distance_matrix()
-    print_matrix(dist_matrix, nodes_list, nodes_list, "e) Matice délek (Floyd-Warshall)")
+    print_matrix(builder.distance_matrix(), title="e) Matice délek (Floyd-Warshall)")
     
     # Seznam sousedů
     print("\nh) Seznam sousedů:")
@@ -259,8 +242,31 @@ def analyze_graph(filepath, visualize=True, nodes_to_display=None):
 
 def main():
     """Hlavní funkce programu."""
-    if len(sys.argv) < 2:
-        print("Použití: python run.py <soubor_s_grafem> [uzel1] [uzel2] ...")
+    argv, profile = profiling.extract_profile_flag(sys.argv)
+    try:
+        run_main(argv)
+    finally:
+        if profile:
+            profiling.print_report()
+
+
+def run_main(argv):
+    """Zpracuje argumenty (bez voleb --profile a --profile-memory) a spustí analýzu."""
+    # --svg: kreslit čistě v Pythonu do SVG bez importu matplotlib
+    # --no-vis: bez vizualizace (ani se neimportuje)
+    # --workers <n>: matice délek ve více procesech
+    method = 'svg' if '--svg' in argv else 'auto'
+    visualize = '--no-vis' not in argv
+    argv = [arg for arg in argv if arg not in ('--svg', '--no-vis')]
+    # --focus/--radius/--collapse/--max-nodes: kreslit jen část grafu (viz views.py)
+    try:
+        argv, workers = extract_workers_option(argv)
+        argv, view_options = extract_view_options(argv)
+    except ValueError as e:
+        print(f"Chyba v parametrech: {e}")
+        sys.exit(1)
+    if len(argv) < 2:
+        print("Použití: python run.py <soubor_s_grafem> [uzel1] [uzel2] ... [--svg] [--no-vis] [--focus <uzel>] [--radius <n>] [--collapse scc|components] [--max-nodes <n>] [--workers <n>] [--profile] [--profile-memory]")
         print("Příklad: python run.py graph.tg A B C")
         print("         python run.py graph.tg          (bez uzlů = nezobrazovat detaily uzlů)")
         
@@ -268,17 +274,19 @@ def main():
         test_file = str(Path(__file__).parent.parent / "data" / "grafy" / "01.tg")
         print(f"\nZkouším testovací soubor: {test_file}")
         try:
-            analyze_graph(test_file, nodes_to_display=None)
+            analyze_graph(test_file, visualize, nodes_to_display=None, method=method, workers=workers,
+                          view_options=view_options)
         except FileNotFoundError:
             print(f"Testovací soubor nenalezen: {test_file}")
             sys.exit(1)
     else:
-        filepath = sys.argv[1]
+        filepath = argv[1]
         # Uzly jsou všechny parametry od druhého dál
-        nodes_to_display = sys.argv[2:] if len(sys.argv) > 2 else None
+        nodes_to_display = argv[2:] if len(argv) > 2 else None
         
         try:
-            analyze_graph(filepath, nodes_to_display=nodes_to_display)
+            analyze_graph(filepath, visualize, nodes_to_display=nodes_to_display, method=method,
+                          workers=workers, view_options=view_options)
         except FileNotFoundError:
             print(f"Soubor nenalezen: {filepath}")
             sys.exit(1)
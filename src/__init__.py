@@ -2,22 +2,43 @@
 Rozpoznávač grafů - zdrojové moduly.
 
 Tento balíček obsahuje všechny základní moduly pro práci s grafy.
+
+Veřejné třídy a funkce se načítají líně (__getattr__ modulu): `import src`
+nic dalšího neimportuje a `src.Graph` načte jen modul graph a jeho závislosti.
+Krátké spuštění (např. jen vlastnosti grafu) tak neplatí import vizualizace
+ani matic.
 """
 
-from .parser import GraphParser, Node, Edge
-from .graph import Graph
-from .analyzer import GraphAnalyzer
-from .matrices import MatrixBuilder
-from .visualizer import visualize_graph, TextVisualizer
-
-__all__ = [
-    'GraphParser',
-    'Node',
-    'Edge',
-    'Graph',
-    'GraphAnalyzer',
-    'MatrixBuilder',
-    'visualize_graph',
-    'TextVisualizer',
-]
+import importlib
+
+
+# Veřejné jméno -> modul balíčku, ve kterém je definované
+_EXPORTS = {
+    'GraphParser': 'parser',
+    'Node': 'parser',
+    'Edge': 'parser',
+    'Graph': 'graph',
+    'load_graph': 'graph',
+    'GraphAnalyzer': 'analyzer',
+    'MatrixBuilder': 'matrices',
+    'visualize_graph': 'visualizer',
+    'TextVisualizer': 'visualizer',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Načte veřejné jméno z jeho modulu při prvním přístupu."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        # AttributeError nechá 'from src import modul' naimportovat podmodul
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Další přístupy už jdou přímo přes slovník modulu
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
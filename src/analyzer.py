@@ -6,11 +6,125 @@ a) ohodnocený, b) orientovaný, c) souvislý, d) prostý, e) jednoduchý,
 f) rovinný, g) konečný, h) úplný, i) regulární, j) bipartitní
 """
 
-from collections import deque
+from array import array
+from itertools import accumulate
+
+from .graph import ADD_NODE, REMOVE_NODE, ADD_EDGE, REMOVE_EDGE
+from .profiling import profiled
+
+
+class _UnionFind:
+    """Disjunktní množiny (union-find) pro komponenty slabé souvislosti."""
+    
+    def __init__(self, items):
+        self.parent = {item: item for item in items}
+        self.size = {item: 1 for item in items}
+        self.count = len(self.parent)
+    
+    def add(self, item):
+        """Přidá nový prvek jako samostatnou komponentu."""
+        self.parent[item] = item
+        self.size[item] = 1
+        self.count += 1
+    
+    def find(self, item):
+        """Vrací reprezentanta komponenty (s půlením cesty)."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, a, b):
+        """Spojí komponenty prvků a, b (menší pod větší)."""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.count -= 1
+
+
+def _degree_contributions(edge):
+    """
+    Příspěvky hrany ke stupňům uzlů - stejně jako Graph.get_degree.
+    
+    Neorientovaná smyčka se počítá 2×, orientovaná smyčka je mezi vstupními
+    i výstupními hranami, proto 4×.
+    
+    Returns:
+        list: [(uzel, příspěvek)]
+    """
+    if edge.node1 == edge.node2:
+        return [(edge.node1, 4 if edge.directed else 2)]
+    return [(edge.node1, 1), (edge.node2, 1)]
+
+
+def _undirected_csr(graph):
+    """
+    Sousedství bez ohledu na směr hran v CSR polích (indexy uzlů).
+    
+    Sousedé uzlu node_list[i] jsou targets[offsets[i]:offsets[i + 1]],
+    smyčka dává uzlu jeho samotného jednou. Vícenásobné hrany se neslučují.
+    
+    Returns:
+        tuple: (node_list, offsets, targets)
+    """
+    node_list = list(graph.nodes)
+    index = {node: i for i, node in enumerate(node_list)}
+    ends = [(index[edge.node1], index[edge.node2]) for edge in graph.edges_list]
+    
+    counts = [0] * len(node_list)
+    for i, j in ends:
+        counts[i] += 1
+        if i != j:
+            counts[j] += 1
+    offsets = array('i', accumulate(counts, initial=0))
+    
+    targets = array('i', [0]) * offsets[-1]
+    fill = offsets[:-1]
+    for i, j in ends:
+        targets[fill[i]] = j
+        fill[i] += 1
+        if i != j:
+            targets[fill[j]] = i
+            fill[j] += 1
+    return node_list, offsets, targets
+
+
+def _odd_cycle(parent, u, v):
+    """
+    Lichý cyklus uzavřený hranou u - v mezi uzly stejné barvy.
+    
+    Oba uzly leží v BFS stromu ve stejné hloubce, cesty k rodičům se
+    proto setkají ve společném předkovi po stejném počtu kroků.
+    
+    Returns:
+        list: Indexy uzlů cyklu (poslední uzel sousedí s prvním)
+    """
+    if u == v:
+        return [u]
+    left, right = [u], [v]
+    while u != v:
+        u = parent[u]
+        v = parent[v]
+        left.append(u)
+        right.append(v)
+    # Společný předek je na konci obou cest
+    return left + right[-2::-1]
 
 
 class GraphAnalyzer:
-    """Třída pro analýzu vlastností grafů."""
+    """
+    Třída pro analýzu vlastností grafů.
+    
+    Stupně uzlů a komponenty slabé souvislosti (union-find) si analyzátor
+    pamatuje a při změnách grafu je dorovnává podle záznamu změn grafu.
+    Odebrání hrany nebo uzlu komponenty zneplatní.
+    """
     
     def __init__(self, graph):
         """
@@ -18,7 +132,84 @@ class GraphAnalyzer:
             graph (Graph): Instance grafu k analýze
         """
         self.graph = graph
+        self._version = graph.version
+        self._degrees = None     # {uzel: stupeň}
+        self._components = None  # _UnionFind
+        self._bipartite = None   # výsledek is_bipartite
+    
+    def _sync(self):
+        """Dorovná uložené stupně a komponenty na aktuální verzi grafu."""
+        if self._version == self.graph.version:
+            return
+        
+        changes = self.graph.changes_since(self._version)
+        self._version = self.graph.version
+        self._bipartite = None
+        if changes is None:
+            self._degrees = None
+            self._components = None
+            return
+        
+        for _, change, data in changes:
+            if change == ADD_NODE:
+                if self._degrees is not None:
+                    self._degrees[data] = 0
+                if self._components is not None:
+                    self._components.add(data)
+            elif change == REMOVE_NODE:
+                if self._degrees is not None:
+                    self._degrees.pop(data, None)
+                self._components = None
+            elif change == ADD_EDGE:
+                edge, _ = data
+                if self._degrees is not None:
+                    for node, delta in _degree_contributions(edge):
+                        self._degrees[node] += delta
+                if self._components is not None:
+                    self._components.union(edge.node1, edge.node2)
+            elif change == REMOVE_EDGE:
+                edge, _ = data
+                if self._degrees is not None:
+                    for node, delta in _degree_contributions(edge):
+                        self._degrees[node] -= delta
+                self._components = None
+    
+    def degrees(self):
+        """
+        Stupně všech uzlů (udržované inkrementálně).
+        
+        Returns:
+            dict: {uzel: stupeň}
+        """
+        return dict(self._degree_table())
+    
+    def _degree_table(self):
+        """Uložené stupně uzlů (bez kopie) - poprvé se sestaví jedním průchodem hranami."""
+        self._sync()
+        if self._degrees is None:
+            degrees = dict.fromkeys(self.graph.nodes, 0)
+            for edge in self.graph.edges_list:
+                for node, delta in _degree_contributions(edge):
+                    degrees[node] += delta
+            self._degrees = degrees
+        return self._degrees
+    
+    def weak_component_count(self):
+        """
+        Počet komponent slabé souvislosti (směry hran se ignorují).
+        
+        Returns:
+            int: Počet komponent
+        """
+        self._sync()
+        if self._components is None:
+            components = _UnionFind(self.graph.nodes)
+            for edge in self.graph.edges_list:
+                components.union(edge.node1, edge.node2)
+            self._components = components
+        return self._components.count
     
+    @profiled()
     def is_weighted(self):
         """
         a) Ohodnocený graf - pokud má hrany váhy.
@@ -28,6 +219,7 @@ class GraphAnalyzer:
         """
         return self.graph.is_weighted()
     
+    @profiled()
     def is_directed(self):
         """
         b) Orientovaný graf - pokud mají hrany směr.
@@ -37,12 +229,16 @@ class GraphAnalyzer:
         """
         return self.graph.is_directed()
     
-    def is_connected(self):
+    @profiled()
+    def is_connected(self, progress=None):
         """
         c) Souvislý graf.
         Pro neorientované grafy: z každého uzlu existuje cesta do každého ostatního.
         Pro orientované grafy: rozlišujeme silně a slabě souvislé.
         
+        Args:
+            progress (Progress): Volitelný token průběhu a zrušení výpočtu
+        
         Returns:
             dict: {'connected': bool, 'type': 'strongly'/'weakly'/None}
         """
@@ -50,14 +246,12 @@ class GraphAnalyzer:
             return {'connected': True, 'type': None}
         
         if not self.is_directed():
-            # Neorientovaný graf - stačí BFS z libovolného uzlu
-            start = next(iter(self.graph.nodes))
-            reachable = self.graph.bfs(start)
-            connected = len(reachable) == self.graph.get_node_count()
+            # Neorientovaný graf - stačí jedna komponenta souvislosti
+            connected = self.weak_component_count() == 1
             return {'connected': connected, 'type': None}
         else:
             # Orientovaný graf - kontrolujeme silnou souvislost
-            strongly = self._is_strongly_connected()
+            strongly = self._is_strongly_connected(progress)
             if strongly:
                 return {'connected': True, 'type': 'strongly'}
             
@@ -68,24 +262,61 @@ class GraphAnalyzer:
             
             return {'connected': False, 'type': None}
     
-    def _is_strongly_connected(self):
+    @profiled()
+    def _is_strongly_connected(self, progress=None):
         """
         Kontroluje silnou souvislost orientovaného grafu.
         Ze všech uzlů lze dojít do všech ostatních uzlů.
         
+        Args:
+            progress (Progress): Volitelný token průběhu (hlásí se po každém BFS)
+        
         Returns:
             bool: True pokud je silně souvislý
+        
+        Raises:
+            ComputationCancelled: Pokud byl výpočet zrušen přes progress
         """
         if self.graph.get_node_count() == 0:
             return True
         
+        dense = self.graph.is_dense()
+        if progress is not None:
+            # Hustý graf: dva průchody bitovými množinami, jinak BFS z každého uzlu
+            progress.begin('strong_connectivity', 2 if dense else self.graph.get_node_count())
+        
+        if dense:
+            # Stačí jeden uzel: do všech z něj dojdeme a ze všech se do něj vrátíme
+            bitsets = self.graph.bitsets()
+            start = bitsets.node_list[0]
+            full = bitsets.full_mask()
+            if progress is not None:
+                progress.update(0)
+            strong = bitsets.reachable(start) == full
+            if strong:
+                # Zrušení se kontroluje i mezi průchodem dopředu a zpět
+                if progress is not None:
+                    progress.update(1)
+                strong = bitsets.reachable(start, reverse=True) == full
+            if progress is not None:
+                progress.finish()
+            return strong
+        
         # Z každého uzlu musíme dosáhnout všech ostatních
-        for node in self.graph.nodes:
+        for searched, node in enumerate(self.graph.nodes):
+            if progress is not None:
+                progress.update(searched)
             reachable = self.graph.bfs(node)
             if len(reachable) != self.graph.get_node_count():
+                if progress is not None:
+                    progress.finish()
                 return False
+        
+        if progress is not None:
+            progress.finish()
         return True
     
+    @profiled()
     def _is_weakly_connected(self):
         """
         Kontroluje slabou souvislost orientovaného grafu.
@@ -97,10 +328,9 @@ class GraphAnalyzer:
         if self.graph.get_node_count() == 0:
             return True
         
-        start = next(iter(self.graph.nodes))
-        reachable = self.graph.bfs_undirected(start)
-        return len(reachable) == self.graph.get_node_count()
+        return self.weak_component_count() == 1
     
+    @profiled()
     def is_simple(self):
         """
         d) Prostý graf - neobsahuje vícenásobné hrany.
@@ -113,6 +343,7 @@ class GraphAnalyzer:
         """
         return not self.graph.has_multiple_edges()
     
+    @profiled()
     def is_loop_free(self):
         """
         e) Jednoduchý graf - neobsahuje smyčky a je prostý.
@@ -125,6 +356,7 @@ class GraphAnalyzer:
         """
         return not self.graph.has_self_loop() and not self.graph.has_multiple_edges()
     
+    @profiled()
     def is_planar(self):
         """
         f) Rovinný graf - lze nakreslit na rovinu bez křížení hran.
@@ -157,7 +389,8 @@ class GraphAnalyzer:
             }
         
         # Pro bipartitní grafy: m <= 2n - 4
-        if self.is_bipartite()['bipartite'] and m > 2 * n - 4:
+        # (výsledek obarvení je uložený, analyze_all ho použije znovu)
+        if m > 2 * n - 4 and self._bipartite_result()['bipartite']:
             return {
                 'planar': False,
                 'method': 'bipartite_formula',
@@ -172,6 +405,7 @@ class GraphAnalyzer:
             'note': 'Prošel základními testy rovinnosti (nezaručuje 100% správnost)'
         }
     
+    @profiled()
     def is_finite(self):
         """
         g) Konečný graf - má konečný počet uzlů a hran.
@@ -181,10 +415,17 @@ class GraphAnalyzer:
         """
         return True
     
+    @profiled()
     def is_complete(self):
         """
         h) Úplný graf - každý uzel je spojen s každým ostatním uzlem.
         
+        Graf musí být prostý (bez smyček a vícenásobných hran) a každý uzel
+        musí mít n-1 různých následníků (neorientovaná hrana vede oběma
+        směry, orientovaná jen jedním - u orientovaného grafu jsou tedy
+        potřeba obě hrany u -> v i v -> u). Počty následníků se sestaví
+        jedním průchodem hranami, celkem O(n + m).
+        
         Returns:
             bool: True pokud je graf úplný
         """
@@ -193,26 +434,16 @@ class GraphAnalyzer:
         if n <= 1:
             return True
         
-        # Pro neorientovaný graf: musí mít n*(n-1)/2 hran
-        # Pro orientovaný graf: musí mít n*(n-1) hran
-        if not self.is_directed():
-            expected_edges = n * (n - 1) // 2
-        else:
-            expected_edges = n * (n - 1)
-        
-        # Kontrola počtu hran
-        actual_edges = self.graph.get_edge_count()
-        if actual_edges != expected_edges:
+        # Každá hrana pokryje nejvýše dvě uspořádané dvojice uzlů
+        if 2 * self.graph.get_edge_count() < n * (n - 1):
             return False
         
-        # Kontrola, že každý uzel je spojen se všemi ostatními
-        for node in self.graph.nodes:
-            neighbors = self.graph.get_all_neighbors(node)
-            if len(neighbors) != n - 1:
-                return False
+        if self.graph.has_multiple_edges() or self.graph.has_self_loop():
+            return False
         
-        return True
+        return all(count == n - 1 for count in self.graph.successor_counts().values())
     
+    @profiled()
     def is_regular(self):
         """
         i) Regulární graf - všechny uzly mají stejný stupeň.
@@ -223,13 +454,15 @@ class GraphAnalyzer:
         if self.graph.get_node_count() == 0:
             return {'regular': True, 'degree': None}
         
-        degrees = [self.graph.get_degree(node) for node in self.graph.nodes]
+        degrees = self._degree_table().values()
+        first = next(iter(degrees))
         
-        if len(set(degrees)) == 1:
-            return {'regular': True, 'degree': degrees[0]}
+        if all(degree == first for degree in degrees):
+            return {'regular': True, 'degree': first}
         else:
             return {'regular': False, 'degree': None}
     
+    @profiled()
     def is_bipartite(self):
         """
         j) Bipartitní graf - lze rozdělit na dvě disjunktní podmnožiny uzlů,
@@ -238,51 +471,80 @@ class GraphAnalyzer:
         Hledání pomocí cyklů liché délky: graf je bipartitní právě tehdy,
         když neobsahuje cykly liché délky.
         
-        Používáme obarvení grafů (2-coloring).
+        Používáme obarvení grafů (2-coloring) prohledáváním do šířky nad
+        CSR poli s barvami v bytearray. Konflikt se najde v nejnižší možné
+        hloubce BFS, lichý cyklus uzavřený konfliktní hranou je proto
+        nejkratší, který lze z BFS stromu dané komponenty sestavit.
+        Výsledek se pamatuje do další změny grafu.
         
         Returns:
-            dict: {'bipartite': bool, 'partition': tuple or None}
+            dict: {'bipartite': bool, 'partition': tuple or None,
+                   'odd_cycle': list or None} - odd_cycle jsou uzly lichého
+                   cyklu (poslední sousedí s prvním), pokud graf není bipartitní
         """
-        if self.graph.get_node_count() == 0:
-            return {'bipartite': True, 'partition': (set(), set())}
+        result = dict(self._bipartite_result())
+        # Volající dostane vlastní množiny a seznam - uložený výsledek
+        # čte i is_planar a nesmí se změnit zvenku
+        if result['partition'] is not None:
+            result['partition'] = tuple(set(part) for part in result['partition'])
+        if result['odd_cycle'] is not None:
+            result['odd_cycle'] = list(result['odd_cycle'])
+        return result
+    
+    def _bipartite_result(self):
+        """Uložený výsledek obarvení (sdílený - volající ho nesmí měnit)."""
+        self._sync()
+        if self._bipartite is None:
+            self._bipartite = self._color_bipartite()
+        return self._bipartite
+    
+    def _color_bipartite(self):
+        """Obarvení BFS pro is_bipartite (bez paměti výsledku)."""
+        node_list, offsets, targets = _undirected_csr(self.graph)
+        n = len(node_list)
         
-        # Obarvení uzlů (0 nebo 1)
-        color = {}
+        # Obarvení uzlů (0 = zatím neobarvený, jinak 1 nebo 2)
+        color = bytearray(n)
+        parent = array('i', [-1]) * n
         
         # Pro každou komponentu souvislosti
-        for start_node in self.graph.nodes:
-            if start_node in color:
+        for start in range(n):
+            if color[start]:
                 continue
             
-            # BFS s obarvováním
-            queue = deque([start_node])
-            color[start_node] = 0
-            
-            while queue:
-                node = queue.popleft()
-                current_color = color[node]
-                next_color = 1 - current_color
+            # BFS s obarvováním - seznam se při procházení prodlužuje
+            color[start] = 1
+            queue = [start]
+            for node in queue:
+                next_color = 3 - color[node]
                 
                 # Všichni sousedé musí mít opačnou barvu
-                neighbors = self.graph.get_all_neighbors(node)
-                for neighbor in neighbors:
-                    if neighbor not in color:
+                for k in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[k]
+                    if not color[neighbor]:
                         color[neighbor] = next_color
+                        parent[neighbor] = node
                         queue.append(neighbor)
                     elif color[neighbor] != next_color:
                         # Konflikt - graf není bipartitní
-                        return {'bipartite': False, 'partition': None}
+                        cycle = _odd_cycle(parent, node, neighbor)
+                        return {'bipartite': False, 'partition': None,
+                                'odd_cycle': [node_list[i] for i in cycle]}
         
         # Rozdělíme uzly podle barvy
-        partition_0 = {node for node, c in color.items() if c == 0}
-        partition_1 = {node for node, c in color.items() if c == 1}
+        partition_0 = {node for node, c in zip(node_list, color) if c == 1}
+        partition_1 = {node for node, c in zip(node_list, color) if c == 2}
         
-        return {'bipartite': True, 'partition': (partition_0, partition_1)}
+        return {'bipartite': True, 'partition': (partition_0, partition_1), 'odd_cycle': None}
     
-    def analyze_all(self):
+    @profiled()
+    def analyze_all(self, progress=None):
         """
         Provede kompletní analýzu grafu a vrátí všechny vlastnosti.
         
+        Args:
+            progress (Progress): Volitelný token průběhu a zrušení výpočtu
+        
         Returns:
             dict: Slovník se všemi vlastnostmi grafu
         """
@@ -290,7 +552,7 @@ class GraphAnalyzer:
         
         results['a_weighted'] = self.is_weighted()
         results['b_directed'] = self.is_directed()
-        results['c_connected'] = self.is_connected()
+        results['c_connected'] = self.is_connected(progress)
         results['d_simple'] = self.is_simple()
         results['e_loop_free'] = self.is_loop_free()
         results['f_planar'] = self.is_planar()
@@ -0,0 +1,324 @@
+"""
+Binární strom v haldovém rozložení uložený v plochých polích.
+
+Soubor se stromem obsahuje jen příkazy 'u': i-tý příkaz je uzel na pozici i,
+potomci uzlu i jsou na pozicích 2i+1 a 2i+2, 'u *' označuje prázdnou pozici.
+Strom drží jen seznam popisků (None = díra) a pole vah, takže navigace
+rodič/potomek je O(1) aritmetika a velký strom se načte bez objektů Node
+a Edge.
+"""
+
+import math
+from array import array
+
+from .parser import Edge, Node
+
+
+class BinaryTree:
+    """Binární strom v haldovém rozložení (pozice 0 = kořen)."""
+    
+    def __init__(self, labels, weights=None):
+        """
+        Args:
+            labels (list): Popisky uzlů po pozicích, None = prázdná pozice ('u *')
+            weights (list): Volitelné ohodnocení uzlů po pozicích (None = bez ohodnocení)
+        
+        Raises:
+            ValueError: Pokud uzel nemá rodiče (jeho rodičovská pozice je prázdná)
+        """
+        # Koncové prázdné pozice nenesou žádnou informaci
+        last = len(labels) - 1
+        while last >= 0 and labels[last] is None:
+            last -= 1
+        
+        self.labels = list(labels[:last + 1])
+        self.weights = array('d', (math.nan if w is None else w
+                                   for w in (weights or ())[:last + 1]))
+        if len(self.weights) < len(self.labels):
+            self.weights.extend([math.nan] * (len(self.labels) - len(self.weights)))
+        
+        self._size = 0
+        for i, label in enumerate(self.labels):
+            if label is None:
+                continue
+            if i and self.labels[(i - 1) // 2] is None:
+                raise ValueError(f"Uzel '{label}' na pozici {i} nemá rodiče "
+                                 f"(pozice {(i - 1) // 2} je prázdná)")
+            self._size += 1
+        self._index = None
+    
+    @classmethod
+    def from_nodes(cls, nodes):
+        """
+        Strom ze seznamu uzlů parseru (včetně vynechaných uzlů '*').
+        
+        Args:
+            nodes (list): Node objekty v pořadí souboru
+        
+        Returns:
+            BinaryTree: Strom
+        """
+        labels = [None if node.identifier == '*' else node.identifier for node in nodes]
+        return cls(labels, [node.weight for node in nodes])
+    
+    @classmethod
+    def from_file(cls, filepath):
+        """
+        Načte strom přímo ze souboru bez vytváření objektů Node.
+        
+        Args:
+            filepath (str): Cesta k souboru s příkazy 'u'
+        
+        Returns:
+            BinaryTree: Strom
+        
+        Raises:
+            ValueError: Pokud soubor obsahuje jiné příkazy než 'u' nebo uzel bez rodiče
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls.from_lines(f)
+    
+    @classmethod
+    def from_lines(cls, lines):
+        """
+        Strom z řádků s příkazy 'u' (prázdné řádky a komentáře se přeskočí).
+        
+        Stejně jako v GraphParser se ohodnocení, které nelze převést na číslo,
+        jen ohlásí varováním (uzel zůstane bez ohodnocení) a řádek bez
+        identifikátoru uzlu ('u ;') se ohlásí a přeskočí.
+        
+        Args:
+            lines (iterable): Řádky souboru
+        
+        Returns:
+            BinaryTree: Strom
+        
+        Raises:
+            ValueError: Pokud řádky obsahují jiné příkazy než 'u' nebo uzel bez rodiče
+        """
+        labels = []
+        weights = []
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if not line.startswith('u '):
+                raise ValueError(f"Řádek {line_num} není příkaz 'u' - soubor není binární strom")
+            
+            content = line[2:].strip()
+            if content.endswith(';'):
+                content = content[:-1].strip()
+            parts = content.split(None, 1)
+            if not parts:
+                print(f"Chyba při parsování řádku {line_num}: {line}")
+                print("  Chybí identifikátor uzlu")
+                continue
+            weight = None
+            if len(parts) > 1:
+                try:
+                    weight = float(parts[1])
+                except ValueError:
+                    print(f"Varování: Nelze převést ohodnocení na číslo: {parts[1]}")
+            labels.append(None if parts[0] == '*' else parts[0])
+            weights.append(weight)
+        return cls(labels, weights)
+    
+    # Navigace - vše O(1)
+    
+    def __len__(self):
+        """Počet uzlů (bez prázdných pozic)."""
+        return self._size
+    
+    def __contains__(self, label):
+        return label in self._label_index()
+    
+    def _present(self, i):
+        return 0 <= i < len(self.labels) and self.labels[i] is not None
+    
+    def _label_index(self):
+        # Mapování popisek -> pozice se sestaví až při prvním dotazu podle názvu
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels) if label is not None}
+        return self._index
+    
+    def position(self, label):
+        """
+        Pozice uzlu podle popisku.
+        
+        Raises:
+            KeyError: Pokud uzel ve stromu není
+        """
+        try:
+            return self._label_index()[label]
+        except KeyError:
+            raise KeyError(f"Uzel '{label}' neexistuje ve stromu") from None
+    
+    def root(self):
+        """Pozice kořene nebo None pro prázdný strom."""
+        return 0 if self._present(0) else None
+    
+    def parent(self, i):
+        """Pozice rodiče nebo None pro kořen."""
+        return (i - 1) // 2 if i > 0 else None
+    
+    def left(self, i):
+        """Pozice levého potomka nebo None."""
+        child = 2 * i + 1
+        return child if self._present(child) else None
+    
+    def right(self, i):
+        """Pozice pravého potomka nebo None."""
+        child = 2 * i + 2
+        return child if self._present(child) else None
+    
+    def children(self, i):
+        """Pozice existujících potomků (nejvýše dvě)."""
+        return [child for child in (2 * i + 1, 2 * i + 2) if self._present(child)]
+    
+    def depth(self, i):
+        """Hloubka pozice (kořen má hloubku 0)."""
+        return (i + 1).bit_length() - 1
+    
+    def label(self, i):
+        """Popisek uzlu na pozici i."""
+        return self.labels[i]
+    
+    def weight(self, i):
+        """Ohodnocení uzlu na pozici i nebo None."""
+        value = self.weights[i]
+        return None if math.isnan(value) else value
+    
+    # Průchody - iterativní, vrací pozice
+    
+    def level_order(self):
+        """Průchod po úrovních - v haldovém rozložení jsou to obsazené pozice vzestupně."""
+        return (i for i, label in enumerate(self.labels) if label is not None)
+    
+    def preorder(self):
+        """Průchod preorder (kořen, levý, pravý podstrom)."""
+        stack = [0] if self._present(0) else []
+        while stack:
+            i = stack.pop()
+            yield i
+            for child in (2 * i + 2, 2 * i + 1):
+                if self._present(child):
+                    stack.append(child)
+    
+    def inorder(self):
+        """Průchod inorder (levý podstrom, kořen, pravý podstrom)."""
+        stack = []
+        i = 0
+        while stack or self._present(i):
+            while self._present(i):
+                stack.append(i)
+                i = 2 * i + 1
+            i = stack.pop()
+            yield i
+            i = 2 * i + 2
+    
+    def postorder(self):
+        """Průchod postorder (levý, pravý podstrom, kořen)."""
+        # Obrácený průchod kořen, pravý, levý
+        result = []
+        stack = [0] if self._present(0) else []
+        while stack:
+            i = stack.pop()
+            result.append(i)
+            for child in (2 * i + 1, 2 * i + 2):
+                if self._present(child):
+                    stack.append(child)
+        return reversed(result)
+    
+    # Metriky
+    
+    def height(self):
+        """Výška stromu (počet hran nejdelší cesty z kořene, prázdný strom -1)."""
+        return len(self.labels).bit_length() - 1 if self.labels else -1
+    
+    def leaf_count(self):
+        """Počet listů."""
+        return sum(1 for i in self.level_order()
+                   if not self._present(2 * i + 1) and not self._present(2 * i + 2))
+    
+    def is_complete(self):
+        """Úplný (complete) strom - všechny úrovně plné, poslední zaplněná zleva."""
+        return self._size == len(self.labels)
+    
+    def is_perfect(self):
+        """Dokonalý strom - všechny úrovně zcela plné."""
+        return self.is_complete() and (self._size + 1) & self._size == 0
+    
+    def is_full(self):
+        """Plný strom - každý uzel má 0 nebo 2 potomky."""
+        return all(self._present(2 * i + 1) == self._present(2 * i + 2) for i in self.level_order())
+    
+    def subtree_heights(self):
+        """
+        Výška podstromu každé pozice (prázdná pozice -1).
+        
+        Potomci mají vyšší pozice než rodič, stačí proto jeden průchod
+        pozicemi odzadu.
+        
+        Returns:
+            array: Výšky po pozicích
+        """
+        n = len(self.labels)
+        heights = array('i', [-1]) * n
+        for i in range(n - 1, -1, -1):
+            if self.labels[i] is None:
+                continue
+            left = heights[2 * i + 1] if 2 * i + 1 < n else -1
+            right = heights[2 * i + 2] if 2 * i + 2 < n else -1
+            heights[i] = 1 + (left if left > right else right)
+        return heights
+    
+    def max_imbalance(self):
+        """Největší rozdíl výšek levého a pravého podstromu přes všechny uzly."""
+        heights = self.subtree_heights()
+        n = len(heights)
+        worst = 0
+        for i in self.level_order():
+            left = heights[2 * i + 1] if 2 * i + 1 < n else -1
+            right = heights[2 * i + 2] if 2 * i + 2 < n else -1
+            worst = max(worst, abs(left - right))
+        return worst
+    
+    def is_balanced(self):
+        """Výškově vyvážený strom (AVL podmínka) - rozdíl výšek podstromů nejvýše 1."""
+        return self.max_imbalance() <= 1
+    
+    def metrics(self):
+        """
+        Souhrn metrik stromu.
+        
+        Returns:
+            dict: {'nodes', 'slots', 'height', 'leaves', 'complete', 'perfect',
+                   'full', 'balanced', 'max_imbalance'}
+        """
+        imbalance = self.max_imbalance()
+        return {
+            'nodes': self._size,
+            'slots': len(self.labels),
+            'height': self.height(),
+            'leaves': self.leaf_count(),
+            'complete': self.is_complete(),
+            'perfect': self.is_perfect(),
+            'full': self.is_full(),
+            'balanced': imbalance <= 1,
+            'max_imbalance': imbalance,
+        }
+    
+    def to_graph_input(self, directed=False):
+        """
+        Uzly a hrany rodič - potomek pro sestavení Graph.
+        
+        Args:
+            directed (bool): Orientovat hrany od rodiče k potomkovi
+        
+        Returns:
+            tuple: (nodes, edges) pro Graph(nodes, edges)
+        """
+        nodes = [Node(self.labels[i], self.weight(i)) for i in self.level_order()]
+        edges = [Edge(self.labels[self.parent(i)], self.labels[i], directed)
+                 for i in self.level_order() if i > 0]
+        return nodes, edges
@@ -0,0 +1,137 @@
+"""
+Bitová reprezentace sousedství pro husté grafy.
+
+Sousedé každého uzlu jsou uloženi jako bitová množina v celém čísle
+(bit j = uzel node_list[j]). Množinové operace nad sousedy (průnik,
+sjednocení, počet prvků) pak běží po strojových slovech - 64 uzlů na
+jednu operaci - a matice n × n zabere n²/8 bajtů.
+
+Pro řídké grafy s mnoha uzly se nevyplatí: každá množina má délku
+až n bitů bez ohledu na počet sousedů. Proto ji používáme jen pro husté
+grafy (viz is_dense) a pro výsledky, které jsou husté už ze své podstaty.
+"""
+
+
+# Hustota grafu, od které se vyplatí bitová reprezentace
+DENSE_THRESHOLD = 0.3
+
+
+def density(node_count, edge_count):
+    """
+    Hustota grafu - podíl hran vůči počtu uspořádaných dvojic uzlů.
+    
+    Returns:
+        float: 0.0 až 1.0 (pro multigrafy může být víc)
+    """
+    if node_count < 2:
+        return 0.0
+    return edge_count / (node_count * (node_count - 1))
+
+
+def is_dense(graph):
+    """Vyplatí se pro graf bitová reprezentace sousedství?"""
+    directed_pairs = 1 if graph.is_directed() else 2
+    return density(graph.get_node_count(), graph.get_edge_count()) * directed_pairs >= DENSE_THRESHOLD
+
+
+def iter_bits(bits):
+    """Indexy nastavených bitů vzestupně."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class BitsetAdjacency:
+    """
+    Sousedství grafu jako bitové množiny.
+    
+    out_bits[i] jsou následníci uzlu node_list[i] - stejný vztah jako matice
+    sousednosti (orientovaná hrana zdroj -> cíl, neorientovaná oběma směry),
+    in_bits[i] jsou jeho předchůdci.
+    """
+    
+    def __init__(self, graph):
+        """
+        Args:
+            graph (Graph): Graf
+        """
+        self.version = graph.version
+        self.node_list = sorted(graph.nodes.keys())
+        self.node_index = {node: i for i, node in enumerate(self.node_list)}
+        
+        n = len(self.node_list)
+        out_bits = [0] * n
+        in_bits = [0] * n
+        index = self.node_index
+        for edge in graph.edges_list:
+            if edge.directed:
+                pairs = ((index[edge.source], index[edge.target]),)
+            else:
+                i, j = index[edge.node1], index[edge.node2]
+                pairs = ((i, j), (j, i))
+            for i, j in pairs:
+                out_bits[i] |= 1 << j
+                in_bits[j] |= 1 << i
+        self.out_bits = out_bits
+        self.in_bits = in_bits
+        self._all_bits = None
+    
+    def __len__(self):
+        return len(self.node_list)
+    
+    def all_bits(self):
+        """Všichni sousedé bez ohledu na směr (U) - jako Graph.get_all_neighbors."""
+        if self._all_bits is None:
+            self._all_bits = [out | inc for out, inc in zip(self.out_bits, self.in_bits)]
+        return self._all_bits
+    
+    def full_mask(self):
+        """Množina všech uzlů."""
+        return (1 << len(self.node_list)) - 1
+    
+    def names(self, bits):
+        """Převede bitovou množinu na seznam uzlů."""
+        return [self.node_list[i] for i in iter_bits(bits)]
+    
+    def has_edge(self, source, target):
+        """Vede hrana ze source do target (neorientovaná v obou směrech)?"""
+        return bool(self.out_bits[self.node_index[source]] >> self.node_index[target] & 1)
+    
+    def common_neighbors(self, node1, node2):
+        """
+        Společní sousedé dvou uzlů (bez ohledu na směr hran).
+        
+        Returns:
+            int: Bitová množina společných sousedů
+        """
+        neighbors = self.all_bits()
+        return neighbors[self.node_index[node1]] & neighbors[self.node_index[node2]]
+    
+    def common_neighbor_count(self, node1, node2):
+        """Počet společných sousedů dvou uzlů."""
+        return self.common_neighbors(node1, node2).bit_count()
+    
+    def reachable(self, start, reverse=False):
+        """
+        Uzly dosažitelné ze start (včetně start) po směru hran.
+        
+        Fronta BFS je bitová množina - celá vlna se rozšíří jedním
+        sjednocením množin sousedů.
+        
+        Args:
+            start (str): Počáteční uzel
+            reverse (bool): Proti směru hran (uzly, ze kterých lze dojít do start)
+        
+        Returns:
+            int: Bitová množina dosažitelných uzlů
+        """
+        rows = self.in_bits if reverse else self.out_bits
+        reached = frontier = 1 << self.node_index[start]
+        while frontier:
+            following = 0
+            for i in iter_bits(frontier):
+                following |= rows[i]
+            frontier = following & ~reached
+            reached |= frontier
+        return reached
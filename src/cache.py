@@ -0,0 +1,372 @@
+"""
+Omezená cache matic s odhadem velikosti a odkládáním na disk.
+
+Položky se klíčují (verze grafu, druh matice, parametry). Při překročení
+paměťového rozpočtu se nejdéle nepoužité matice (LRU) neztrácejí, ale
+zapíší se do dočasného souboru a dál se čtou přes mmap po řádcích.
+"""
+
+import mmap
+import sys
+import tempfile
+from array import array
+from collections import OrderedDict
+
+from .matrices import NamedMatrix, label_position
+
+
+# Výchozí paměťový rozpočet cache (v bajtech)
+DEFAULT_CACHE_BUDGET = 256 * 1024 * 1024
+
+# Druhy hodnot v odložené matici se smíšenými int/float/None
+_KIND_FLOAT = 0
+_KIND_INT = 1
+_KIND_NONE = 2
+
+
+def matrix_nbytes(matrix):
+    """
+    Odhad paměti zabrané maticí (seznamy řádků + hodnoty buněk).
+    
+    Velikost hodnot se odhaduje z prvního řádku, aby odhad zůstal O(n).
+    
+    Args:
+        matrix: NamedMatrix nebo 2D seznam
+    
+    Returns:
+        int: Odhad velikosti v bajtech
+    """
+    if isinstance(matrix, MappedMatrix):
+        return sys.getsizeof(matrix)
+    
+    data = matrix.raw() if isinstance(matrix, NamedMatrix) else matrix
+    if hasattr(data, 'nbytes'):
+        # Typovaná pole (matice délek a předchůdců) znají svou velikost přesně
+        return data.nbytes()
+    if not data:
+        return sys.getsizeof(data)
+    
+    size = sys.getsizeof(data) + sum(sys.getsizeof(row) for row in data)
+    first = data[0]
+    if first:
+        # Malá celá čísla a None jsou sdílené objekty - nepočítáme je
+        per_cell = sum(sys.getsizeof(v) for v in first
+                       if not (v is None or (isinstance(v, int) and -5 <= v <= 256))) / len(first)
+        size += int(per_cell * len(first) * len(data))
+    return size
+
+
+def _encode(data, labels):
+    """
+    Zvolí kompaktní kódování matice pro zápis na disk.
+    
+    Returns:
+        tuple: (typecode, kódování) nebo None, pokud matici nelze odložit
+               kódování: 'int', 'float', 'mixed' nebo 'label'
+    """
+    has_int = has_float = has_none = has_label = big_int = False
+    label_set = set(labels)
+    for row in data:
+        for value in row:
+            if value is None:
+                has_none = True
+            elif isinstance(value, bool):
+                return None
+            elif isinstance(value, int):
+                has_int = True
+                # Větší celá čísla nelze přesně uložit jako double
+                big_int = big_int or abs(value) > 2 ** 53
+            elif isinstance(value, float):
+                has_float = True
+            elif value in label_set:
+                has_label = True
+            else:
+                return None
+    
+    if has_label:
+        if has_int or has_float:
+            return None
+        return 'i', 'label'
+    if has_none or (has_int and has_float):
+        if big_int:
+            return None
+        return 'd', 'mixed'
+    if has_float:
+        return 'd', 'float'
+    return 'q', 'int'
+
+
+class _MappedRows:
+    """Líná sekvence řádků čtená z mmap - řádek se dekóduje až při přístupu."""
+    
+    def __init__(self, buffer, n_rows, n_cols, typecode, encoding, labels, kinds_offset):
+        self._buffer = buffer
+        self._n_rows = n_rows
+        self._n_cols = n_cols
+        self._typecode = typecode
+        self._itemsize = array(typecode).itemsize
+        self._encoding = encoding
+        self._labels = labels
+        self._kinds_offset = kinds_offset
+    
+    def __len__(self):
+        return self._n_rows
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._n_rows))]
+        if i < 0:
+            i += self._n_rows
+        if not 0 <= i < self._n_rows:
+            raise IndexError("Index řádku mimo rozsah")
+        
+        row_bytes = self._n_cols * self._itemsize
+        start = i * row_bytes
+        values = memoryview(self._buffer)[start:start + row_bytes].cast(self._typecode).tolist()
+        
+        if self._encoding == 'label':
+            labels = self._labels
+            return [labels[v] if v >= 0 else None for v in values]
+        if self._encoding == 'mixed':
+            offset = self._kinds_offset + i * self._n_cols
+            kinds = self._buffer[offset:offset + self._n_cols]
+            return [None if kind == _KIND_NONE else int(v) if kind == _KIND_INT else v
+                    for v, kind in zip(values, kinds)]
+        return values
+    
+    def __iter__(self):
+        for i in range(self._n_rows):
+            yield self[i]
+    
+    def cell(self, i, j):
+        """Dekóduje jediný prvek [i][j] bez dekódování celého řádku."""
+        if i < 0:
+            i += self._n_rows
+        if j < 0:
+            j += self._n_cols
+        if not (0 <= i < self._n_rows and 0 <= j < self._n_cols):
+            raise IndexError("Index prvku mimo rozsah")
+        
+        position = i * self._n_cols + j
+        start = position * self._itemsize
+        value = memoryview(self._buffer)[start:start + self._itemsize].cast(self._typecode)[0]
+        
+        if self._encoding == 'label':
+            return self._labels[value] if value >= 0 else None
+        if self._encoding == 'mixed':
+            kind = self._buffer[self._kinds_offset + position]
+            return None if kind == _KIND_NONE else int(value) if kind == _KIND_INT else value
+        return value
+
+
+class MappedMatrix(NamedMatrix):
+    """
+    NamedMatrix odložená do dočasného souboru a čtená přes mmap.
+    
+    Řádky se dekódují až při přístupu, v paměti zůstávají jen popisky.
+    """
+    
+    def __init__(self, matrix):
+        """
+        Args:
+            matrix (NamedMatrix): Matice k odložení
+        
+        Raises:
+            ValueError: Pokud matice obsahuje hodnoty, které nelze kódovat
+        """
+        data = matrix.raw()
+        row_labels = matrix.row_labels()
+        col_labels = matrix.col_labels()
+        
+        encoded = _encode(data, row_labels)
+        if encoded is None:
+            raise ValueError("Matici nelze odložit na disk")
+        typecode, encoding = encoded
+        
+        n_rows = len(data)
+        n_cols = len(data[0]) if data else 0
+        label_index = {label: i for i, label in enumerate(row_labels)}
+        
+        self._file = tempfile.TemporaryFile()
+        for row in data:
+            if encoding == 'label':
+                packed = array(typecode, (label_index[v] if v is not None else -1 for v in row))
+            elif encoding == 'mixed':
+                packed = array(typecode, (0.0 if v is None else float(v) for v in row))
+            else:
+                packed = array(typecode, row)
+            self._file.write(packed.tobytes())
+        
+        kinds_offset = self._file.tell()
+        if encoding == 'mixed':
+            for row in data:
+                self._file.write(bytes(
+                    _KIND_NONE if v is None else _KIND_INT if isinstance(v, int) else _KIND_FLOAT
+                    for v in row
+                ))
+        self._file.flush()
+        
+        if self._file.tell() > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._mmap = b''
+        
+        rows = _MappedRows(self._mmap, n_rows, n_cols, typecode, encoding, row_labels, kinds_offset)
+        super().__init__(rows, row_labels, col_labels)
+    
+    def get(self, row, col):
+        """Získá hodnotu na pozici [row][col] - čte jen jeden prvek z disku."""
+        i = label_position(row, self._row_index, 'Řádek')
+        j = label_position(col, self._col_index, 'Sloupec')
+        return self._data.cell(i, j)
+    
+    def close(self):
+        """Uvolní mmap a smaže dočasný soubor."""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+    
+    def __repr__(self):
+        return f"MappedMatrix({len(self._data)}×{len(self._col_labels)})"
+
+
+class MatrixCache:
+    """
+    LRU cache matic s paměťovým rozpočtem.
+    
+    Použití:
+        cache = MatrixCache(budget=64 * 1024 * 1024)
+        key = (graph.version, 'power', (('power', 8),))
+        matrix = cache.get(key)
+        if matrix is None:
+            matrix = cache.put(key, builder_result)
+    """
+    
+    def __init__(self, budget=DEFAULT_CACHE_BUDGET, on_evict=None):
+        """
+        Args:
+            budget (int): Maximální odhadovaná velikost matic v paměti (bajty)
+            on_evict (callable): Volá se s klíčem položky, kterou cache kvůli
+                                 rozpočtu odložila na disk nebo zahodila - další
+                                 vlastník dat (např. MatrixBuilder.release) pak
+                                 musí své odkazy uvolnit, jinak paměť zůstane obsazená
+        """
+        self.budget = budget
+        self.on_evict = on_evict
+        self._entries = OrderedDict()  # {klíč: (matice, velikost v paměti)}
+        self._memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.spills = 0
+    
+    def get(self, key):
+        """
+        Vrací matici z cache (a označí ji jako naposledy použitou).
+        
+        Returns:
+            NamedMatrix nebo None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    
+    def put(self, key, matrix):
+        """
+        Uloží matici do cache a případně odloží starší položky na disk.
+        
+        Returns:
+            NamedMatrix: Uložená matice
+        """
+        self.discard(key)
+        size = matrix_nbytes(matrix)
+        self._entries[key] = (matrix, size)
+        self._memory += size
+        self._evict(keep=key)
+        return matrix
+    
+    def discard(self, key):
+        """Odebere položku z cache (a smaže případný soubor na disku)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        matrix, size = entry
+        self._memory -= size
+        if isinstance(matrix, MappedMatrix):
+            matrix.close()
+    
+    def retain(self, predicate):
+        """
+        Ponechá jen položky, pro jejichž klíč platí predicate(klíč).
+        
+        Args:
+            predicate (callable): Funkce klíč -> bool
+        """
+        for key in [key for key in self._entries if not predicate(key)]:
+            self.discard(key)
+    
+    def rekey(self, mapping):
+        """
+        Přejmenuje klíče položek (např. při přechodu na novou verzi grafu).
+        
+        Args:
+            mapping (callable): Funkce starý klíč -> nový klíč nebo None (= zahodit)
+        """
+        entries = list(self._entries.items())
+        self._entries.clear()
+        for key, entry in entries:
+            new_key = mapping(key)
+            if new_key is None:
+                self._memory -= entry[1]
+                if isinstance(entry[0], MappedMatrix):
+                    entry[0].close()
+            else:
+                self._entries[new_key] = entry
+    
+    def clear(self):
+        """Vyprázdní cache."""
+        self.retain(lambda key: False)
+    
+    def keys(self):
+        """Klíče položek od nejdéle nepoužité."""
+        return list(self._entries)
+    
+    def memory_usage(self):
+        """Odhad paměti zabrané maticemi v paměti (bajty)."""
+        return self._memory
+    
+    def _evict(self, keep=None):
+        """
+        Odkládá nejdéle nepoužité matice, dokud se cache nevejde do rozpočtu.
+        
+        Po každé odložené nebo zahozené položce volá on_evict(klíč).
+        """
+        for key in list(self._entries):
+            if self._memory <= self.budget:
+                break
+            matrix, size = self._entries[key]
+            if key == keep or isinstance(matrix, MappedMatrix):
+                continue
+            
+            try:
+                spilled = MappedMatrix(matrix)
+            except (ValueError, OverflowError, OSError):
+                # Nelze odložit - matici zahodíme
+                self.discard(key)
+            else:
+                spilled_size = matrix_nbytes(spilled)
+                self._entries[key] = (spilled, spilled_size)
+                self._memory += spilled_size - size
+                self.spills += 1
+            
+            if self.on_evict is not None:
+                self.on_evict(key)
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, key):
+        return key in self._entries
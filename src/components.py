@@ -0,0 +1,72 @@
+"""
+Komponenty silné souvislosti nad grafem zadaným seznamy následníků.
+
+Sdílí je matice dosažitelnosti (MatrixBuilder) i stažené pohledy
+pro kreslení (views.condensed_graph).
+"""
+
+
+def strong_components(successors):
+    """
+    Komponenty silné souvislosti - iterativní Tarjanův algoritmus.
+    
+    Args:
+        successors (list): Následníci každého uzlu jako indexy
+    
+    Returns:
+        tuple: (komponenta každého uzlu, seznam komponent jako seznamů uzlů)
+               Komponenty jsou v opačném topologickém pořadí - každá
+               následuje až po všech komponentách, do kterých vedou její hrany.
+    """
+    n = len(successors)
+    order = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack = []
+    component = [-1] * n
+    components = []
+    counter = 0
+    
+    for root in range(n):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, 0)]
+        
+        while work:
+            v, position = work[-1]
+            neighbors = successors[v]
+            if position < len(neighbors):
+                work[-1] = (v, position + 1)
+                w = neighbors[position]
+                if order[w] == -1:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, 0))
+                elif on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+                continue
+            
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+            if low[v] == order[v]:
+                # v je kořen komponenty - vyjmeme ji ze zásobníku
+                members = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component[w] = len(components)
+                    members.append(w)
+                    if w == v:
+                        break
+                components.append(members)
+    
+    return component, components
@@ -0,0 +1,201 @@
+"""
+Blokový Floyd-Warshall nad typovanými poli s paralelním zpracováním bloků.
+
+Pivoty se zpracovávají po blocích K velikosti `block`. V každé fázi:
+    1. řádky bloku K se zrelaxují přes pivoty K (diagonální a řádkové dlaždice),
+    2. ostatní pásy řádků I (dlaždice sloupce K i zbytek) už závisí jen
+       na hotových řádcích K, takže se dají zpracovat nezávisle a paralelně.
+
+Dlaždice jsou pásy přes celou šířku matice - v čistém Pythonu je vnitřní
+smyčka přes souvislý řádek to nejrychlejší, co lze udělat, a úlohy pro
+procesy zůstávají malé (jen rozsah řádků a pivotů). Data sdílí procesy
+přes multiprocessing.shared_memory, takže se mezi fázemi nic nekopíruje.
+
+Při shodných délkách cest může blokové pořadí vybrat jiného (stejně
+dobrého) předchůdce než klasický Floyd-Warshall.
+"""
+
+from array import array
+
+
+# Výchozí velikost bloku pivotů
+DEFAULT_BLOCK = 64
+
+# Sdílená data v pracovním procesu: (sdílené paměti, řádky vzdáleností, řádky předchůdců)
+_worker_state = None
+
+
+def relax_rows(dist, pred, rows, pivots):
+    """
+    Relaxace řádků `rows` přes pivoty `pivots` (v daném pořadí).
+    
+    Pro rows = všechny řádky a jeden pivot k je to jeden krok klasického
+    Floyd-Warshalla.
+    
+    Args:
+        dist: Řádky vzdáleností (array nebo memoryview 'd')
+        pred: Řádky předchůdců (array nebo memoryview 'i')
+        rows (range): Relaxované řádky
+        pivots (range): Pivoty k
+    """
+    INF = float('inf')
+    n = len(dist)
+    for k in pivots:
+        dist_k = dist[k]
+        pred_k = pred[k]
+        for i in rows:
+            dist_i = dist[i]
+            d_ik = dist_i[k]
+            if d_ik == INF:
+                continue
+            pred_i = pred[i]
+            for j in range(n):
+                new_dist = d_ik + dist_k[j]
+                if new_dist < dist_i[j]:
+                    dist_i[j] = new_dist
+                    pred_i[j] = pred_k[j]
+
+
+def _shared_rows(buffer, typecode, n):
+    """Rozdělí sdílenou paměť na řádky (memoryview bez kopírování)."""
+    flat = buffer.cast(typecode)
+    return [flat[i * n:(i + 1) * n] for i in range(n)]
+
+
+def _attach_worker(dist_name, pred_name, n):
+    """Inicializace pracovního procesu - připojení ke sdílené paměti."""
+    global _worker_state
+    from multiprocessing import shared_memory
+    
+    dist_shm = shared_memory.SharedMemory(name=dist_name)
+    pred_shm = shared_memory.SharedMemory(name=pred_name)
+    _worker_state = (
+        (dist_shm, pred_shm),
+        _shared_rows(dist_shm.buf, 'd', n),
+        _shared_rows(pred_shm.buf, 'i', n),
+    )
+
+
+def _relax_strip(start, stop, k_start, k_stop):
+    """Úloha pracovního procesu - relaxace jednoho pásu řádků."""
+    _, dist, pred = _worker_state
+    relax_rows(dist, pred, range(start, stop), range(k_start, k_stop))
+    return stop - start
+
+
+def _phases(n, block):
+    """Bloky pivotů jako dvojice (začátek, konec)."""
+    return [(k, min(k + block, n)) for k in range(0, n, block)]
+
+
+def extract_workers_option(argv):
+    """
+    Vyjme z argumentů volbu --workers <n> (počet procesů pro Floyd-Warshall).
+    
+    Args:
+        argv (list): Argumenty příkazové řádky
+    
+    Returns:
+        tuple: (zbylé argumenty, počet procesů - bez volby 1)
+    
+    Raises:
+        ValueError: Pokud volbě chybí hodnota nebo hodnota není kladné celé číslo
+    """
+    rest = []
+    workers = 1
+    i = 0
+    while i < len(argv):
+        if argv[i] != '--workers':
+            rest.append(argv[i])
+            i += 1
+            continue
+        if i + 1 >= len(argv):
+            raise ValueError("Volba --workers vyžaduje hodnotu")
+        try:
+            workers = int(argv[i + 1])
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            raise ValueError(f"Počet procesů musí být kladné celé číslo, ne '{argv[i + 1]}'")
+        i += 2
+    return rest, workers
+
+
+def parallel_floyd_warshall(dist, pred, workers, block=DEFAULT_BLOCK, progress=None):
+    """
+    Blokový Floyd-Warshall s pásy řádků rozdělenými mezi procesy.
+    
+    Vstupní řádky se zkopírují do sdílené paměti, po výpočtu se výsledek
+    zkopíruje zpět (obojí O(n²) memcpy).
+    
+    Args:
+        dist (list): Řádky array('d') s počátečními vzdálenostmi
+        pred (list): Řádky array('i') s počátečními předchůdci
+        workers (int): Počet pracovních procesů
+        block (int): Velikost bloku pivotů
+        progress (Progress): Volitelný token průběhu (hlásí se po každém bloku)
+    
+    Raises:
+        ComputationCancelled: Pokud byl výpočet zrušen přes progress
+    """
+    n = len(dist)
+    if n == 0:
+        return
+    
+    # Procesy a sdílená paměť se importují až tady - jejich import (desítky ms)
+    # by jinak platil každý start programu, i když paralelní výpočet nepoužije
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    
+    dist_bytes = array('d').itemsize * n * n
+    pred_bytes = array('i').itemsize * n * n
+    dist_shm = pred_shm = None
+    shared_dist = shared_pred = None
+    try:
+        # Oba segmenty vznikají uvnitř try - když se druhý nepodaří
+        # vytvořit, finally uklidí aspoň první
+        dist_shm = shared_memory.SharedMemory(create=True, size=dist_bytes)
+        pred_shm = shared_memory.SharedMemory(create=True, size=pred_bytes)
+        shared_dist = _shared_rows(dist_shm.buf, 'd', n)
+        shared_pred = _shared_rows(pred_shm.buf, 'i', n)
+        for i in range(n):
+            shared_dist[i][:] = dist[i]
+            shared_pred[i][:] = pred[i]
+        
+        # Pásy řádků pro pracovní procesy - několik na proces kvůli vyvážení;
+        # procesů navíc oproti počtu pásů by se jen zbytečně spouštělo
+        strip = max(block, -(-n // (workers * 4)))
+        workers = min(workers, -(-n // strip))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_worker,
+                                 initargs=(dist_shm.name, pred_shm.name, n)) as pool:
+            for k_start, k_stop in _phases(n, block):
+                if progress is not None:
+                    progress.update(k_start)
+                pivots = range(k_start, k_stop)
+                relax_rows(shared_dist, shared_pred, pivots, pivots)
+                
+                tasks = []
+                for start in range(0, n, strip):
+                    stop = min(start + strip, n)
+                    # Pás bez řádků pivotního bloku (ten je už hotový)
+                    for part_start, part_stop in ((start, min(stop, k_start)),
+                                                  (max(start, k_stop), stop)):
+                        if part_start < part_stop:
+                            tasks.append(pool.submit(_relax_strip, part_start, part_stop,
+                                                     k_start, k_stop))
+                for task in tasks:
+                    task.result()
+        
+        for i in range(n):
+            memoryview(dist[i])[:] = shared_dist[i]
+            memoryview(pred[i])[:] = shared_pred[i]
+    finally:
+        # Pohledy na sdílenou paměť musí zaniknout před jejím zavřením
+        for rows in (shared_dist, shared_pred):
+            if rows is not None:
+                for row in rows:
+                    row.release()
+        for shm in (dist_shm, pred_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
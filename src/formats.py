@@ -0,0 +1,539 @@
+"""
+Zápis a čtení grafů ve formátech DOT, GraphML a seznam hran (CSV).
+
+Zapisovače procházejí graf jen jednou a řádky posílají rovnou do
+bufferovaného souboru - žádný mezilehlý objekt (graphviz.Digraph,
+strom XML) se nestaví, takže i graf s miliony hran se vypíše za pár
+sekund. Čtečky načítají soubor průběžně (řádek po řádku, GraphML přes
+iterparse) a vrací Graph.
+
+Cílem/zdrojem může být cesta k souboru nebo už otevřený textový proud.
+
+Seznam hran neobsahuje izolované uzly ani ohodnocení uzlů - pro úplný
+přenos grafu slouží DOT nebo GraphML.
+"""
+
+import csv
+import functools
+import re
+from contextlib import contextmanager
+
+from .graph import Graph
+from .parser import Edge, Node
+
+
+# Velikost bufferu souborů (v bajtech)
+BUFFER_SIZE = 1 << 20
+
+# Hlavička seznamu hran
+EDGE_LIST_HEADER = ['source', 'target', 'directed', 'weight', 'label']
+
+GRAPHML_NAMESPACE = 'http://graphml.graphdrawing.org/xmlns'
+
+
+# Náhrady znaků v textu a atributech XML (xml.sax.saxutils by přitáhl urllib a http)
+_XML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;',
+                              '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'})
+
+
+def xml_escape(text):
+    """Text bezpečný v obsahu elementu i v atributu XML v uvozovkách."""
+    return text.translate(_XML_ESCAPES)
+
+
+@contextmanager
+def open_output(target):
+    """
+    Textový proud pro zápis - otevře cestu, otevřený proud jen předá.
+    
+    Používají ho zapisovače tohoto modulu i SVG výstup ve visualizer.py.
+    
+    Args:
+        target: Cesta k souboru nebo textový proud
+    """
+    if hasattr(target, 'write'):
+        yield target
+        return
+    with open(target, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as f:
+        yield f
+
+
+@contextmanager
+def open_input(source, mode='r'):
+    """
+    Proud pro čtení - otevře cestu, otevřený proud jen předá.
+    
+    Args:
+        source: Cesta k souboru nebo proud
+        mode (str): Režim otevření cesty ('r' nebo 'rb')
+    """
+    if hasattr(source, 'read'):
+        yield source
+        return
+    if 'b' in mode:
+        with open(source, mode, buffering=BUFFER_SIZE) as f:
+            yield f
+    else:
+        with open(source, mode, encoding='utf-8', newline='', buffering=BUFFER_SIZE) as f:
+            yield f
+
+
+def _endpoints(edge):
+    """Koncové uzly hrany - orientovaná hrana ve směru zdroj -> cíl."""
+    if edge.directed:
+        return edge.source, edge.target
+    return edge.node1, edge.node2
+
+
+class _NodeCollector:
+    """Uzly čteného grafu v pořadí prvního výskytu (deklarace nebo konec hrany)."""
+    
+    def __init__(self):
+        self.nodes = {}
+    
+    def declare(self, identifier, weight=None):
+        """Deklarace uzlu - doplní ohodnocení uzlu, na který už odkázala hrana."""
+        node = self.nodes.get(identifier)
+        if node is None:
+            self.nodes[identifier] = Node(identifier, weight)
+        elif weight is not None:
+            node.weight = weight
+    
+    def reference(self, identifier):
+        """Odkaz z hrany - nedeklarovaný uzel se vytvoří bez ohodnocení."""
+        if identifier not in self.nodes:
+            self.nodes[identifier] = Node(identifier)
+    
+    def graph(self, edges):
+        return Graph(list(self.nodes.values()), edges)
+
+
+def _float_or_none(text, what):
+    """
+    Číslo z textu atributu, prázdný text = None.
+    
+    Raises:
+        ValueError: Pokud text není číslo
+    """
+    if text is None or text == '':
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"{what} není číslo: '{text}'") from None
+
+
+# DOT
+
+def _dot_id(identifier):
+    """Identifikátor v DOT - vždy v uvozovkách."""
+    return '"' + str(identifier).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _dot_attributes(weight, label=None, undirected=False):
+    """Seznam atributů [..] (prázdný řetězec, pokud žádné nejsou)."""
+    parts = []
+    if weight is not None:
+        parts.append(f"weight={weight!r}")
+    if label:
+        parts.append(f"label={_dot_id(label)}")
+    if undirected:
+        parts.append("dir=none")
+    return f" [{', '.join(parts)}]" if parts else ""
+
+
+def write_dot(graph, target, name='G'):
+    """
+    Zapíše graf ve formátu DOT (Graphviz).
+    
+    Graf s aspoň jednou orientovanou hranou je 'digraph' - neorientované
+    hrany v něm mají atribut dir=none. Ohodnocení uzlů a hran je v atributu
+    weight, označení hrany v atributu label.
+    
+    Args:
+        graph (Graph): Graf
+        target: Cesta k souboru nebo textový proud
+        name (str): Název grafu
+    """
+    directed = graph.is_directed()
+    operator = ' -> ' if directed else ' -- '
+    with open_output(target) as f:
+        f.write(f"{'digraph' if directed else 'graph'} {_dot_id(name)} {{\n")
+        f.writelines(f"  {_dot_id(node_id)}{_dot_attributes(node.weight)};\n"
+                     for node_id, node in graph.nodes.items())
+        for edge in graph.edges_list:
+            source, target_node = _endpoints(edge)
+            attributes = _dot_attributes(edge.weight, edge.label,
+                                         undirected=directed and not edge.directed)
+            f.write(f"  {_dot_id(source)}{operator}{_dot_id(target_node)}{attributes};\n")
+        f.write("}\n")
+
+
+# Vzor tokenu DOT - kompiluje se až při prvním čtení (viz _dot_token_pattern),
+# rozsahy Unicode ve třídách znaků stojí při kompilaci několik ms
+_DOT_TOKEN = (r'\s*(?:'
+              r'"((?:[^"\\]|\\.)*)"'                         # řetězec v uvozovkách
+              r'|(->|--|[\[\]{};,=])'                        # operátor
+              r'|([A-Za-z_\u0080-\uffff][\w\u0080-\uffff]*'  # holý identifikátor
+              r'|-?(?:\.\d+|\d+(?:\.\d*)?))'                 # číslo
+              r')')
+
+
+@functools.cache
+def _dot_token_pattern():
+    return re.compile(_DOT_TOKEN)
+
+
+def _dot_tokens(line, line_num):
+    """
+    Tokeny jednoho řádku DOT jako dvojice (druh, text), druh 'id' nebo 'op'.
+    
+    Raises:
+        ValueError: Pokud řádek obsahuje nerozpoznatelný text
+    """
+    match_token = _dot_token_pattern().match
+    tokens = []
+    pos = 0
+    line = line.rstrip()
+    while pos < len(line):
+        match = match_token(line, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Řádek {line_num}: nerozpoznaný text '{line[pos:].strip()}'")
+        quoted, operator, bare = match.groups()
+        if quoted is not None:
+            tokens.append(('id', _dot_unescape(quoted)))
+        elif operator is not None:
+            tokens.append(('op', operator))
+        elif bare is not None:
+            tokens.append(('id', bare))
+        pos = match.end()
+    return tokens
+
+
+def _dot_attribute_list(tokens, i):
+    """
+    Načte seznamy atributů [a=b, ...] začínající tokenem i.
+    
+    Returns:
+        tuple: (dict atributů, index tokenu za seznamy)
+    """
+    attributes = {}
+    while i < len(tokens) and tokens[i] == ('op', '['):
+        i += 1
+        while i < len(tokens) and tokens[i] != ('op', ']'):
+            if tokens[i][0] == 'id' and i + 2 < len(tokens) and tokens[i + 1] == ('op', '='):
+                attributes[tokens[i][1]] = tokens[i + 2][1]
+                i += 3
+            else:
+                i += 1
+        i += 1
+    return attributes, i
+
+
+# Celý řádek s jednou hranou mezi uzly v uvozovkách (tak zapisuje write_dot)
+_DOT_EDGE_LINE = re.compile(r'"((?:[^"\\]|\\.)*)"\s*(->|--)\s*"((?:[^"\\]|\\.)*)"\s*'
+                            r'(\[(?:[^\]"]|"(?:[^"\\]|\\.)*")*\])?\s*;?$')
+
+
+def _dot_unescape(text):
+    """Odstraní zpětná lomítka z řetězce DOT v uvozovkách."""
+    return re.sub(r'\\(.)', r'\1', text) if '\\' in text else text
+
+
+def _add_dot_statement(chain, operators, attributes, line_num, collector, edges):
+    """Zpracuje deklaraci uzlu (bez operátorů) nebo řetězec hran."""
+    weight = _float_or_none(attributes.get('weight'), f"Řádek {line_num}: ohodnocení")
+    if not operators:
+        collector.declare(chain[0], weight)
+        return
+    
+    for identifier in chain:
+        collector.reference(identifier)
+    undirected = attributes.get('dir') == 'none'
+    label = attributes.get('label')
+    for node1, node2, operator in zip(chain, chain[1:], operators):
+        edges.append(Edge(node1, node2, directed=operator == '->' and not undirected,
+                          weight=weight, label=label))
+
+
+def read_dot(source):
+    """
+    Načte graf z formátu DOT.
+    
+    Podporuje podmnožinu DOT, kterou zapisuje write_dot, a běžné ruční
+    zápisy: řetězce hran (a -> b -> c), deklarace uzlů s atributy, atributy
+    weight, label a dir=none. Výchozí atributy (node [..], edge [..]),
+    podgrafy a víceřádkové řetězce se nepodporují. Každý příkaz musí být
+    na jednom řádku.
+    
+    Args:
+        source: Cesta k souboru nebo textový proud
+    
+    Returns:
+        Graph: Načtený graf
+    
+    Raises:
+        ValueError: Pokud soubor není platný DOT nebo ohodnocení není číslo
+    """
+    collector = _NodeCollector()
+    edges = []
+    directed_graph = None
+    with open_input(source) as f:
+        for line_num, line in enumerate(f, 1):
+            stripped = line.strip()
+            if not stripped or stripped.startswith(('//', '#')):
+                continue
+            
+            # Rychlá cesta pro řádky ve tvaru, který zapisuje write_dot
+            match = _DOT_EDGE_LINE.match(stripped) if directed_graph is not None else None
+            if match is not None:
+                node1, operator, node2, attribute_text = match.groups()
+                attributes = {}
+                if attribute_text:
+                    attributes, _ = _dot_attribute_list(_dot_tokens(attribute_text, line_num), 0)
+                _add_dot_statement([_dot_unescape(node1), _dot_unescape(node2)], [operator],
+                                   attributes, line_num, collector, edges)
+                continue
+            
+            tokens = _dot_tokens(stripped, line_num)
+            i = 0
+            while i < len(tokens):
+                kind, text = tokens[i]
+                if directed_graph is None:
+                    # Hlavička: [strict] (graph | digraph) [název] {
+                    if kind == 'id' and text.lower() == 'strict':
+                        i += 1
+                        continue
+                    if kind != 'id' or text.lower() not in ('graph', 'digraph'):
+                        raise ValueError(f"Řádek {line_num}: očekávána hlavička 'graph' nebo 'digraph'")
+                    directed_graph = text.lower() == 'digraph'
+                    while i < len(tokens) and tokens[i] != ('op', '{'):
+                        i += 1
+                    i += 1
+                    continue
+                
+                if kind == 'op':
+                    i += 1
+                    continue
+                
+                # Výchozí atributy a atributy grafu se přeskakují
+                if text in ('node', 'edge', 'graph'):
+                    _, i = _dot_attribute_list(tokens, i + 1)
+                    continue
+                if i + 1 < len(tokens) and tokens[i + 1] == ('op', '='):
+                    _, i = _dot_attribute_list(tokens, i + 3)
+                    continue
+                
+                # Uzel nebo řetězec hran
+                chain = [text]
+                operators = []
+                i += 1
+                while (i + 1 < len(tokens) and tokens[i][0] == 'op' and tokens[i][1] in ('->', '--')
+                       and tokens[i + 1][0] == 'id'):
+                    operators.append(tokens[i][1])
+                    chain.append(tokens[i + 1][1])
+                    i += 2
+                attributes, i = _dot_attribute_list(tokens, i)
+                _add_dot_statement(chain, operators, attributes, line_num, collector, edges)
+    
+    if directed_graph is None:
+        raise ValueError("Soubor neobsahuje graf DOT")
+    return collector.graph(edges)
+
+
+# GraphML
+
+def write_graphml(graph, target):
+    """
+    Zapíše graf ve formátu GraphML.
+    
+    Výchozí směr hran (edgedefault) je podle is_directed(), hrany
+    s opačným směrem mají atribut directed. Ohodnocení uzlů a hran
+    a označení hran jsou v elementech <data>.
+    
+    Args:
+        graph (Graph): Graf
+        target: Cesta k souboru nebo textový proud
+    """
+    directed = graph.is_directed()
+    with open_output(target) as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                f'<graphml xmlns="{GRAPHML_NAMESPACE}">\n'
+                '  <key id="nw" for="node" attr.name="weight" attr.type="double"/>\n'
+                '  <key id="ew" for="edge" attr.name="weight" attr.type="double"/>\n'
+                '  <key id="el" for="edge" attr.name="label" attr.type="string"/>\n'
+                f'  <graph id="G" edgedefault="{"directed" if directed else "undirected"}">\n')
+        for node_id, node in graph.nodes.items():
+            if node.weight is None:
+                f.write(f'    <node id="{xml_escape(str(node_id))}"/>\n')
+            else:
+                f.write(f'    <node id="{xml_escape(str(node_id))}">'
+                        f'<data key="nw">{node.weight!r}</data></node>\n')
+        for edge in graph.edges_list:
+            source, target_node = _endpoints(edge)
+            opening = (f'    <edge source="{xml_escape(str(source))}" '
+                       f'target="{xml_escape(str(target_node))}"')
+            if edge.directed != directed:
+                opening += f' directed="{"true" if edge.directed else "false"}"'
+            data = ''
+            if edge.weight is not None:
+                data += f'<data key="ew">{edge.weight!r}</data>'
+            if edge.label:
+                data += f'<data key="el">{xml_escape(str(edge.label))}</data>'
+            f.write(f'{opening}>{data}</edge>\n' if data else f'{opening}/>\n')
+        f.write('  </graph>\n</graphml>\n')
+
+
+def _local_name(tag):
+    """Název elementu bez jmenného prostoru."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def read_graphml(source):
+    """
+    Načte graf z formátu GraphML (průběžně přes iterparse).
+    
+    Z atributů se čtou klíče s attr.name 'weight' (uzly i hrany)
+    a 'label' (hrany), ostatní se ignorují. Vnořené grafy se nepodporují.
+    
+    Args:
+        source: Cesta k souboru nebo binární/textový proud
+    
+    Returns:
+        Graph: Načtený graf
+    
+    Raises:
+        ValueError: Pokud soubor není platný GraphML nebo ohodnocení není číslo
+    """
+    # ElementTree (a expat) se importuje až při čtení - ostatní formáty ho nepotřebují
+    from xml.etree.ElementTree import iterparse
+    
+    collector = _NodeCollector()
+    edges = []
+    keys = {}            # id klíče -> název atributu
+    directed_default = False
+    seen_graph = False
+    
+    with open_input(source, 'rb') as f:
+        for event, element in iterparse(f, events=('start', 'end')):
+            name = _local_name(element.tag)
+            if event == 'start':
+                if name == 'graph':
+                    if seen_graph:
+                        raise ValueError("Vnořené grafy GraphML nejsou podporované")
+                    seen_graph = True
+                    directed_default = element.get('edgedefault') == 'directed'
+                continue
+            
+            if name == 'key':
+                keys[element.get('id')] = element.get('attr.name')
+            elif name in ('node', 'edge'):
+                values = {keys.get(data.get('key')): data.text
+                          for data in element if _local_name(data.tag) == 'data'}
+                if name == 'node':
+                    collector.declare(element.get('id'),
+                                      _float_or_none(values.get('weight'), "Ohodnocení uzlu"))
+                else:
+                    node1, node2 = element.get('source'), element.get('target')
+                    if node1 is None or node2 is None:
+                        raise ValueError("Hrana GraphML bez atributu source nebo target")
+                    collector.reference(node1)
+                    collector.reference(node2)
+                    directed = element.get('directed')
+                    edges.append(Edge(node1, node2,
+                                      directed=directed_default if directed is None else directed == 'true',
+                                      weight=_float_or_none(values.get('weight'), "Ohodnocení hrany"),
+                                      label=values.get('label')))
+                element.clear()
+    
+    if not seen_graph:
+        raise ValueError("Soubor neobsahuje element <graph>")
+    return collector.graph(edges)
+
+
+# Seznam hran
+
+def write_edge_list(graph, target, delimiter=',', header=True):
+    """
+    Zapíše hrany jako seznam (CSV): source, target, directed, weight, label.
+    
+    directed je 1/0, chybějící ohodnocení a označení jsou prázdné.
+    Orientovaná hrana je vždy zapsaná ve směru zdroj -> cíl.
+    
+    Args:
+        graph (Graph): Graf
+        target: Cesta k souboru nebo textový proud
+        delimiter (str): Oddělovač sloupců (',' pro CSV, '\\t' nebo ' ' pro prostý seznam)
+        header (bool): Zapsat hlavičku
+    """
+    def rows():
+        for edge in graph.edges_list:
+            source, target_node = _endpoints(edge)
+            yield (source, target_node, 1 if edge.directed else 0,
+                   '' if edge.weight is None else repr(edge.weight),
+                   edge.label or '')
+    
+    with open_output(target) as f:
+        writer = csv.writer(f, delimiter=delimiter, lineterminator='\n')
+        if header:
+            writer.writerow(EDGE_LIST_HEADER)
+        writer.writerows(rows())
+
+
+def read_edge_list(source, delimiter=',', directed=False):
+    """
+    Načte graf ze seznamu hran.
+    
+    Řádek má 2 až 5 sloupců: source, target[, directed[, weight[, label]]].
+    Hlavička (první řádek začínající 'source') se přeskočí, prázdné
+    řádky a řádky začínající '#' také. Uzly vzniknou z konců hran.
+    
+    Args:
+        source: Cesta k souboru nebo textový proud
+        delimiter (str): Oddělovač sloupců (None = mezera, tedy prostý seznam
+                         tak, jak ho zapíše write_edge_list(delimiter=' ') -
+                         včetně prázdných sloupců a uvozovek)
+        directed (bool): Orientace hran bez sloupce directed
+    
+    Returns:
+        Graph: Načtený graf
+    
+    Raises:
+        ValueError: Pokud řádek nemá aspoň dva sloupce nebo ohodnocení není číslo
+    """
+    collector = _NodeCollector()
+    nodes = collector.nodes
+    edges = []
+    append = edges.append
+    false_values = ('0', 'false', 'False')
+    with open_input(source) as f:
+        rows = csv.reader(f, delimiter=' ' if delimiter is None else delimiter)
+        for line_num, row in enumerate(rows, 1):
+            if not row or not row[0] or row[0][0] == '#':
+                continue
+            if line_num == 1 and row[0] == EDGE_LIST_HEADER[0]:
+                continue
+            columns = len(row)
+            if columns < 2:
+                raise ValueError(f"Řádek {line_num}: hrana potřebuje aspoň dva sloupce")
+            
+            # Odkazy na uzly bez volání collector.reference - jde o nejčastější řádek souboru
+            node1, node2 = row[0], row[1]
+            if node1 not in nodes:
+                nodes[node1] = Node(node1)
+            if node2 not in nodes:
+                nodes[node2] = Node(node2)
+            if columns == 2:
+                append(Edge(node1, node2, directed=directed))
+                continue
+            
+            edge_directed = directed if row[2] == '' else row[2] not in false_values
+            weight = None
+            if columns > 3 and row[3] != '':
+                try:
+                    weight = float(row[3])
+                except ValueError:
+                    raise ValueError(f"Řádek {line_num}: ohodnocení není číslo: '{row[3]}'") from None
+            label = row[4] or None if columns > 4 else None
+            append(Edge(node1, node2, directed=edge_directed, weight=weight, label=label))
+    return collector.graph(edges)
@@ -4,50 +4,344 @@ Třída Graph pro reprezentaci grafu a základní operace.
 
 from collections import defaultdict, deque
 
+from .binary_tree import BinaryTree
+from .bitsets import BitsetAdjacency, is_dense
+from .parser import Edge, GraphParser, Node
+from .profiling import profiled
+
+
+# Maximální délka záznamu změn - starší změny už nelze přehrát inkrementálně
+CHANGE_LOG_SIZE = 10000
+
+# Typy změn v záznamu změn grafu
+ADD_NODE = 'add_node'
+REMOVE_NODE = 'remove_node'
+ADD_EDGE = 'add_edge'
+REMOVE_EDGE = 'remove_edge'
+REWEIGHT_EDGE = 'reweight_edge'
+
 
 class Graph:
     """Reprezentace grafu s uzly a hranami."""
     
-    def __init__(self, nodes, edges, is_binary_tree=False):
+    @profiled()
+    def __init__(self, nodes, edges, is_binary_tree=False, tree=None):
         """
         Args:
             nodes (list): Seznam Node objektů
             edges (list): Seznam Edge objektů
             is_binary_tree (bool): True pokud je to binární strom
+            tree (BinaryTree): Už sestavený strom (viz from_tree) - strom se
+                               pak znovu nesestavuje z uzlů
         """
+        # Binární strom: pozice uzlů v souboru určují hrany rodič - potomek
+        self.tree = tree
+        if is_binary_tree and tree is None:
+            try:
+                self.tree = BinaryTree.from_nodes(nodes)
+            except ValueError as e:
+                print(f"Varování: Uzly netvoří binární strom v haldovém rozložení: {e}")
+            else:
+                if not edges:
+                    _, edges = self.tree.to_graph_input()
+        
         self.raw_nodes = nodes
         self.raw_edges = edges
         self.is_binary_tree = is_binary_tree
         
         # Filtrujeme hvězdičky (vynechané uzly)
         self.nodes = {node.identifier: node for node in nodes if node.identifier != '*'}
-        
-        # Seznamy sousedů pro rychlejší přístup
-        self.adjacency_list = defaultdict(list)  # {node: [(neighbor, edge), ...]}
-        self.in_neighbors = defaultdict(list)    # Pro orientované grafy
-        self.out_neighbors = defaultdict(list)   # Pro orientované grafy
+        self._init_indexes()
         
         # Procházíme hrany a budujeme seznamy
-        self.edges_list = []
         for edge in edges:
             # Kontrola, že uzly existují
             if edge.node1 not in self.nodes or edge.node2 not in self.nodes:
                 print(f"Varování: Hrana odkazuje na neexistující uzel: {edge}")
                 continue
             
-            self.edges_list.append(edge)
+            self._link_edge(edge)
+    
+    def _init_indexes(self):
+        """Prázdné seznamy sousedů, indexy hran a záznam změn."""
+        # Verze grafu - zvyšuje se při každé změně (add_edge, remove_edge, ...)
+        self.version = 0
+        # Záznam změn: (verze, typ změny, data) - pro inkrementální aktualizace cache
+        self._changes = deque(maxlen=CHANGE_LOG_SIZE)
+        
+        # Seznamy sousedů pro rychlejší přístup
+        self.adjacency_list = defaultdict(list)  # {node: [(neighbor, edge), ...]}
+        self.in_neighbors = defaultdict(list)    # Pro orientované grafy
+        self.out_neighbors = defaultdict(list)   # Pro orientované grafy
+        
+        # Indexy hran: označení -> [hrany], dvojice uzlů -> [hrany]
+        # (klíč dvojice viz _edge_key) a počet dvojic s více hranami
+        self._label_index = defaultdict(list)
+        self._pair_index = defaultdict(list)
+        self._multi_pairs = 0
+        
+        # Bitová reprezentace sousedství - sestaví se líně (viz bitsets)
+        self._bitsets = None
+        
+        # Seznam hran (viz edges_list): odebraná hrana v něm nechá náhrobek
+        # None, pozice hran podle id(hrana) se sestaví až při prvním odebrání
+        self._edges = []
+        self._edge_pos = None
+        self._tombstones = 0
+    
+    @property
+    def edges_list(self):
+        """
+        Seznam hran v pořadí přidání (jen pro čtení).
+        
+        Odebrání hrany jen označí její pozici náhrobkem v O(1), náhrobky
+        se vyčistí jedním průchodem až při dalším čtení seznamu - dávka
+        k odebrání (např. rozdílové načtení) tak stojí O(k + m), ne O(k·m).
+        """
+        if self._tombstones:
+            self._compact_edges()
+        return self._edges
+    
+    def _compact_edges(self):
+        """Odstraní náhrobky ze seznamu hran (na místě) a přepočítá pozice."""
+        edges = self._edges
+        edges[:] = [edge for edge in edges if edge is not None]
+        self._tombstones = 0
+        if self._edge_pos is not None:
+            self._edge_pos = {id(edge): i for i, edge in enumerate(edges)}
+    
+    @classmethod
+    @profiled()
+    def from_tree(cls, tree, directed=False):
+        """
+        Graf z binárního stromu sestavený přímo z polí haldy.
+        
+        Seznamy sousedů a index dvojic se plní jedním průchodem obsazenými
+        pozicemi - bez mezilehlých seznamů z to_graph_input, bez kontroly
+        existence uzlů a bez obecného _link_edge. Objekty Node a Edge
+        vzniknou jen ty, které graf drží (seznamy sousedů obsahují hrany).
+        
+        Args:
+            tree (BinaryTree): Strom (např. z BinaryTree.from_file)
+            directed (bool): Orientovat hrany od rodiče k potomkovi
+        
+        Returns:
+            Graph: Graf stromu s graph.tree = tree
+        """
+        graph = cls.__new__(cls)
+        graph.tree = tree
+        graph.is_binary_tree = True
+        graph.nodes = nodes = {}
+        graph._init_indexes()
+        
+        labels = tree.labels
+        raw_nodes = []
+        edges = graph._edges
+        adjacency = graph.adjacency_list
+        pair_index = graph._pair_index
+        for i in tree.level_order():
+            child = labels[i]
+            # Opakovaný popisek přepíše uzel stejně jako v __init__
+            node = nodes[child] = Node(child, tree.weight(i))
+            raw_nodes.append(node)
+            if i == 0:
+                continue
             
-            if edge.directed:
-                # Orientovaná hrana
-                source = edge.source
-                target = edge.target
-                self.out_neighbors[source].append((target, edge))
-                self.in_neighbors[target].append((source, edge))
-                self.adjacency_list[source].append((target, edge))
+            parent = labels[(i - 1) // 2]
+            edge = Edge(parent, child, directed)
+            edges.append(edge)
+            adjacency[parent].append((child, edge))
+            if directed:
+                graph.out_neighbors[parent].append((child, edge))
+                graph.in_neighbors[child].append((parent, edge))
+                key = (parent, child)
             else:
-                # Neorientovaná hrana
-                self.adjacency_list[edge.node1].append((edge.node2, edge))
-                self.adjacency_list[edge.node2].append((edge.node1, edge))
+                adjacency[child].append((parent, edge))
+                key = (child, parent) if child < parent else (parent, child)
+            # Opakované popisky mohou dát paralelní hrany
+            parallel = pair_index[key]
+            parallel.append(edge)
+            if len(parallel) == 2:
+                graph._multi_pairs += 1
+        
+        graph.raw_nodes = raw_nodes
+        graph.raw_edges = list(edges)
+        return graph
+    
+    def _link_edge(self, edge):
+        """Zařadí hranu do seznamu hran, seznamů sousedů a indexů hran."""
+        if self._edge_pos is not None:
+            self._edge_pos[id(edge)] = len(self._edges)
+        self._edges.append(edge)
+        
+        if edge.label is not None:
+            self._label_index[edge.label].append(edge)
+        parallel = self._pair_index[_edge_key(edge)]
+        parallel.append(edge)
+        if len(parallel) == 2:
+            self._multi_pairs += 1
+        
+        if edge.directed:
+            # Orientovaná hrana
+            source = edge.source
+            target = edge.target
+            self.out_neighbors[source].append((target, edge))
+            self.in_neighbors[target].append((source, edge))
+            self.adjacency_list[source].append((target, edge))
+        else:
+            # Neorientovaná hrana
+            self.adjacency_list[edge.node1].append((edge.node2, edge))
+            self.adjacency_list[edge.node2].append((edge.node1, edge))
+    
+    def _unlink_edge(self, edge):
+        """Odebere hranu ze seznamu hran, seznamů sousedů a indexů hran."""
+        if self._edge_pos is None:
+            self._edge_pos = {id(e): i for i, e in enumerate(self._edges) if e is not None}
+        self._edges[self._edge_pos.pop(id(edge))] = None
+        self._tombstones += 1
+        
+        if edge.label is not None:
+            _remove_identical(self._label_index, edge.label, edge)
+        key = _edge_key(edge)
+        if len(self._pair_index[key]) == 2:
+            self._multi_pairs -= 1
+        _remove_identical(self._pair_index, key, edge)
+        
+        if edge.directed:
+            _remove_entry(self.out_neighbors, edge.source, edge)
+            _remove_entry(self.in_neighbors, edge.target, edge)
+            _remove_entry(self.adjacency_list, edge.source, edge)
+        else:
+            _remove_entry(self.adjacency_list, edge.node1, edge)
+            if edge.node1 != edge.node2:
+                _remove_entry(self.adjacency_list, edge.node2, edge)
+            else:
+                # Neorientovaná smyčka je v seznamu sousedů dvakrát
+                _remove_entry(self.adjacency_list, edge.node1, edge)
+    
+    def _record(self, change, data):
+        """Zvýší verzi grafu a zapíše změnu do záznamu změn."""
+        self.version += 1
+        self._changes.append((self.version, change, data))
+    
+    def changes_since(self, version):
+        """
+        Vrací změny provedené od dané verze grafu.
+        
+        Args:
+            version (int): Verze, ke které má volající aktuální data
+            
+        Data změn podle typu:
+            ADD_NODE, REMOVE_NODE: identifikátor uzlu
+            ADD_EDGE, REMOVE_EDGE: (hrana, váha v okamžiku změny)
+            REWEIGHT_EDGE: (hrana, původní váha, nová váha)
+        
+        Returns:
+            list: Seznam (verze, typ změny, data) nebo None, pokud starší
+                  změny už nejsou v záznamu (nutný úplný přepočet)
+        """
+        if version == self.version:
+            return []
+        if version > self.version or not self._changes or self._changes[0][0] > version + 1:
+            return None
+        return [change for change in self._changes if change[0] > version]
+    
+    def add_node(self, node):
+        """
+        Přidá uzel do grafu.
+        
+        Args:
+            node (Node): Nový uzel
+            
+        Raises:
+            ValueError: Pokud uzel se stejným identifikátorem už existuje
+        """
+        if node.identifier == '*':
+            raise ValueError("Vynechaný uzel '*' nelze přidat do grafu")
+        if node.identifier in self.nodes:
+            raise ValueError(f"Uzel '{node.identifier}' už v grafu existuje")
+        
+        self.nodes[node.identifier] = node
+        self._record(ADD_NODE, node.identifier)
+    
+    def remove_node(self, node_id):
+        """
+        Odebere uzel z grafu včetně všech incidentních hran.
+        
+        Args:
+            node_id (str): Identifikátor uzlu
+            
+        Returns:
+            list: Odebrané incidentní hrany
+            
+        Raises:
+            KeyError: Pokud uzel neexistuje
+        """
+        if node_id not in self.nodes:
+            raise KeyError(f"Uzel '{node_id}' neexistuje v grafu")
+        
+        removed = self.get_incident_edges(node_id)
+        # Orientovaná smyčka je v seznamu incidentních hran dvakrát
+        for edge in dict.fromkeys(removed):
+            self.remove_edge(edge)
+        
+        del self.nodes[node_id]
+        for adjacency in (self.adjacency_list, self.in_neighbors, self.out_neighbors):
+            adjacency.pop(node_id, None)
+        self._record(REMOVE_NODE, node_id)
+        return removed
+    
+    def add_edge(self, edge):
+        """
+        Přidá hranu do grafu.
+        
+        Args:
+            edge (Edge): Nová hrana (oba koncové uzly musí existovat)
+            
+        Raises:
+            KeyError: Pokud některý z koncových uzlů neexistuje
+        """
+        for node_id in (edge.node1, edge.node2):
+            if node_id not in self.nodes:
+                raise KeyError(f"Uzel '{node_id}' neexistuje v grafu")
+        
+        self._link_edge(edge)
+        self._record(ADD_EDGE, (edge, edge.weight))
+    
+    def remove_edge(self, edge):
+        """
+        Odebere hranu z grafu.
+        
+        Args:
+            edge (Edge): Hrana z edges_list (porovnává se identita objektu)
+            
+        Raises:
+            ValueError: Pokud hrana v grafu není
+        """
+        if not self.contains_edge(edge):
+            raise ValueError(f"Hrana {edge} není v grafu")
+        
+        self._unlink_edge(edge)
+        self._record(REMOVE_EDGE, (edge, edge.weight))
+    
+    def set_edge_weight(self, edge, weight):
+        """
+        Změní ohodnocení hrany.
+        
+        Args:
+            edge (Edge): Hrana z edges_list
+            weight (float): Nové ohodnocení (None = bez ohodnocení)
+            
+        Returns:
+            float: Původní ohodnocení
+        """
+        if not self.contains_edge(edge):
+            raise ValueError(f"Hrana {edge} není v grafu")
+        
+        old_weight = edge.weight
+        edge.weight = weight
+        self._record(REWEIGHT_EDGE, (edge, old_weight, weight))
+        return old_weight
     
     def get_node_count(self):
         """Vrací počet uzlů v grafu."""
@@ -61,6 +355,113 @@ class Graph:
         """Kontroluje, zda uzel existuje."""
         return node_id in self.nodes
     
+    def contains_edge(self, edge):
+        """Kontroluje, zda je hrana (tento objekt) v grafu."""
+        return any(e is edge for e in self._pair_index.get(_edge_key(edge), ()))
+    
+    def get_edge_by_label(self, label):
+        """
+        Vrací hranu s daným označením.
+        
+        Args:
+            label (str): Označení hrany
+        
+        Returns:
+            Edge: První hrana s tímto označením nebo None
+        """
+        edges = self._label_index.get(label)
+        return edges[0] if edges else None
+    
+    def get_edges_by_label(self, label):
+        """
+        Vrací všechny hrany s daným označením (označení nemusí být jednoznačná).
+        
+        Args:
+            label (str): Označení hrany
+        
+        Returns:
+            list: Hrany v pořadí přidání
+        """
+        return list(self._label_index.get(label, ()))
+    
+    def edges_between(self, node1, node2):
+        """
+        Vrací všechny hrany mezi dvěma uzly (v obou směrech).
+        
+        Args:
+            node1 (str): Identifikátor prvního uzlu
+            node2 (str): Identifikátor druhého uzlu
+        
+        Returns:
+            list: Neorientované hrany a orientované hrany v obou směrech
+        """
+        edges = list(self._pair_index.get((node1, node2), ()))
+        if node1 != node2:
+            edges.extend(self._pair_index.get((node2, node1), ()))
+        return edges
+    
+    def has_edge(self, source, target):
+        """
+        Kontroluje, zda lze po hraně přejít z uzlu source do uzlu target.
+        
+        Args:
+            source (str): Počáteční uzel
+            target (str): Koncový uzel
+        
+        Returns:
+            bool: True pokud existuje neorientovaná hrana nebo hrana source -> target
+        """
+        return self._first_link(source, target) is not None
+    
+    def _first_link(self, source, target):
+        """První hrana v indexu dvojic, po které lze přejít ze source do target (nebo None)."""
+        for key in ((source, target), (target, source)):
+            for edge in self._pair_index.get(key, ()):
+                if not edge.directed or edge.source == source:
+                    return edge
+        return None
+    
+    def edge_multiplicity(self, node1, node2):
+        """
+        Počet hran mezi dvěma uzly (v obou směrech).
+        
+        Args:
+            node1 (str): Identifikátor prvního uzlu
+            node2 (str): Identifikátor druhého uzlu
+        
+        Returns:
+            int: Počet hran
+        """
+        count = len(self._pair_index.get((node1, node2), ()))
+        if node1 != node2:
+            count += len(self._pair_index.get((node2, node1), ()))
+        return count
+    
+    def successor_counts(self):
+        """
+        Počet různých následníků každého uzlu (bez uzlu samotného).
+        
+        Neorientovaná hrana dává následníka oběma koncovým uzlům. Počítá se
+        jedním průchodem indexem dvojic: klíč (a, b) znamená přechod a -> b,
+        s neorientovanou hranou i b -> a - ten se započte jen tehdy, když ho
+        už nezapočítá klíč (b, a). Paralelní hrany tak nic nezdvojí.
+        
+        Returns:
+            dict: {uzel: počet různých následníků}
+        """
+        counts = dict.fromkeys(self.nodes, 0)
+        pair_index = self._pair_index
+        for (a, b), edges in pair_index.items():
+            if a == b:
+                continue
+            counts[a] += 1
+            for edge in edges:
+                if not edge.directed:
+                    if (b, a) not in pair_index:
+                        counts[b] += 1
+                    break
+        return counts
+    
     def get_neighbors(self, node_id):
         """
         Vrací seznam sousedů uzlu (pro neorientovaný nebo všechny sousedy).
@@ -224,6 +625,60 @@ class Graph:
         
         return degree
     
+    def bitsets(self):
+        """
+        Sousedství jako bitové množiny pro aktuální verzi grafu.
+        
+        Sestaví se při prvním volání a znovu až po změně grafu.
+        
+        Returns:
+            BitsetAdjacency: Bitová reprezentace sousedství
+        """
+        if self._bitsets is None or self._bitsets.version != self.version:
+            self._bitsets = BitsetAdjacency(self)
+        return self._bitsets
+    
+    def is_dense(self):
+        """Kontroluje, zda je graf hustý (viz bitsets.DENSE_THRESHOLD)."""
+        return is_dense(self)
+    
+    def common_neighbors(self, node1, node2):
+        """
+        Společní sousedé dvou uzlů bez ohledu na směr hran.
+        
+        Pro husté grafy se počítá průnikem bitových množin.
+        
+        Args:
+            node1 (str): První uzel
+            node2 (str): Druhý uzel
+            
+        Returns:
+            set: Množina identifikátorů společných sousedů
+        """
+        if node1 not in self.nodes or node2 not in self.nodes:
+            return set()
+        if self.is_dense():
+            bitsets = self.bitsets()
+            return set(bitsets.names(bitsets.common_neighbors(node1, node2)))
+        return self.get_all_neighbors(node1) & self.get_all_neighbors(node2)
+    
+    def common_neighbor_count(self, node1, node2):
+        """
+        Počet společných sousedů dvou uzlů bez ohledu na směr hran.
+        
+        Args:
+            node1 (str): První uzel
+            node2 (str): Druhý uzel
+            
+        Returns:
+            int: Počet společných sousedů
+        """
+        if node1 not in self.nodes or node2 not in self.nodes:
+            return 0
+        if self.is_dense():
+            return self.bitsets().common_neighbor_count(node1, node2)
+        return len(self.get_all_neighbors(node1) & self.get_all_neighbors(node2))
+    
     def is_directed(self):
         """Kontroluje, zda je graf orientovaný."""
         return any(edge.directed for edge in self.edges_list)
@@ -247,19 +702,8 @@ class Graph:
         return False
     
     def has_multiple_edges(self):
-        """Kontroluje, zda graf obsahuje vícenásobné hrany."""
-        edge_set = set()
-        for edge in self.edges_list:
-            if edge.directed:
-                key = (edge.source, edge.target)
-            else:
-                # Pro neorientované hrany normalizujeme pořadí
-                key = tuple(sorted([edge.node1, edge.node2]))
-            
-            if key in edge_set:
-                return True
-            edge_set.add(key)
-        return False
+        """Kontroluje, zda graf obsahuje vícenásobné hrany (dvě hrany se stejným klíčem _edge_key)."""
+        return self._multi_pairs > 0
     
     def bfs(self, start_node):
         """
@@ -320,3 +764,70 @@ class Graph:
         
         return visited
 
+
+
+def load_graph(filepath, parser=None):
+    """
+    Načte graf ze souboru.
+    
+    Soubor jen s příkazy 'u' (binární strom) se načte jako v BinaryTree.from_file
+    bez objektů Node z parseru a bez odvozování stromu z nich. Obecný graf,
+    nebo strom, kterému chybí rodič některého uzlu, zpracuje GraphParser.
+    
+    Args:
+        filepath (str): Cesta k souboru
+        parser (GraphParser): Parser, jehož výsledky (např. statements) chce
+                              volající po načtení číst (výchozí nový parser)
+    
+    Returns:
+        Graph: Načtený graf
+    """
+    if parser is None:
+        parser = GraphParser()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    lines = content.strip().split('\n')
+    if parser.detect_binary_tree(lines):
+        try:
+            return Graph.from_tree(BinaryTree.from_lines(lines))
+        except ValueError:
+            # Uzel bez rodiče - varování vypíše Graph při sestavení z uzlů parseru
+            pass
+    
+    nodes, edges, is_binary_tree = parser.parse_content(content)
+    return Graph(nodes, edges, is_binary_tree)
+
+
+def _edge_key(edge):
+    """
+    Klíč hrany v indexu dvojic uzlů.
+    
+    Orientovaná hrana má klíč (zdroj, cíl), u neorientované hrany
+    se pořadí uzlů normalizuje.
+    """
+    if edge.directed:
+        return (edge.source, edge.target)
+    if edge.node2 < edge.node1:
+        return (edge.node2, edge.node1)
+    return (edge.node1, edge.node2)
+
+
+def _remove_identical(index, key, edge):
+    """Odebere hranu (podle identity) ze seznamu index[key], prázdný seznam smaže."""
+    entries = index[key]
+    for i, e in enumerate(entries):
+        if e is edge:
+            del entries[i]
+            break
+    if not entries:
+        del index[key]
+
+
+def _remove_entry(adjacency, node_id, edge):
+    """Odebere z adjacency[node_id] první dvojici (soused, hrana) s danou hranou."""
+    entries = adjacency[node_id]
+    for i, (_, e) in enumerate(entries):
+        if e is edge:
+            del entries[i]
+            return
@@ -0,0 +1,276 @@
+"""
+Rozložení uzlů grafu pro kreslení i velkých grafů.
+
+Silový algoritmus Fruchterman-Reingold se dvěma zrychleními:
+    - odpudivé síly se počítají jen mezi uzly v sousedních buňkách mřížky
+      (do vzdálenosti 2k), jedna iterace tak stojí O(n + m) místo O(n²),
+    - víceúrovňové zhrubení: graf se opakovaně zmenšuje párováním uzlů
+      podél hran, rozloží se nejhrubší úroveň a pozice se pak přenášejí
+      na jemnější úrovně, kde už stačí několik iterací dolaďování.
+
+Souřadnice jsou v polích array('d'), veškerou náhodnost řídí seed -
+stejný graf se stejným seedem dává vždy stejné rozložení.
+"""
+
+import math
+import random
+from array import array
+
+
+# Výchozí seed a počet iterací na nejhrubší úrovni
+DEFAULT_SEED = 42
+DEFAULT_ITERATIONS = 50
+
+# Úroveň s nejvýše tolika uzly se už dál nezhrubuje
+COARSEST_SIZE = 50
+
+# Zhrubení končí, pokud párování zmenší graf méně než na tento podíl (např. hvězdy)
+MIN_SHRINK = 0.9
+
+# Počet dolaďovacích iterací na jemnějších úrovních
+REFINE_ITERATIONS = 10
+
+# Nejvýše tolik uzlů z okolních buněk odpuzuje jeden uzel - v přeplněném
+# okolí se použije pravidelný výběr a síla se úměrně zvětší
+MAX_NEIGHBORS = 64
+
+
+class Layout:
+    """Pozice uzlů - node_list[i] leží na (xs[i], ys[i])."""
+    
+    def __init__(self, node_list, xs, ys, scale=1.0):
+        """
+        Args:
+            node_list (list): Uzly
+            xs (array): Souřadnice x ('d')
+            ys (array): Souřadnice y ('d')
+            scale (float): Ideální délka hrany v těchto souřadnicích
+        """
+        self.node_list = node_list
+        self.node_index = {node: i for i, node in enumerate(node_list)}
+        self.xs = xs
+        self.ys = ys
+        self.scale = scale
+    
+    def __len__(self):
+        return len(self.node_list)
+    
+    def position(self, node):
+        """
+        Pozice uzlu.
+        
+        Raises:
+            KeyError: Pokud uzel v rozložení není
+        """
+        try:
+            i = self.node_index[node]
+        except KeyError:
+            raise KeyError(f"Uzel '{node}' není v rozložení") from None
+        return self.xs[i], self.ys[i]
+    
+    def bounds(self):
+        """Obdélník se všemi uzly (min_x, min_y, max_x, max_y), prázdné rozložení (0, 0, 0, 0)."""
+        if not self.node_list:
+            return 0.0, 0.0, 0.0, 0.0
+        return min(self.xs), min(self.ys), max(self.xs), max(self.ys)
+    
+    def fit(self, width, height, margin=0.0):
+        """
+        Rozložení přeškálované do obdélníku 0..width × 0..height se zachováním poměru stran.
+        
+        Args:
+            width (float): Šířka
+            height (float): Výška
+            margin (float): Okraj na každé straně
+        
+        Returns:
+            Layout: Nové rozložení (osa y roste dolů jako v obrázcích)
+        """
+        min_x, min_y, max_x, max_y = self.bounds()
+        inner_w = max(width - 2 * margin, 0.0)
+        inner_h = max(height - 2 * margin, 0.0)
+        span_x = max_x - min_x
+        span_y = max_y - min_y
+        scale = min(inner_w / span_x if span_x else math.inf,
+                    inner_h / span_y if span_y else math.inf)
+        if scale == math.inf:
+            scale = 0.0
+        # Vycentrování v obdélníku
+        off_x = margin + (inner_w - span_x * scale) / 2
+        off_y = margin + (inner_h - span_y * scale) / 2
+        xs = array('d', (off_x + (x - min_x) * scale for x in self.xs))
+        ys = array('d', (off_y + (max_y - y) * scale for y in self.ys))
+        return Layout(self.node_list, xs, ys, self.scale * scale)
+
+
+def _index_edges(graph, node_index):
+    """Dvojice indexů (i, j), i < j, spojené aspoň jednou hranou (bez smyček)."""
+    pairs = set()
+    for edge in graph.edges_list:
+        i = node_index[edge.node1]
+        j = node_index[edge.node2]
+        if i != j:
+            pairs.add((i, j) if i < j else (j, i))
+    return sorted(pairs)
+
+
+def _coarsen(n, edges, rng):
+    """
+    Jedna úroveň zhrubení - náhodné maximální párování podél hran.
+    
+    Returns:
+        tuple: (parent, coarse_n, coarse_edges) - parent[i] je uzel hrubší úrovně
+    """
+    order = edges[:]
+    rng.shuffle(order)
+    mate = [-1] * n
+    for i, j in order:
+        if mate[i] < 0 and mate[j] < 0:
+            mate[i] = j
+            mate[j] = i
+    
+    parent = [-1] * n
+    coarse_n = 0
+    for i in range(n):
+        if parent[i] >= 0:
+            continue
+        parent[i] = coarse_n
+        if mate[i] >= 0:
+            parent[mate[i]] = coarse_n
+        coarse_n += 1
+    
+    coarse_edges = set()
+    for i, j in edges:
+        a, b = parent[i], parent[j]
+        if a != b:
+            coarse_edges.add((a, b) if a < b else (b, a))
+    return parent, coarse_n, sorted(coarse_edges)
+
+
+def _relax(xs, ys, edges, k, iterations, temperature):
+    """
+    Iterace Fruchterman-Reingold s odpuzováním přes mřížku.
+    
+    Args:
+        xs, ys (array): Souřadnice (upravují se na místě)
+        edges (list): Dvojice indexů
+        k (float): Ideální délka hrany
+        iterations (int): Počet iterací
+        temperature (float): Počáteční největší posun uzlu (lineárně klesá k nule)
+    """
+    n = len(xs)
+    cell = 2 * k
+    reach2 = cell * cell
+    k2 = k * k
+    hypot = math.hypot
+    for step in range(iterations):
+        dx = array('d', bytes(8 * n))
+        dy = array('d', bytes(8 * n))
+        
+        # Odpuzování - jen uzly v okolních buňkách mřížky
+        grid = {}
+        for i in range(n):
+            key = (math.floor(xs[i] / cell), math.floor(ys[i] / cell))
+            members = grid.get(key)
+            if members is None:
+                grid[key] = [i]
+            else:
+                members.append(i)
+        
+        for (cx, cy), members in grid.items():
+            near = []
+            for ox in (-1, 0, 1):
+                for oy in (-1, 0, 1):
+                    near.extend(grid.get((cx + ox, cy + oy), ()))
+            stride = -(-len(near) // MAX_NEIGHBORS)
+            for i in members:
+                xi = xs[i]
+                yi = ys[i]
+                fx = fy = 0.0
+                for j in near[i % stride::stride]:
+                    ddx = xi - xs[j]
+                    ddy = yi - ys[j]
+                    d2 = ddx * ddx + ddy * ddy
+                    if d2 == 0.0:
+                        if i == j:
+                            continue
+                        # Shodné pozice - rozstrčíme podle pořadí uzlů
+                        ddx = 0.01 * k if i > j else -0.01 * k
+                        d2 = ddx * ddx
+                    if d2 < reach2:
+                        # Síla k²/d ve směru (ddx, ddy)/d
+                        f = k2 / d2
+                        fx += ddx * f
+                        fy += ddy * f
+                dx[i] += fx * stride
+                dy[i] += fy * stride
+        
+        # Přitahování podél hran - síla d²/k
+        for i, j in edges:
+            ddx = xs[i] - xs[j]
+            ddy = ys[i] - ys[j]
+            f = hypot(ddx, ddy) / k
+            ddx *= f
+            ddy *= f
+            dx[i] -= ddx
+            dy[i] -= ddy
+            dx[j] += ddx
+            dy[j] += ddy
+        
+        # Posun omezený teplotou
+        limit = temperature * (1 - step / iterations)
+        for i in range(n):
+            length = hypot(dx[i], dy[i])
+            if length > 0.0:
+                scale = min(length, limit) / length
+                xs[i] += dx[i] * scale
+                ys[i] += dy[i] * scale
+
+
+def force_layout(graph, seed=DEFAULT_SEED, iterations=DEFAULT_ITERATIONS):
+    """
+    Víceúrovňové silové rozložení uzlů (směry hran se ignorují).
+    
+    Args:
+        graph (Graph): Graf
+        seed (int): Seed náhodného generátoru
+        iterations (int): Počet iterací na nejhrubší úrovni
+    
+    Returns:
+        Layout: Pozice uzlů (ideální délka hrany 1)
+    """
+    rng = random.Random(seed)
+    node_list = list(graph.nodes)
+    node_index = {node: i for i, node in enumerate(node_list)}
+    n = len(node_list)
+    
+    # Hierarchie úrovní: levels[0] je původní graf
+    levels = [(n, _index_edges(graph, node_index))]
+    parents = []
+    while levels[-1][0] > COARSEST_SIZE:
+        level_n, level_edges = levels[-1]
+        parent, coarse_n, coarse_edges = _coarsen(level_n, level_edges, rng)
+        if coarse_n > MIN_SHRINK * level_n:
+            break
+        parents.append(parent)
+        levels.append((coarse_n, coarse_edges))
+    
+    # Nejhrubší úroveň - náhodné počáteční pozice ve čtverci úměrném počtu uzlů
+    k = 1.0
+    coarse_n, coarse_edges = levels[-1]
+    side = k * math.sqrt(max(coarse_n, 1))
+    xs = array('d', (rng.uniform(0, side) for _ in range(coarse_n)))
+    ys = array('d', (rng.uniform(0, side) for _ in range(coarse_n)))
+    _relax(xs, ys, coarse_edges, k, iterations, side / 4 + k)
+    
+    # Zjemňování - uzel začne na pozici svého rodiče s malým posunem; pozice
+    # se roztáhnou podle počtu uzlů, aby hustota uzlů na ploše zůstala stejná
+    for level in range(len(levels) - 2, -1, -1):
+        parent = parents[level]
+        scale = math.sqrt(levels[level][0] / levels[level + 1][0])
+        jitter = 0.1 * k
+        xs = array('d', (xs[p] * scale + rng.uniform(-jitter, jitter) for p in parent))
+        ys = array('d', (ys[p] * scale + rng.uniform(-jitter, jitter) for p in parent))
+        _relax(xs, ys, levels[level][1], k, REFINE_ITERATIONS, k)
+    
+    return Layout(node_list, xs, ys)
@@ -7,6 +7,323 @@ d) matice incidence, e) matice délek, f) matice předchůdců,
 g) tabulka incidentních hran, h) seznam sousedů, i) seznam uzlů a hran
 """
 
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from operator import add
+
+from .components import strong_components
+from .floyd_warshall import parallel_floyd_warshall, relax_rows
+from .graph import ADD_NODE, REMOVE_NODE, ADD_EDGE, REMOVE_EDGE, REWEIGHT_EDGE
+from .profiling import profiled
+
+
+def _edge_weight(weight):
+    """Váha hrany pro výpočty - hrana bez ohodnocení má váhu 1."""
+    return weight if weight is not None else 1
+
+
+def _missing_label(kind, key, index, limit=20):
+    """
+    KeyError pro neexistující popisek.
+    
+    Vypíše jen prvních `limit` dostupných popisků, aby chybová cesta
+    nevytvářela seznam všech popisků velké matice.
+    """
+    available = []
+    for label in index:
+        if len(available) == limit:
+            available.append(f"... (+{len(index) - limit})")
+            break
+        available.append(label)
+    return KeyError(f"{kind} '{key}' neexistuje v matici. Dostupné: {available}")
+
+
+def label_position(key, index, kind):
+    """
+    Převede index nebo název na číselnou pozici.
+    
+    Args:
+        key: int (pozice) nebo str (popisek)
+        index (dict): Mapování popisek -> pozice
+        kind (str): 'Řádek' nebo 'Sloupec' (pro chybovou hlášku)
+        
+    Returns:
+        int: Pozice
+        
+    Raises:
+        KeyError: Pokud popisek neexistuje
+        TypeError: Pokud klíč není int ani str
+    """
+    if isinstance(key, int):
+        return key
+    if isinstance(key, str):
+        position = index.get(key)
+        if position is None:
+            raise _missing_label(kind, key, index)
+        return position
+    raise TypeError(f"Index musí být int nebo str, ne {type(key)}")
+
+
+def _label_bound(label, labels, index, is_stop, kind, labels_sorted):
+    """
+    Hranice rozsahu popisků (pozice v seznamu popisků).
+    
+    Existující popisek je hranicí včetně. Neexistující popisek se dohledá
+    půlením intervalu - to vyžaduje seřazené popisky (např. názvy uzlů).
+    Seřazenost zjišťuje labels_sorted(kind), aby se nekontrolovala O(n)
+    u každé hranice znovu.
+    """
+    position = index.get(label)
+    if position is not None:
+        return position + 1 if is_stop else position
+    if not labels_sorted(kind):
+        raise _missing_label(kind, label, index)
+    return bisect_left(labels, label)
+
+
+def _select(spec, labels, index, size, kind, labels_sorted):
+    """
+    Převede výběr řádků/sloupců na seznam pozic.
+    
+    Args:
+        spec: None (vše), seznam indexů/názvů, číselný slice nebo slice
+              popisků slice('A', 'D') - rozsah včetně obou konců
+        labels (list): Popisky
+        index (dict): Mapování popisek -> pozice
+        size (int): Počet řádků/sloupců
+        kind (str): 'Řádek' nebo 'Sloupec' (pro chybovou hlášku)
+        labels_sorted (callable): kind -> bool, jsou-li popisky seřazené
+    
+    Returns:
+        range nebo list: Pozice vybraných řádků/sloupců
+    """
+    if spec is None:
+        return range(size)
+    if isinstance(spec, slice):
+        if isinstance(spec.start, str) or isinstance(spec.stop, str):
+            start = 0 if spec.start is None else \
+                _label_bound(spec.start, labels, index, False, kind, labels_sorted)
+            stop = size if spec.stop is None else \
+                _label_bound(spec.stop, labels, index, True, kind, labels_sorted)
+            return range(start, max(start, stop), spec.step or 1)
+        return range(*spec.indices(size))
+    return [label_position(key, index, kind) for key in spec]
+
+
+class _RowView:
+    """Pohled na vybrané sloupce jednoho řádku - bez kopírování dat."""
+    
+    __slots__ = ('_row', '_cols')
+    
+    def __init__(self, row, cols):
+        self._row = row
+        self._cols = cols
+    
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [self._row[k] for k in self._cols[j]]
+        return self._row[self._cols[j]]
+    
+    def __setitem__(self, j, value):
+        self._row[self._cols[j]] = value
+    
+    def __len__(self):
+        return len(self._cols)
+    
+    def __iter__(self):
+        row = self._row
+        for k in self._cols:
+            yield row[k]
+
+
+class _MatrixView:
+    """
+    Pohled na vybrané řádky a sloupce matice sdílející její data.
+    
+    Řádek rodičovské matice se čte až při přístupu, takže vytvoření
+    pohledu stojí jen O(k) pro k vybraných řádků a sloupců.
+    """
+    
+    def __init__(self, data, rows, cols=None):
+        """
+        Args:
+            data: Data rodičovské matice (2D seznam nebo jiná sekvence řádků)
+            rows: Pozice vybraných řádků
+            cols: Pozice vybraných sloupců (None = všechny)
+        """
+        self._base = data
+        self._rows = rows
+        self._cols = cols
+    
+    def __len__(self):
+        return len(self._rows)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self._rows)))]
+        row = self._base[self._rows[i]]
+        return row if self._cols is None else _RowView(row, self._cols)
+    
+    def __iter__(self):
+        for i in range(len(self._rows)):
+            yield self[i]
+    
+    def compose(self, rows, cols):
+        """Pohled na pohled - pozice převedeme rovnou na rodičovská data."""
+        base_rows = [self._rows[i] for i in rows]
+        if cols is None:
+            return _MatrixView(self._base, base_rows, self._cols)
+        if self._cols is None:
+            return _MatrixView(self._base, base_rows, list(cols))
+        return _MatrixView(self._base, base_rows, [self._cols[j] for j in cols])
+
+
+class _DecodedRow:
+    """
+    Řádek typovaného pole, jehož hodnoty se dekódují až při čtení.
+    
+    Buňka na diagonále (sloupec index) se dekóduje funkcí diagonal,
+    pokud je zadaná.
+    """
+    
+    __slots__ = ('_row', '_decode', '_index', '_diagonal')
+    
+    def __init__(self, row, decode, index=None, diagonal=None):
+        self._row = row
+        self._decode = decode
+        self._index = index
+        self._diagonal = diagonal
+    
+    def _cell(self, j, v):
+        if j == self._index:
+            return self._diagonal(v)
+        return self._decode(v)
+    
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            if self._diagonal is None:
+                return [self._decode(v) for v in self._row[j]]
+            return [self._cell(k, self._row[k]) for k in range(*j.indices(len(self._row)))]
+        if self._diagonal is None:
+            return self._decode(self._row[j])
+        if j < 0:
+            j += len(self._row)
+        return self._cell(j, self._row[j])
+    
+    def __len__(self):
+        return len(self._row)
+    
+    def __iter__(self):
+        if self._diagonal is None:
+            return map(self._decode, self._row)
+        return map(self._cell, range(len(self._row)), self._row)
+
+
+class _TypedRows:
+    """
+    Matice uložená po řádcích v typovaných polích (array).
+    
+    Pole drží čísla bez Python objektů na každou buňku (8 B pro 'd',
+    4 B pro 'i'). Hodnoty pro uživatele (názvy uzlů, celá čísla) vytváří
+    až funkce decode při přístupu přes NamedMatrix. Data jsou jen pro čtení.
+    """
+    
+    def __init__(self, rows, decode, diagonal=None):
+        """
+        Args:
+            rows (list): Řádky jako array
+            decode: Funkce převádějící uloženou hodnotu na zobrazovanou
+            diagonal: Volitelná jiná funkce pro buňky na diagonále
+        """
+        self._rows = rows
+        self._decode = decode
+        self._diagonal = diagonal
+    
+    def __len__(self):
+        return len(self._rows)
+    
+    def _row(self, i):
+        return _DecodedRow(self._rows[i], self._decode, i, self._diagonal)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(k) for k in range(*i.indices(len(self._rows)))]
+        if i < 0:
+            i += len(self._rows)
+        return self._row(i)
+    
+    def __iter__(self):
+        for i in range(len(self._rows)):
+            yield self._row(i)
+    
+    def nbytes(self):
+        """Velikost dat v bajtech (pole včetně hlaviček a seznamu řádků)."""
+        return sys.getsizeof(self._rows) + sum(sys.getsizeof(row) for row in self._rows)
+
+
+class _BitsetRow:
+    """Řádek matice uložený jako bitová množina v celém čísle (bit j = sloupec j)."""
+    
+    __slots__ = ('_bits', '_size', '_bytes')
+    
+    def __init__(self, bits, size):
+        self._bits = bits
+        self._size = size
+        self._bytes = None
+    
+    def _data(self):
+        # Posun velkého čísla stojí O(n) - pro čtení buněk převedeme řádek na bajty jednou
+        if self._bytes is None:
+            self._bytes = self._bits.to_bytes((self._size + 7) // 8, 'little')
+        return self._bytes
+    
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [self[k] for k in range(*j.indices(self._size))]
+        if j < 0:
+            j += self._size
+        if not 0 <= j < self._size:
+            raise IndexError("Index sloupce mimo rozsah")
+        return self._data()[j >> 3] >> (j & 7) & 1
+    
+    def __len__(self):
+        return self._size
+    
+    def __iter__(self):
+        data = self._data()
+        for j in range(self._size):
+            yield data[j >> 3] >> (j & 7) & 1
+
+
+class _BitsetRows:
+    """Čtvercová 0/1 matice uložená po řádcích jako bitové množiny (int)."""
+    
+    def __init__(self, rows):
+        """
+        Args:
+            rows (list): Řádky jako celá čísla (řádky mohou sdílet jeden objekt)
+        """
+        self._rows = rows
+    
+    def __len__(self):
+        return len(self._rows)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [_BitsetRow(bits, len(self._rows)) for bits in self._rows[i]]
+        return _BitsetRow(self._rows[i], len(self._rows))
+    
+    def __iter__(self):
+        for bits in self._rows:
+            yield _BitsetRow(bits, len(self._rows))
+    
+    def nbytes(self):
+        """Velikost dat v bajtech (sdílené řádky se počítají jednou)."""
+        unique = {id(bits): bits for bits in self._rows}
+        return sys.getsizeof(self._rows) + sum(sys.getsizeof(bits) for bits in unique.values())
+
 
 class NamedMatrix:
     """
@@ -15,7 +332,10 @@ class NamedMatrix:
     Použití:
         matrix = NamedMatrix(data, row_labels, col_labels)
         value = matrix['A']['B']  # Přístup pomocí názvů
+        value = matrix['A', 'B']  # Totéž bez mezilehlého objektu řádku
         value = matrix[0][1]      # Přístup pomocí indexů stále funguje
+        part = matrix.take(['A', 'B'], ['C', 'D'])  # Hromadný výběr (kopie)
+        view = matrix.sub(rows=slice('A', 'C'))     # Pohled bez kopírování
     """
     
     def __init__(self, data, row_labels=None, col_labels=None):
@@ -32,33 +352,44 @@ class NamedMatrix:
         # Vytvoříme mapování název -> index
         self._row_index = {label: i for i, label in enumerate(self._row_labels)}
         self._col_index = {label: i for i, label in enumerate(self._col_labels)}
+        
+        # Seřazenost popisků pro rozsahy v sub() - zjistí se až při prvním použití
+        self._sorted = {}
+    
+    def _labels_sorted(self, kind):
+        """
+        Jsou popisky řádků ('Řádek') nebo sloupců ('Sloupec') seřazené?
+        
+        Kontrola O(n) proběhne pro každou osu nejvýš jednou.
+        """
+        result = self._sorted.get(kind)
+        if result is None:
+            labels = self._row_labels if kind == 'Řádek' else self._col_labels
+            result = all(labels[i] <= labels[i + 1] for i in range(len(labels) - 1))
+            self._sorted[kind] = result
+        return result
     
     def __getitem__(self, key):
         """
         Přístup k matici pomocí názvu nebo indexu.
         
         Args:
-            key: Může být int (číselný index) nebo str (název uzlu/hrany)
+            key: int (číselný index), str (název uzlu/hrany)
+                 nebo dvojice (řádek, sloupec) pro přímý přístup k prvku
             
         Returns:
-            NamedMatrixRow pro další indexování
-        """
-        if isinstance(key, int):
-            # Číselný index
-            row_idx = key
-        elif isinstance(key, str):
-            # Název uzlu
-            if key not in self._row_index:
-                raise KeyError(f"Řádek '{key}' neexistuje v matici. Dostupné: {list(self._row_index.keys())}")
-            row_idx = self._row_index[key]
-        else:
-            raise TypeError(f"Index musí být int nebo str, ne {type(key)}")
+            NamedMatrixRow pro další indexování, u dvojice přímo hodnota
+        """
+        if isinstance(key, tuple):
+            row, col = key
+            return self.get(row, col)
         
+        row_idx = label_position(key, self._row_index, 'Řádek')
         return NamedMatrixRow(self._data[row_idx], self._col_index)
     
     def get(self, row, col):
         """
-        Získá hodnotu na pozici [row][col].
+        Získá hodnotu na pozici [row][col] bez vytváření objektu řádku.
         
         Args:
             row: Index nebo název řádku
@@ -67,7 +398,86 @@ class NamedMatrix:
         Returns:
             Hodnota na dané pozici
         """
-        return self[row][col]
+        # Rychlá cesta pro názvy: jediné vyhledání v každém slovníku
+        i = self._row_index.get(row) if type(row) is str else None
+        if i is None:
+            i = label_position(row, self._row_index, 'Řádek')
+        j = self._col_index.get(col) if type(col) is str else None
+        if j is None:
+            j = label_position(col, self._col_index, 'Sloupec')
+        return self._data[i][j]
+    
+    def take(self, rows=None, cols=None):
+        """
+        Hromadný výběr řádků a sloupců (kopie).
+        
+        Názvy se převedou na pozice jen jednou, prvky se pak kopírují
+        po řádcích bez dalšího vyhledávání.
+        
+        Args:
+            rows (list): Indexy nebo názvy řádků (None = všechny)
+            cols (list): Indexy nebo názvy sloupců (None = všechny)
+            
+        Returns:
+            NamedMatrix: Vybraná podmatice s odpovídajícími popisky
+        """
+        if rows is None:
+            row_pos = range(len(self._data))
+        else:
+            row_pos = [label_position(r, self._row_index, 'Řádek') for r in rows]
+        
+        if cols is None:
+            data = [self._data[i][:] for i in row_pos]
+            col_labels = self._col_labels
+        else:
+            col_pos = [label_position(c, self._col_index, 'Sloupec') for c in cols]
+            data = []
+            for i in row_pos:
+                row_data = self._data[i]
+                data.append([row_data[j] for j in col_pos])
+            col_labels = [self._col_labels[j] for j in col_pos] if self._col_labels else None
+        
+        row_labels = [self._row_labels[i] for i in row_pos] if self._row_labels else None
+        return NamedMatrix(data, row_labels, col_labels)
+    
+    def sub(self, rows=None, cols=None):
+        """
+        Pohled na podmatici sdílející data této matice (bez kopírování).
+        
+        Vytvoření pohledu stojí O(k) pro k vybraných řádků a sloupců,
+        čtení prvků jde přímo do dat rodičovské matice (zápis také, pokud
+        jsou data zapisovatelná - matice délek a předchůdců jsou jen pro čtení).
+        Pohled lze předat tiskárnám i exportům jako každou jinou NamedMatrix.
+        
+        Args:
+            rows: Výběr řádků - seznam indexů/názvů, číselný slice
+                  nebo rozsah popisků slice('A', 'D') (včetně obou konců;
+                  hranice nemusí existovat, pokud jsou popisky seřazené)
+            cols: Výběr sloupců ve stejném tvaru (None = všechny)
+        
+        Returns:
+            NamedMatrix: Pohled s odpovídajícími popisky
+        
+        Raises:
+            KeyError: Pokud popisek neexistuje
+        """
+        n_cols = len(self._col_labels) if self._col_labels else (len(self._data[0]) if self._data else 0)
+        row_pos = _select(rows, self._row_labels, self._row_index, len(self._data), 'Řádek',
+                          self._labels_sorted)
+        col_pos = None if cols is None else \
+            _select(cols, self._col_labels, self._col_index, n_cols, 'Sloupec', self._labels_sorted)
+        
+        if isinstance(self._data, _MatrixView):
+            view = self._data.compose(row_pos, col_pos)
+        else:
+            view = _MatrixView(self._data, row_pos, col_pos)
+        
+        row_labels = [self._row_labels[i] for i in row_pos] if self._row_labels else None
+        if col_pos is None:
+            col_labels = self._col_labels
+        else:
+            col_labels = [self._col_labels[j] for j in col_pos] if self._col_labels else None
+        return NamedMatrix(view, row_labels, col_labels)
     
     def raw(self):
         """Vrací surová data jako 2D seznam."""
@@ -120,32 +530,181 @@ class NamedMatrixRow:
         Returns:
             Hodnota na dané pozici
         """
-        if isinstance(key, int):
-            # Číselný index
-            return self._row_data[key]
-        elif isinstance(key, str):
-            # Název sloupce
-            if key not in self._col_index:
-                raise KeyError(f"Sloupec '{key}' neexistuje v matici. Dostupné: {list(self._col_index.keys())}")
-            col_idx = self._col_index[key]
-            return self._row_data[col_idx]
-        else:
-            raise TypeError(f"Index musí být int nebo str, ne {type(key)}")
+        return self._row_data[label_position(key, self._col_index, 'Sloupec')]
 
 
 class MatrixBuilder:
-    """Třída pro sestavování matic a seznamů grafů."""
+    """
+    Třída pro sestavování matic a seznamů grafů.
+    
+    Matice sousednosti a výsledky Floyd-Warshalla si builder pamatuje.
+    Při změně grafu (Graph.add_edge, remove_edge, ...) se cache dorovná
+    podle záznamu změn grafu: matice sousednosti se upraví po prvcích,
+    přidání hrany nebo snížení váhy se promítne do matice délek v O(n²),
+    ostatní změny cache zneplatní.
+    """
     
-    def __init__(self, graph):
+    # Menší grafy počítá paralelní Floyd-Warshall pomaleji než jeden proces:
+    # spuštění procesů, kopie do sdílené paměti a čekání na každou fázi stojí
+    # desetiny sekundy, při n = 300 se to na víc jádrech ještě nevyplatí
+    PARALLEL_MIN_NODES = 512
+    
+    def __init__(self, graph, workers=1):
         """
         Args:
             graph (Graph): Instance grafu
+            workers (int): Počet procesů pro Floyd-Warshall (1 = bez paralelizace,
+                           víc než počet procesorů se nespustí)
         """
         self.graph = graph
+        self.workers = workers
+        self._reset()
+    
+    def _reset(self):
+        """Znovu sestaví indexy uzlů a zahodí všechny uložené výsledky."""
         # Vytvoříme uspořádaný seznam uzlů pro indexování
         self.node_list = sorted(self.graph.nodes.keys())
         self.node_index = {node: i for i, node in enumerate(self.node_list)}
+        self._version = self.graph.version
+        
+        # Cache: matice sousednosti, vážená matice sousednosti, vzdálenosti a předchůdci
+        # (vzdálenosti a předchůdci jako řádky array('d') a array('i'), viz _shortest_paths)
+        self._adjacency = None
+        self._weighted = None
+        self._dist = None
+        self._pred = None
+        self._integral = True
+        self._reach = None
+    
+    def _sync(self):
+        """Dorovná cache na aktuální verzi grafu podle záznamu změn."""
+        if self._version == self.graph.version:
+            return
+        
+        changes = self.graph.changes_since(self._version)
+        if changes is None:
+            self._reset()
+            return
+        
+        for _, change, data in changes:
+            if change in (ADD_NODE, REMOVE_NODE):
+                # Změna množiny uzlů posouvá indexy - přepočítáme vše
+                self._reset()
+                return
+            
+            if change == ADD_EDGE:
+                edge, weight = data
+                self._update_adjacency(edge, 1, _edge_weight(weight))
+                self._relax_edge(edge, weight)
+                self._reach = None
+            elif change == REMOVE_EDGE:
+                edge, weight = data
+                self._update_adjacency(edge, -1, -_edge_weight(weight))
+                self._dist = self._pred = None
+                self._reach = None
+            elif change == REWEIGHT_EDGE:
+                edge, old_weight, new_weight = data
+                delta = _edge_weight(new_weight) - _edge_weight(old_weight)
+                self._update_adjacency(edge, 0, delta)
+                if delta < 0:
+                    self._relax_edge(edge, new_weight)
+                elif delta > 0:
+                    self._dist = self._pred = None
+        
+        self._version = self.graph.version
+
+    def release(self, kind):
+        """
+        Zahodí uložený výsledek daného druhu.
+
+        Volá se, když cache volajícího matici odloží na disk nebo zahodí -
+        jinak by builder držel v paměti stejná data dál a odložení by nic
+        neuvolnilo. Příští požadavek výsledek spočítá znovu.
+
+        Args:
+            kind (str): 'adjacency', 'weighted', 'distance' nebo 'predecessor'
+                        (jiné druhy builder neukládá a ignorují se)
+        """
+        if kind == 'adjacency':
+            self._adjacency = None
+        elif kind == 'weighted':
+            self._weighted = None
+        elif kind in ('distance', 'predecessor'):
+            # Vzdálenosti a předchůdci vznikají jedním výpočtem - jde o pár
+            self._dist = self._pred = None
+
+    def _edge_indices(self, edge):
+        """
+        Vrací dvojice indexů (i, j), do kterých hrana zapisuje v matici sousednosti.
+        
+        Returns:
+            list: [(i, j)] pro orientovanou hranu a smyčku, [(i, j), (j, i)] jinak
+        """
+        if edge.directed:
+            return [(self.node_index[edge.source], self.node_index[edge.target])]
+        i = self.node_index[edge.node1]
+        j = self.node_index[edge.node2]
+        return [(i, j)] if i == j else [(i, j), (j, i)]
+    
+    def _update_adjacency(self, edge, count, weight):
+        """Přičte počet a váhu hrany do uložených matic sousednosti."""
+        for i, j in self._edge_indices(edge):
+            if self._adjacency is not None:
+                self._adjacency[i][j] += count
+            if self._weighted is not None:
+                self._weighted[i][j] += weight
+    
+    def _relax_edge(self, edge, weight):
+        """
+        Dynamická aktualizace nejkratších cest po přidání hrany nebo snížení váhy.
+        
+        Nová cesta i -> j může vést jen přes novou hranu u -> v, proto
+        D[i][j] = min(D[i][j], D[i][u] + w + D[v][j]) pro všechna i, j.
+        """
+        if self._dist is None:
+            return
+        
+        if weight is not None:
+            self._integral = False
+        weight = _edge_weight(weight)
+        n = len(self.node_list)
+        INF = float('inf')
+        dist = self._dist
+        pred = self._pred
+        
+        # Se záporným cyklem nejsou nejkratší cesty definované - výsledek
+        # Floyd-Warshalla závisí na pořadí, proto přepočítáme od začátku
+        edges = self._edge_indices(edge)
+        if any(dist[i][i] < 0 for i in range(n)) or \
+                any(weight + dist[v][u] < 0 for u, v in edges):
+            self._dist = self._pred = None
+            return
+        
+        # Dříve vrácené matice sdílí pole s cache - měníme až kopie
+        dist = self._dist = [row[:] for row in dist]
+        pred = self._pred = [row[:] for row in pred]
+        
+        for u, v in edges:
+            # Kopie řádku v a sloupce u - během relaxace se mohou měnit
+            dist_v = dist[v][:]
+            pred_v = pred[v][:]
+            col_u = [dist[i][u] for i in range(n)]
+            
+            for i in range(n):
+                if col_u[i] == INF:
+                    continue
+                base = col_u[i] + weight
+                row = dist[i]
+                pred_row = pred[i]
+                for j in range(n):
+                    if dist_v[j] == INF:
+                        continue
+                    new_dist = base + dist_v[j]
+                    if new_dist < row[j]:
+                        row[j] = new_dist
+                        pred_row[j] = u if j == v else pred_v[j]
     
+    @profiled()
     def adjacency_matrix(self):
         """
         a) Matice sousednosti - A[i][j] = počet hran z uzlu i do uzlu j.
@@ -154,26 +713,21 @@ class MatrixBuilder:
         Returns:
             NamedMatrix: Matice s indexováním pomocí názvů uzlů
         """
-        n = len(self.node_list)
-        matrix = [[0] * n for _ in range(n)]
+        self._sync()
         
-        for edge in self.graph.edges_list:
-            i = self.node_index[edge.node1]
-            j = self.node_index[edge.node2]
+        if self._adjacency is None:
+            n = len(self.node_list)
+            matrix = [[0] * n for _ in range(n)]
             
-            if edge.directed:
-                # Orientovaná hrana
-                src_idx = self.node_index[edge.source]
-                tgt_idx = self.node_index[edge.target]
-                matrix[src_idx][tgt_idx] += 1
-            else:
-                # Neorientovaná hrana - symetrická
-                matrix[i][j] += 1
-                if i != j:  # Pokud není smyčka
-                    matrix[j][i] += 1
+            for edge in self.graph.edges_list:
+                for i, j in self._edge_indices(edge):
+                    matrix[i][j] += 1
+            
+            self._adjacency = matrix
         
-        return NamedMatrix(matrix, self.node_list, self.node_list)
+        return NamedMatrix([row[:] for row in self._adjacency], self.node_list, self.node_list)
     
+    @profiled()
     def weighted_adjacency_matrix(self):
         """
         Matice sousednosti s vahami - A[i][j] = váha hrany z uzlu i do uzlu j.
@@ -182,50 +736,51 @@ class MatrixBuilder:
         Returns:
             NamedMatrix: Matice s indexováním pomocí názvů uzlů
         """
-        n = len(self.node_list)
-        matrix = [[0] * n for _ in range(n)]
+        self._sync()
         
-        for edge in self.graph.edges_list:
-            weight = edge.weight if edge.weight is not None else 1
+        if self._weighted is None:
+            n = len(self.node_list)
+            matrix = [[0] * n for _ in range(n)]
             
-            if edge.directed:
-                src_idx = self.node_index[edge.source]
-                tgt_idx = self.node_index[edge.target]
-                matrix[src_idx][tgt_idx] += weight
-            else:
-                i = self.node_index[edge.node1]
-                j = self.node_index[edge.node2]
-                matrix[i][j] += weight
-                if i != j:
-                    matrix[j][i] += weight
+            for edge in self.graph.edges_list:
+                weight = _edge_weight(edge.weight)
+                for i, j in self._edge_indices(edge):
+                    matrix[i][j] += weight
+            
+            self._weighted = matrix
         
-        return NamedMatrix(matrix, self.node_list, self.node_list)
+        return NamedMatrix([row[:] for row in self._weighted], self.node_list, self.node_list)
     
+    @profiled()
     def signed_matrix(self):
         """
         b) Znaménková matice podle matice sousednosti.
         A[i][j] = 1 pokud existuje hrana, 0 pokud neexistuje.
         
+        Řádky jsou bitové množiny následníků z Graph.bitsets() (n²/8 bajtů),
+        matice je proto jen pro čtení.
+        
         Returns:
             NamedMatrix: Matice s indexováním pomocí názvů uzlů
         """
-        adj_matrix = self.adjacency_matrix()
-        n = len(self.node_list)
-        
-        signed = [[1 if adj_matrix[i][j] > 0 else 0 for j in range(n)] for i in range(n)]
-        
-        return NamedMatrix(signed, self.node_list, self.node_list)
+        bitsets = self.graph.bitsets()
+        return NamedMatrix(_BitsetRows(bitsets.out_bits), bitsets.node_list, bitsets.node_list)
     
-    def matrix_power(self, matrix, power):
+    @profiled()
+    def matrix_power(self, matrix, power, progress=None):
         """
         Násobení matic (pomocná funkce).
         
         Args:
             matrix (list): Čtvercová matice
             power (int): Mocnina
+            progress (Progress): Volitelný token průběhu (hlásí se po každém řádku součinu)
             
         Returns:
             list: Výsledná matice
+        
+        Raises:
+            ComputationCancelled: Pokud byl výpočet zrušen přes progress
         """
         n = len(matrix)
         
@@ -239,17 +794,25 @@ class MatrixBuilder:
         # Iterativní násobení
         result = [row[:] for row in matrix]
         
-        for _ in range(power - 1):
-            result = self._multiply_matrices(result, matrix)
+        if progress is not None:
+            progress.begin('matrix_power', (power - 1) * n)
+        
+        for step in range(power - 1):
+            result = self._multiply_matrices(result, matrix, progress, step * n)
+        
+        if progress is not None:
+            progress.finish()
         
         return result
     
-    def _multiply_matrices(self, a, b):
+    def _multiply_matrices(self, a, b, progress=None, done=0):
         """
         Násobení dvou matic.
         
         Args:
             a, b (list): Matice k vynásobení
+            progress (Progress): Volitelný token průběhu
+            done (int): Počet kroků hotových před tímto součinem
             
         Returns:
             list: Výsledná matice
@@ -258,12 +821,15 @@ class MatrixBuilder:
         result = [[0] * n for _ in range(n)]
         
         for i in range(n):
+            if progress is not None:
+                progress.update(done + i)
             for j in range(n):
                 for k in range(n):
                     result[i][j] += a[i][k] * b[k][j]
         
         return result
     
+    @profiled()
     def adjacency_matrix_powers(self, max_power=3):
         """
         c) Druhá a třetí mocnina matice sousednosti.
@@ -284,6 +850,137 @@ class MatrixBuilder:
         
         return powers
     
+    def _walk_sources(self, sources):
+        """Převede počáteční uzly (názvy nebo indexy) na indexy."""
+        return [label_position(source, self.node_index, 'Uzel') for source in sources]
+    
+    @profiled()
+    def walk_counts(self, sources, k, modulus=None, progress=None):
+        """
+        Počty sledů délky k z vybraných uzlů - řádky A^k bez husté mocniny.
+        
+        Pro každý počáteční uzel se k-krát vynásobí řídký vektor (slovník
+        nenulových počtů) maticí sousednosti přes seznamy následníků, takže
+        cena je O(k · m) na uzel místo O(n³) na mocninu.
+        
+        Args:
+            sources (list): Počáteční uzly (názvy nebo indexy)
+            k (int): Délka sledů
+            modulus (int): Volitelný modul - počty se počítají mod modulus
+            progress (Progress): Volitelný token průběhu (po krocích)
+        
+        Returns:
+            NamedMatrix: Řádky = počáteční uzly, sloupce = všechny uzly
+        
+        Raises:
+            KeyError: Pokud počáteční uzel neexistuje
+            ValueError: Pokud je k záporné
+        """
+        self._sync()
+        
+        if k < 0:
+            raise ValueError(f"Délka sledu musí být nezáporná: {k}")
+        starts = self._walk_sources(sources)
+        successors = self._successor_indices()
+        n = len(self.node_list)
+        
+        if progress is not None:
+            progress.begin('walk_counts', len(starts) * k)
+        
+        rows = []
+        for number, start in enumerate(starts):
+            counts = {start: 1 if modulus is None else 1 % modulus}
+            for step in range(k):
+                if progress is not None:
+                    progress.update(number * k + step)
+                following = {}
+                for i, count in counts.items():
+                    for j in successors[i]:
+                        following[j] = following.get(j, 0) + count
+                if modulus is not None:
+                    following = {j: c % modulus for j, c in following.items() if c % modulus}
+                counts = following
+            
+            row = [0] * n
+            for j, count in counts.items():
+                row[j] = count
+            rows.append(row)
+        
+        if progress is not None:
+            progress.finish()
+        
+        return NamedMatrix(rows, [self.node_list[i] for i in starts], self.node_list)
+    
+    @profiled()
+    def walk_counts_batch(self, sources, k, modulus=None, batch_size=256, progress=None):
+        """
+        Počty sledů délky k pro mnoho počátečních uzlů najednou.
+        
+        Uzly se zpracují po dávkách: každý uzel grafu nese seznam počtů
+        pro všechny počáteční uzly dávky a průchod hranou sečte celé seznamy
+        najednou (map(add, ...)). Výsledek je stejný jako u walk_counts(),
+        průchodů seznamy následníků je ale jen k na dávku - vyplatí se,
+        když sledy z počátečních uzlů pokryjí většinu grafu (delší k).
+        
+        Args:
+            sources (list): Počáteční uzly (názvy nebo indexy)
+            k (int): Délka sledů
+            modulus (int): Volitelný modul - počty se počítají mod modulus
+            batch_size (int): Počet počátečních uzlů v jedné dávce
+            progress (Progress): Volitelný token průběhu (po krocích dávek)
+        
+        Returns:
+            NamedMatrix: Řádky = počáteční uzly, sloupce = všechny uzly
+        
+        Raises:
+            KeyError: Pokud počáteční uzel neexistuje
+            ValueError: Pokud je k záporné
+        """
+        self._sync()
+        
+        if k < 0:
+            raise ValueError(f"Délka sledu musí být nezáporná: {k}")
+        starts = self._walk_sources(sources)
+        successors = self._successor_indices()
+        n = len(self.node_list)
+        batches = [starts[b:b + batch_size] for b in range(0, len(starts), batch_size)]
+        
+        if progress is not None:
+            progress.begin('walk_counts', len(batches) * k)
+        
+        rows = []
+        for number, batch in enumerate(batches):
+            lanes = len(batch)
+            # state[j] = počty sledů do uzlu j pro každý počáteční uzel dávky
+            state = {}
+            for lane, start in enumerate(batch):
+                counts = state.setdefault(start, [0] * lanes)
+                counts[lane] = 1 if modulus is None else 1 % modulus
+            
+            for step in range(k):
+                if progress is not None:
+                    progress.update(number * k + step)
+                following = {}
+                for i, counts in state.items():
+                    for j in successors[i]:
+                        current = following.get(j)
+                        following[j] = counts if current is None else list(map(add, current, counts))
+                if modulus is not None:
+                    following = {j: [c % modulus for c in counts] for j, counts in following.items()}
+                state = following
+            
+            for lane in range(lanes):
+                row = [0] * n
+                for j, counts in state.items():
+                    row[j] = counts[lane]
+                rows.append(row)
+        
+        if progress is not None:
+            progress.finish()
+        
+        return NamedMatrix(rows, [self.node_list[i] for i in starts], self.node_list)
+    
+    @profiled()
     def incidence_matrix(self):
         """
         d) Matice incidence - řádky = uzly, sloupce = hrany.
@@ -300,6 +997,8 @@ class MatrixBuilder:
         Returns:
             NamedMatrix: Matice s indexováním pomocí názvů uzlů (řádky) a hran (sloupce)
         """
+        self._sync()
+        
         n = len(self.node_list)
         
         # Seřadíme hrany podle jejich označení (label)
@@ -341,96 +1040,241 @@ class MatrixBuilder:
         
         return NamedMatrix(matrix, self.node_list, edge_labels)
     
-    def distance_matrix(self):
+    def _shortest_paths(self, progress=None):
         """
-        e) Matice délek - D[i][j] = nejkratší vzdálenost z uzlu i do uzlu j.
-        Používáme Floyd-Warshallův algoritmus.
+        Floyd-Warshallův algoritmus - vzdálenosti i předchůdci najednou.
+        
+        Výsledek se ukládá do cache, matice délek i předchůdců tak
+        sdílí jeden výpočet. Zrušený výpočet do cache nic neuloží.
+        
+        Vzdálenosti jsou řádky array('d') (nedosažitelné = inf), předchůdci
+        řádky array('i') s indexem uzlu do node_list (-1 = žádný). Oproti
+        seznamům Python objektů to zabere zhruba pětinu paměti.
+        
+        Args:
+            progress (Progress): Volitelný token průběhu (hlásí se po každém k)
         
         Returns:
-            NamedMatrix: Matice s indexováním pomocí názvů uzlů
+            tuple: (dist, pred) jako seznamy řádků array
+        
+        Raises:
+            ComputationCancelled: Pokud byl výpočet zrušen přes progress
         """
+        self._sync()
+        
+        if self._dist is not None:
+            return self._dist, self._pred
+        
         n = len(self.node_list)
         INF = float('inf')
         
-        # Inicializace
-        dist = [[INF] * n for _ in range(n)]
+        # Inicializace vzdáleností
+        dist = [array('d', [INF]) * n for _ in range(n)]
+        pred = [array('i', [-1]) * n for _ in range(n)]
         
-        # Diagonála = 0
         for i in range(n):
             dist[i][i] = 0
         
         # Přímé hrany
+        integral = True
         for edge in self.graph.edges_list:
-            weight = edge.weight if edge.weight is not None else 1
-            
-            if edge.directed:
-                src_idx = self.node_index[edge.source]
-                tgt_idx = self.node_index[edge.target]
-                dist[src_idx][tgt_idx] = min(dist[src_idx][tgt_idx], weight)
-            else:
-                i = self.node_index[edge.node1]
-                j = self.node_index[edge.node2]
-                dist[i][j] = min(dist[i][j], weight)
-                dist[j][i] = min(dist[j][i], weight)
+            if edge.weight is not None:
+                integral = False
+            weight = _edge_weight(edge.weight)
+            for i, j in self._edge_indices(edge):
+                if weight < dist[i][j]:
+                    dist[i][j] = weight
+                    pred[i][j] = i
         
-        # Floyd-Warshall
-        for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    if dist[i][k] != INF and dist[k][j] != INF:
-                        dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+        if progress is not None:
+            progress.begin('floyd_warshall', n)
+        
+        # Na jediném procesoru by procesy jen přidaly režii
+        workers = min(self.workers, os.cpu_count() or 1)
+        if workers > 1 and n >= self.PARALLEL_MIN_NODES:
+            # Blokový Floyd-Warshall - pásy řádků počítají pracovní procesy
+            parallel_floyd_warshall(dist, pred, workers, progress=progress)
+        else:
+            # Floyd-Warshall s předchůdci
+            rows = range(n)
+            for k in range(n):
+                if progress is not None:
+                    progress.update(k)
+                relax_rows(dist, pred, rows, range(k, k + 1))
         
-        return NamedMatrix(dist, self.node_list, self.node_list)
+        if progress is not None:
+            progress.finish()
+        
+        self._dist = dist
+        self._pred = pred
+        self._integral = integral
+        return dist, pred
     
-    def predecessor_matrix(self):
+    def _distance_decoder(self):
         """
-        f) Matice předchůdců - P[i][j] = předchůdce uzlu j na nejkratší cestě z i do j.
+        Převod uložené vzdálenosti na zobrazovanou hodnotu.
+        
+        V neohodnoceném grafu jsou všechny vzdálenosti celá čísla,
+        v ohodnoceném float - kromě nulové vzdálenosti uzlu od sebe
+        sama na diagonále, která byla vždy celočíselná.
         
         Returns:
-            NamedMatrix: Matice s indexováním pomocí názvů uzlů
+            tuple: (převod hodnoty, převod na diagonále nebo None - stejný)
         """
-        n = len(self.node_list)
         INF = float('inf')
+        if not self._integral:
+            return (lambda v: v), (lambda v: v or 0)
+        return (lambda v: v if v == INF else int(v)), None
+    
+    @profiled()
+    def distance_matrix(self, progress=None):
+        """
+        e) Matice délek - D[i][j] = nejkratší vzdálenost z uzlu i do uzlu j.
+        Používáme Floyd-Warshallův algoritmus.
         
-        # Inicializace vzdáleností
-        dist = [[INF] * n for _ in range(n)]
-        pred = [[None] * n for _ in range(n)]
+        Data matice sdílí typovaná pole s cache builderu (jen pro čtení).
         
-        for i in range(n):
-            dist[i][i] = 0
+        Args:
+            progress (Progress): Volitelný token průběhu a zrušení výpočtu
         
-        # Přímé hrany
+        Returns:
+            NamedMatrix: Matice s indexováním pomocí názvů uzlů
+        """
+        dist, _ = self._shortest_paths(progress)
+        decode, diagonal = self._distance_decoder()
+        data = _TypedRows(dist, decode, diagonal)
+        return NamedMatrix(data, self.node_list, self.node_list)
+    
+    @profiled()
+    def predecessor_matrix(self, progress=None):
+        """
+        f) Matice předchůdců - P[i][j] = předchůdce uzlu j na nejkratší cestě z i do j.
+        
+        Názvy uzlů vznikají až při čtení buňky z indexů v typovaném poli.
+        
+        Args:
+            progress (Progress): Volitelný token průběhu a zrušení výpočtu
+        
+        Returns:
+            NamedMatrix: Matice s indexováním pomocí názvů uzlů
+        """
+        _, pred = self._shortest_paths(progress)
+        node_list = self.node_list
+        data = _TypedRows(pred, lambda v: node_list[v] if v >= 0 else None)
+        return NamedMatrix(data, self.node_list, self.node_list)
+    
+    def _successor_indices(self):
+        """Následníci každého uzlu jako indexy (podle matice sousednosti)."""
+        successors = [[] for _ in self.node_list]
         for edge in self.graph.edges_list:
-            weight = edge.weight if edge.weight is not None else 1
-            
-            if edge.directed:
-                src_idx = self.node_index[edge.source]
-                tgt_idx = self.node_index[edge.target]
-                if weight < dist[src_idx][tgt_idx]:
-                    dist[src_idx][tgt_idx] = weight
-                    pred[src_idx][tgt_idx] = self.node_list[src_idx]
-            else:
-                i = self.node_index[edge.node1]
-                j = self.node_index[edge.node2]
-                if weight < dist[i][j]:
-                    dist[i][j] = weight
-                    pred[i][j] = self.node_list[i]
-                if weight < dist[j][i]:
-                    dist[j][i] = weight
-                    pred[j][i] = self.node_list[j]
+            for i, j in self._edge_indices(edge):
+                successors[i].append(j)
+        return successors
+    
+    def _reachability(self, progress=None):
+        """
+        Dosažitelnost přes kondenzaci na komponenty silné souvislosti.
         
-        # Floyd-Warshall s předchůdci
-        for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    if dist[i][k] != INF and dist[k][j] != INF:
-                        new_dist = dist[i][k] + dist[k][j]
-                        if new_dist < dist[i][j]:
-                            dist[i][j] = new_dist
-                            pred[i][j] = pred[k][j]
+        Komponenty se zpracují v opačném topologickém pořadí: množina
+        dosažitelných uzlů komponenty je sjednocení jejích uzlů a množin
+        komponent, do kterých z ní vede hrana. Množiny jsou bitové (int),
+        všechny uzly komponenty sdílí jeden objekt.
+        
+        Args:
+            progress (Progress): Volitelný token průběhu (po komponentách)
+        
+        Returns:
+            list: Bitová množina dosažitelných uzlů pro každý index uzlu
+        
+        Raises:
+            ComputationCancelled: Pokud byl výpočet zrušen přes progress
+        """
+        self._sync()
+        
+        if self._reach is not None:
+            return self._reach
+        
+        successors = self._successor_indices()
+        component, components = strong_components(successors)
+        
+        if progress is not None:
+            progress.begin('reachability', len(components))
         
-        return NamedMatrix(pred, self.node_list, self.node_list)
+        reach_of = []
+        for c, members in enumerate(components):
+            if progress is not None:
+                progress.update(c)
+            bits = 0
+            targets = set()
+            for v in members:
+                bits |= 1 << v
+                for w in successors[v]:
+                    targets.add(component[w])
+            targets.discard(c)
+            for target in targets:
+                bits |= reach_of[target]
+            reach_of.append(bits)
+        
+        if progress is not None:
+            progress.finish()
+        
+        self._reach = [reach_of[c] for c in component]
+        return self._reach
     
+    @profiled()
+    def reachability_matrix(self, progress=None):
+        """
+        Matice dosažitelnosti - R[i][j] = 1, pokud vede cesta z uzlu i do uzlu j.
+        
+        Každý uzel dosáhne sám sebe (cesta délky 0), stejně jako je
+        v matici délek D[i][i] = 0. Řádky jsou bitové množiny, 0/1 hodnoty
+        vznikají až při čtení.
+        
+        Args:
+            progress (Progress): Volitelný token průběhu a zrušení výpočtu
+        
+        Returns:
+            NamedMatrix: Matice s indexováním pomocí názvů uzlů
+        """
+        return NamedMatrix(_BitsetRows(self._reachability(progress)),
+                           self.node_list, self.node_list)
+    
+    def reachability_bitsets(self, progress=None):
+        """
+        Dosažitelné uzly jako bitové množiny.
+        
+        Bit j čísla pro uzel u je nastaven, pokud z u vede cesta
+        do uzlu node_list[j]. Uzly jedné komponenty silné souvislosti
+        sdílí stejný objekt.
+        
+        Args:
+            progress (Progress): Volitelný token průběhu a zrušení výpočtu
+        
+        Returns:
+            dict: {uzel: int}
+        """
+        return dict(zip(self.node_list, self._reachability(progress)))
+    
+    def can_reach(self, source, target):
+        """
+        Vede cesta z uzlu source do uzlu target?
+        
+        Args:
+            source (str): Počáteční uzel
+            target (str): Cílový uzel
+        
+        Returns:
+            bool: True, pokud je target dosažitelný ze source
+        
+        Raises:
+            KeyError: Pokud některý z uzlů neexistuje
+        """
+        reach = self._reachability()
+        i = label_position(source, self.node_index, 'Uzel')
+        j = label_position(target, self.node_index, 'Uzel')
+        return bool(reach[i] >> j & 1)
+    
+    @profiled()
     def incident_edges_table(self):
         """
         g) Tabulka incidentních hran - pro každý uzel seznam incidentních hran.
@@ -438,6 +1282,8 @@ class MatrixBuilder:
         Returns:
             dict: {uzel: [hrany]}
         """
+        self._sync()
+        
         table = {node: [] for node in self.node_list}
         
         for edge in self.graph.edges_list:
@@ -448,6 +1294,7 @@ class MatrixBuilder:
         
         return table
     
+    @profiled()
     def neighbor_list(self):
         """
         h) Seznam sousedů - pro každý uzel seznam sousedních uzlů.
@@ -455,6 +1302,8 @@ class MatrixBuilder:
         Returns:
             dict: {uzel: [sousedé]}
         """
+        self._sync()
+        
         neighbors = {}
         
         for node in self.node_list:
@@ -462,6 +1311,7 @@ class MatrixBuilder:
         
         return neighbors
     
+    @profiled()
     def node_and_edge_list(self):
         """
         i) Seznam uzlů a hran.
@@ -469,11 +1319,14 @@ class MatrixBuilder:
         Returns:
             dict: {'nodes': list, 'edges': list}
         """
+        self._sync()
+        
         return {
             'nodes': self.node_list,
             'edges': self.graph.edges_list
         }
     
+    @profiled()
     def build_all_matrices(self):
         """
         Sestaví všechny matice a seznamy.
@@ -0,0 +1,202 @@
+"""
+Odhad paměti jednotlivých částí grafu a matic.
+
+deep_sizeof() sečte velikost objektu včetně všeho, na co odkazuje. Zprávy
+sdílí jeden slovník už započtených objektů, takže každý bajt se připíše
+jen první komponentě v pořadí zprávy (např. objekty Edge hranám, ne
+seznamům sousedů, které na ně jen odkazují).
+"""
+
+import sys
+import types
+from collections import deque
+
+from .matrices import NamedMatrix, NamedMatrixRow
+
+
+# Typy, které nepočítáme (sdílené s interpretem, ne s grafem)
+_SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                  types.MethodType)
+
+
+def _is_shared_constant(obj):
+    """None, bool a malá celá čísla jsou v interpretu sdílené singletony."""
+    if obj is None or isinstance(obj, bool):
+        return True
+    return type(obj) is int and -5 <= obj <= 256
+
+
+def deep_sizeof(obj, seen=None):
+    """
+    Velikost objektu včetně odkazovaných objektů (v bajtech).
+    
+    Prochází seznamy, n-tice, množiny, fronty, slovníky (klíče i hodnoty)
+    a atributy objektů (__dict__ i __slots__). Průchod je iterativní, takže
+    ani hluboké struktury nenarazí na limit rekurze.
+    
+    Args:
+        obj: Měřený objekt
+        seen (dict): {id: objekt} už započtených objektů - sdílením mezi
+                     voláními se zabrání dvojímu započtení (odkaz na objekt
+                     brání opětovnému použití jeho id() jiným objektem)
+    
+    Returns:
+        int: Velikost v bajtech
+    """
+    if seen is None:
+        seen = {}
+    
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if _is_shared_constant(current) or isinstance(current, _SKIPPED_TYPES):
+            continue
+        key = id(current)
+        if key in seen:
+            continue
+        seen[key] = current
+        total += sys.getsizeof(current)
+        
+        if isinstance(current, (str, bytes, bytearray, int, float)):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        
+        attributes = getattr(current, '__dict__', None)
+        if attributes is not None:
+            stack.append(attributes)
+        for slot in getattr(type(current), '__slots__', ()):
+            if hasattr(current, slot):
+                stack.append(getattr(current, slot))
+    
+    return total
+
+
+def graph_memory_report(graph, seen=None):
+    """
+    Paměť jednotlivých struktur grafu.
+    
+    Args:
+        graph (Graph): Graf
+        seen (dict): Sdílené započtené objekty (viz deep_sizeof)
+    
+    Returns:
+        dict: {komponenta: bajty} v pořadí započtení
+    """
+    if seen is None:
+        seen = {}
+    
+    return {
+        'edge_records': deep_sizeof(graph.edges_list, seen),
+        'node_records': deep_sizeof(graph.nodes, seen),
+        # Zbytek vstupních seznamů: vynechané uzly '*' a zahozené hrany
+        'raw_input': deep_sizeof((graph.raw_nodes, graph.raw_edges), seen),
+        'adjacency_list': deep_sizeof(graph.adjacency_list, seen),
+        'in_neighbors': deep_sizeof(graph.in_neighbors, seen),
+        'out_neighbors': deep_sizeof(graph.out_neighbors, seen),
+        'edge_indexes': deep_sizeof((graph._label_index, graph._pair_index), seen),
+        'bitsets': deep_sizeof(graph._bitsets, seen),
+        'change_log': deep_sizeof(graph._changes, seen),
+    }
+
+
+def _matrix_entries(name, matrix, seen):
+    """Položky zprávy pro jednu NamedMatrix - data a popisky zvlášť."""
+    return {
+        f"{name}.data": deep_sizeof(matrix.raw(), seen),
+        f"{name}.labels": deep_sizeof((matrix.row_labels(), matrix.col_labels(),
+                                       matrix._row_index, matrix._col_index), seen),
+    }
+
+
+def matrices_memory_report(matrices, seen=None):
+    """
+    Paměť výsledků MatrixBuilder.build_all_matrices().
+    
+    Args:
+        matrices (dict): Výsledek build_all_matrices()
+        seen (dict): Sdílené započtené objekty (viz deep_sizeof)
+    
+    Returns:
+        dict: {matice nebo její část: bajty}
+    """
+    if seen is None:
+        seen = {}
+    
+    report = {}
+    for name, value in matrices.items():
+        if isinstance(value, NamedMatrix):
+            report.update(_matrix_entries(name, value, seen))
+        elif isinstance(value, dict) and value and \
+                all(isinstance(item, NamedMatrix) for item in value.values()):
+            # Mocniny matice sousednosti {k: NamedMatrix}
+            for power, matrix in value.items():
+                report.update(_matrix_entries(f"{name}[{power}]", matrix, seen))
+        else:
+            report[name] = deep_sizeof(value, seen)
+    return report
+
+
+def builder_cache_report(builder, seen=None):
+    """
+    Paměť matic, které si MatrixBuilder drží v cache.
+    
+    Args:
+        builder (MatrixBuilder): Builder
+        seen (dict): Sdílené započtené objekty (viz deep_sizeof)
+    
+    Returns:
+        dict: {cache: bajty}
+    """
+    if seen is None:
+        seen = {}
+    
+    return {
+        'node_index': deep_sizeof((builder.node_list, builder.node_index), seen),
+        'adjacency': deep_sizeof(builder._adjacency, seen),
+        'weighted': deep_sizeof(builder._weighted, seen),
+        'distances': deep_sizeof(builder._dist, seen),
+        'predecessors': deep_sizeof(builder._pred, seen),
+    }
+
+
+def row_wrapper_size():
+    """
+    Velikost jednoho NamedMatrixRow vytvořeného při přístupu matrix['A'].
+    
+    Obal se nikde neukládá - jde o krátkodobou alokaci na každý přístup.
+    
+    Returns:
+        int: Bajty na jeden přístup přes název
+    """
+    row = NamedMatrixRow([], {})
+    return sys.getsizeof(row) + sys.getsizeof(row.__dict__)
+
+
+def memory_report(graph, builder=None, matrices=None):
+    """
+    Kompletní zpráva o paměti grafu, cache builderu a matic.
+    
+    Args:
+        graph (Graph): Graf
+        builder (MatrixBuilder): Volitelný builder (jeho cache)
+        matrices (dict): Volitelný výsledek build_all_matrices()
+    
+    Returns:
+        dict: {'graph': {...}, 'matrices': {...}, 'builder': {...},
+               'row_wrapper': bajty na přístup, 'total': bajty celkem}
+    """
+    seen = {}
+    report = {'graph': graph_memory_report(graph, seen)}
+    if matrices is not None:
+        report['matrices'] = matrices_memory_report(matrices, seen)
+    if builder is not None:
+        report['builder'] = builder_cache_report(builder, seen)
+    report['row_wrapper'] = row_wrapper_size()
+    report['total'] = sum(sum(section.values()) for section in report.values()
+                          if isinstance(section, dict))
+    return report
@@ -9,6 +9,8 @@ Podporované formáty:
 
 import re
 
+from .profiling import profiled
+
 
 class Node:
     """Reprezentace uzlu v grafu."""
@@ -91,7 +93,10 @@ class GraphParser:
         self.nodes = []
         self.edges = []
         self.is_binary_tree = None
+        # Úspěšně zpracované příkazy: [(řádek, Node nebo Edge)] v pořadí souboru
+        self.statements = []
     
+    @profiled()
     def parse_file(self, filepath):
         """
         Načte a parsuje soubor s grafem.
@@ -106,6 +111,7 @@ class GraphParser:
             content = f.read()
         return self.parse_content(content)
     
+    @profiled()
     def parse_content(self, content):
         """
         Parsuje textový obsah s grafem.
@@ -118,11 +124,12 @@ class GraphParser:
         """
         self.nodes = []
         self.edges = []
+        self.statements = []
         
         lines = content.strip().split('\n')
         
         # Nejprve detekujeme typ grafu
-        self.is_binary_tree = self._detect_binary_tree(lines)
+        self.is_binary_tree = self.detect_binary_tree(lines)
         
         # Parsujeme řádky
         for line_num, line in enumerate(lines, 1):
@@ -134,9 +141,9 @@ class GraphParser:
             
             try:
                 if line.startswith('u '):
-                    self._parse_node(line)
+                    self.statements.append((line, self._parse_node(line)))
                 elif line.startswith('h '):
-                    self._parse_edge(line)
+                    self.statements.append((line, self._parse_edge(line)))
                 else:
                     print(f"Varování: Neznámý příkaz na řádku {line_num}: {line}")
             except Exception as e:
@@ -145,7 +152,7 @@ class GraphParser:
         
         return self.nodes, self.edges, self.is_binary_tree
     
-    def _detect_binary_tree(self, lines):
+    def detect_binary_tree(self, lines):
         """
         Detekuje, zda se jedná o binární strom.
         Binární strom = pouze příkazy 'u', žádné příkazy 'h'.
@@ -162,13 +169,61 @@ class GraphParser:
                 return False
         return True
     
+    def parse_statement(self, line):
+        """
+        Parsuje jeden příkaz bez přidání do self.nodes / self.edges.
+        
+        Args:
+            line (str): Řádek s příkazem 'u' nebo 'h'
+            
+        Returns:
+            Node, Edge nebo None (prázdný řádek, komentář, neznámý příkaz)
+        """
+        line = line.strip()
+        if line.startswith('u '):
+            return self._node_from_line(line)
+        if line.startswith('h '):
+            return self._edge_from_line(line)
+        return None
+    
     def _parse_node(self, line):
+        """
+        Parsuje definici uzlu a přidá ho do self.nodes.
+        
+        Args:
+            line (str): Řádek s definicí uzlu
+            
+        Returns:
+            Node: Vytvořený uzel
+        """
+        node = self._node_from_line(line)
+        self.nodes.append(node)
+        return node
+    
+    def _parse_edge(self, line):
+        """
+        Parsuje definici hrany a přidá ji do self.edges.
+        
+        Args:
+            line (str): Řádek s definicí hrany
+            
+        Returns:
+            Edge: Vytvořená hrana
+        """
+        edge = self._edge_from_line(line)
+        self.edges.append(edge)
+        return edge
+    
+    def _node_from_line(self, line):
         """
         Parsuje definici uzlu.
         Formát: u identifikator [ohodnoceni];
         
         Args:
             line (str): Řádek s definicí uzlu
+            
+        Returns:
+            Node: Vytvořený uzel
         """
         # Odstraníme 'u ' a ';'
         content = line[2:].strip()
@@ -193,15 +248,18 @@ class GraphParser:
         else:
             node = Node(identifier, weight)
         
-        self.nodes.append(node)
+        return node
     
-    def _parse_edge(self, line):
+    def _edge_from_line(self, line):
         """
         Parsuje definici hrany.
         Formát: h uzel1 (< | - | >) uzel2 [ohodnoceni] [:oznaceni];
         
         Args:
             line (str): Řádek s definicí hrany
+            
+        Returns:
+            Edge: Vytvořená hrana
         """
         # Odstraníme 'h ' a ';'
         content = line[2:].strip()
@@ -249,8 +307,7 @@ class GraphParser:
         directed = operator in ['<', '>', '<-', '->']
         reverse = operator in ['<', '<-']
         
-        edge = Edge(node1, node2, directed, reverse, weight, label)
-        self.edges.append(edge)
+        return Edge(node1, node2, directed, reverse, weight, label)
     
     def get_node_identifiers(self):
         """
@@ -0,0 +1,287 @@
+"""
+Modul pro proudový výpis matic.
+
+Matice se nevypisuje najednou, ale po blocích sloupců (stránkách) omezených
+šířkou výstupu. Data se čtou přes matrix[i][j] jen pro zobrazené okno, takže
+tiskárna funguje i nad línými nebo řídkými maticemi bez jejich materializace.
+Výstup se zapisuje po řádcích do libovolného souborového objektu.
+"""
+
+import sys
+
+# Výchozí šířka buňky a popisku řádku (odpovídá původnímu formátu výpisu)
+CELL_WIDTH = 4
+LABEL_WIDTH = 3
+
+# Výchozí šířka výstupu ve znacích
+DEFAULT_WIDTH = 120
+
+# Velikost bufferu při zápisu do souboru
+FILE_BUFFER_SIZE = 1 << 20
+
+
+def format_value(val, cell_width=CELL_WIDTH):
+    """
+    Naformátuje jednu hodnotu matice.
+    
+    Args:
+        val: Hodnota buňky (int, float, inf, None, str)
+        cell_width (int): Šířka buňky
+    
+    Returns:
+        str: Zarovnaná textová podoba hodnoty
+    """
+    if val is None:
+        return f"{'-':>{cell_width - 1}} "
+    if val == float('inf'):
+        return f"{'∞':>{cell_width - 1}} "
+    if isinstance(val, float):
+        return f"{val:>{cell_width}.1f}"
+    return f"{val:>{cell_width}}"
+
+
+def parse_window(spec):
+    """
+    Převede textový zápis okna 'od:do' na dvojici indexů.
+    
+    Podporované tvary: '10:20', ':20', '10:', '5' (pouze jeden řádek/sloupec).
+    Indexy se počítají od začátku matice - záporné indexy (počítání od konce)
+    ani obrácené meze ('10:3') se nepřijímají.
+    
+    Args:
+        spec (str): Textový zápis okna
+    
+    Returns:
+        tuple: (start, stop), kde stop může být None (= do konce)
+    
+    Raises:
+        ValueError: Pokud zápis není platný (zpráva uvádí celý zápis)
+    """
+    try:
+        if ':' not in spec:
+            start = int(spec)
+            stop = start + 1
+        else:
+            start, stop = spec.split(':', 1)
+            start = int(start) if start.strip() else 0
+            stop = int(stop) if stop.strip() else None
+    except ValueError:
+        raise ValueError(f"Neplatné okno '{spec}': meze musí být celá čísla") from None
+    
+    if start < 0 or (stop is not None and stop < 0):
+        raise ValueError(f"Neplatné okno '{spec}': záporné indexy nejsou podporované")
+    if stop is not None and stop < start:
+        raise ValueError(f"Neplatné okno '{spec}': konec je před začátkem")
+    return (start, stop)
+
+
+def _matrix_shape(matrix, row_labels, col_labels):
+    """Zjistí rozměry matice bez čtení jejích dat (kromě prvního řádku)."""
+    if row_labels:
+        rows = len(row_labels)
+    else:
+        rows = len(matrix)
+    
+    if col_labels:
+        cols = len(col_labels)
+    elif hasattr(matrix, 'shape'):
+        cols = matrix.shape[1]
+    else:
+        cols = len(matrix[0]) if rows else 0
+    
+    return rows, cols
+
+
+def _clip(window, size):
+    """Ořízne okno (start, stop) na rozsah 0..size."""
+    if window is None:
+        return 0, size
+    start, stop = window
+    start = min(max(start, 0), size)
+    stop = size if stop is None else min(max(stop, start), size)
+    return start, stop
+
+
+class MatrixPrinter:
+    """
+    Proudový výpis matice po blocích sloupců.
+    
+    Použití:
+        printer = MatrixPrinter(matrix, width=120, rows=(0, 50))
+        printer.write(sys.stdout)
+        printer.write_to_file('matice.txt')
+    """
+    
+    def __init__(self, matrix, row_labels=None, col_labels=None, width=DEFAULT_WIDTH,
+                 rows=None, cols=None, cell_width=CELL_WIDTH):
+        """
+        Args:
+            matrix: NamedMatrix, 2D seznam nebo libovolný objekt s matrix[i][j]
+            row_labels (list): Popisky řádků (výchozí z NamedMatrix)
+            col_labels (list): Popisky sloupců (výchozí z NamedMatrix)
+            width (int): Maximální šířka řádku výstupu ve znacích
+            rows (tuple): Okno řádků (start, stop) nebo None pro všechny
+            cols (tuple): Okno sloupců (start, stop) nebo None pro všechny
+            cell_width (int): Minimální šířka buňky
+        """
+        if row_labels is None and hasattr(matrix, 'row_labels'):
+            row_labels = matrix.row_labels()
+        if col_labels is None and hasattr(matrix, 'col_labels'):
+            col_labels = matrix.col_labels()
+        
+        self.matrix = matrix
+        self.row_labels = row_labels
+        self.col_labels = col_labels
+        self.width = width
+        self.cell_width = cell_width
+        
+        self.n_rows, self.n_cols = _matrix_shape(matrix, row_labels, col_labels)
+        self.row_start, self.row_stop = _clip(rows, self.n_rows)
+        self.col_start, self.col_stop = _clip(cols, self.n_cols)
+        
+        # Šířka popisku řádku - počítáme jen přes zobrazené řádky
+        self.label_width = LABEL_WIDTH
+        if row_labels:
+            for i in range(self.row_start, self.row_stop):
+                self.label_width = max(self.label_width, len(str(row_labels[i])))
+    
+    def _col_label(self, j):
+        """Popisek sloupce j."""
+        return str(self.col_labels[j]) if self.col_labels else str(j)
+    
+    def _row_label(self, i):
+        """Popisek řádku i."""
+        return str(self.row_labels[i]) if self.row_labels else str(i)
+    
+    def _column_blocks(self):
+        """
+        Rozdělí zobrazené sloupce do bloků, které se vejdou do šířky výstupu.
+        
+        Yields:
+            tuple: (start, stop, cell_width) pro každý blok
+        """
+        prefix = self.label_width + 1
+        j = self.col_start
+        while j < self.col_stop:
+            start = j
+            cell = self.cell_width
+            while j < self.col_stop:
+                label_len = len(self._col_label(j))
+                new_cell = max(cell, label_len)
+                # Šířka bloku s novou šířkou buňky (buňky oddělené mezerou)
+                new_used = prefix + (j - start + 1) * (new_cell + 1) - 1
+                if j > start and new_used > self.width:
+                    break
+                cell = new_cell
+                j += 1
+            yield start, j, cell
+    
+    def write(self, out=None):
+        """
+        Zapíše matici do souborového objektu.
+        
+        Args:
+            out: Objekt s metodou write() (výchozí sys.stdout)
+        
+        Returns:
+            int: Počet zapsaných řádků textu
+        """
+        if out is None:
+            out = sys.stdout
+        
+        matrix = self.matrix
+        lines_written = 0
+        blocks = list(self._column_blocks()) if self.row_start < self.row_stop else []
+        
+        for block_num, (c_start, c_stop, cell) in enumerate(blocks):
+            if len(blocks) > 1:
+                out.write(f"[sloupce {c_start}-{c_stop - 1} z {self.n_cols}]\n")
+                lines_written += 1
+            
+            # Hlavička bloku
+            header = " " * (self.label_width + 1) + " ".join(
+                f"{self._col_label(j):>{cell}}" for j in range(c_start, c_stop)
+            )
+            out.write(header + "\n")
+            lines_written += 1
+            
+            # Řádky bloku - čteme jen buňky v okně
+            for i in range(self.row_start, self.row_stop):
+                row = matrix[i]
+                cells = " ".join(format_value(row[j], cell) for j in range(c_start, c_stop))
+                out.write(f"{self._row_label(i):>{self.label_width}}:{cells}\n")
+                lines_written += 1
+            
+            if block_num < len(blocks) - 1:
+                out.write("\n")
+                lines_written += 1
+        
+        return lines_written
+    
+    def write_to_file(self, filepath):
+        """
+        Zapíše matici přímo na disk přes bufferovaný soubor.
+        
+        Args:
+            filepath (str): Cesta k výstupnímu souboru
+        
+        Returns:
+            int: Počet zapsaných řádků textu
+        """
+        with open(filepath, 'w', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as f:
+            return self.write(f)
+    
+    def window_description(self):
+        """Textový popis zobrazeného okna (pro nadpisy)."""
+        if (self.row_start, self.row_stop) == (0, self.n_rows) and \
+                (self.col_start, self.col_stop) == (0, self.n_cols):
+            return ""
+        return (f"okno řádků {self.row_start}:{self.row_stop}, "
+                f"sloupců {self.col_start}:{self.col_stop}")
+
+
+def format_labels(labels, limit=50):
+    """
+    Zkrácený výpis seznamu popisků (pro velké matice).
+    
+    Args:
+        labels (list): Popisky
+        limit (int): Maximální počet vypsaných popisků
+    
+    Returns:
+        str: Textová podoba seznamu
+    """
+    if len(labels) <= limit:
+        return str(list(labels))
+    shown = ", ".join(repr(label) for label in labels[:limit])
+    return f"[{shown}, ... (+{len(labels) - limit})]"
+
+
+def print_matrix_stream(matrix, title="Matice", out=None, show_dimensions=True, **options):
+    """
+    Vypíše matici s nadpisem po blocích sloupců.
+    
+    Args:
+        matrix: Matice (NamedMatrix nebo 2D seznam)
+        title (str): Nadpis
+        out: Výstupní souborový objekt (výchozí sys.stdout)
+        show_dimensions (bool): Zda vypsat rozměry
+        **options: Parametry pro MatrixPrinter (width, rows, cols, ...)
+    
+    Returns:
+        MatrixPrinter: Použitá tiskárna
+    """
+    if out is None:
+        out = sys.stdout
+    
+    printer = MatrixPrinter(matrix, **options)
+    out.write(f"\n{title}:\n")
+    if show_dimensions:
+        out.write(f"Rozměry: {printer.n_rows} řádků × {printer.n_cols} sloupců\n")
+    window = printer.window_description()
+    if window:
+        out.write(f"Zobrazeno: {window}\n")
+    out.write("-" * 60 + "\n")
+    printer.write(out)
+    out.write("\n")
+    return printer
@@ -0,0 +1,258 @@
+"""
+Lehká instrumentace - měření času, počtu volání a paměti jednotlivých fází.
+
+Měřené funkce se označí dekorátorem @profiled, libovolný blok kódu pak
+kontextovým manažerem stage('název'). Dokud není měření zapnuté přes
+enable(), stojí každé volání jen jednu kontrolu příznaku.
+
+Použití:
+    from src import profiling
+    
+    profiling.enable(memory=True)
+    analyzer.analyze_all()
+    print(profiling.report())        # {'GraphAnalyzer.is_planar': {...}, ...}
+    print(profiling.format_report())
+"""
+
+import functools
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+_enabled = False
+_memory = False
+_started_tracemalloc = False
+
+_lock = threading.Lock()
+_stats = {}  # {název: [počet volání, celkový čas, maximální čas, špička paměti]}
+_frames = threading.local()
+
+
+def enable(memory=False):
+    """
+    Zapne sběr statistik.
+    
+    Args:
+        memory (bool): Měřit i špičku alokované paměti přes tracemalloc
+                       (výrazně zpomaluje běh, časy jsou pak jen orientační)
+    """
+    global _enabled, _memory, _started_tracemalloc
+    _memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    _enabled = True
+
+
+def disable():
+    """Vypne sběr statistik (nasbíraná data zůstávají)."""
+    global _enabled, _memory, _started_tracemalloc
+    _enabled = False
+    _memory = False
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+
+def is_enabled():
+    """Vrací True, pokud se statistiky sbírají."""
+    return _enabled
+
+
+def reset():
+    """Smaže nasbírané statistiky."""
+    with _lock:
+        _stats.clear()
+
+
+def _memory_stack():
+    """Zásobník rozpracovaných měření paměti aktuálního vlákna."""
+    stack = getattr(_frames, 'stack', None)
+    if stack is None:
+        stack = _frames.stack = []
+    return stack
+
+
+def _enter_memory():
+    """
+    Začátek měření paměti.
+    
+    tracemalloc má jen jednu globální špičku - před jejím vynulováním ji
+    proto připíšeme rozpracovanému nadřazenému měření.
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    stack = _memory_stack()
+    if stack:
+        stack[-1][1] = max(stack[-1][1], peak)
+    tracemalloc.reset_peak()
+    stack.append([current, current])
+
+
+def _exit_memory():
+    """
+    Konec měření paměti.
+    
+    Returns:
+        int: Špička paměti alokované během měřeného bloku (bajty)
+    """
+    _, peak = tracemalloc.get_traced_memory()
+    stack = _memory_stack()
+    start, frame_peak = stack.pop()
+    frame_peak = max(frame_peak, peak)
+    if stack:
+        stack[-1][1] = max(stack[-1][1], frame_peak)
+    return frame_peak - start
+
+
+def _record(name, elapsed, memory):
+    """Připíše jedno měření do statistik."""
+    with _lock:
+        entry = _stats.get(name)
+        if entry is None:
+            entry = _stats[name] = [0, 0.0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] = max(entry[2], elapsed)
+        entry[3] = max(entry[3], memory)
+
+
+def _measure(name, call):
+    """Změří jedno zavolání funkce call()."""
+    memory = _memory and tracemalloc.is_tracing()
+    if memory:
+        _enter_memory()
+    start = time.perf_counter()
+    try:
+        return call()
+    finally:
+        elapsed = time.perf_counter() - start
+        _record(name, elapsed, _exit_memory() if memory else 0)
+
+
+def profiled(name=None):
+    """
+    Dekorátor měřené funkce.
+    
+    Args:
+        name (str): Název ve statistikách (výchozí Třída.metoda)
+    
+    Použití:
+        @profiled()
+        def distance_matrix(self): ...
+    """
+    def decorator(func):
+        label = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            return _measure(label, lambda: func(*args, **kwargs))
+        
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def stage(name):
+    """
+    Změří blok kódu jako samostatnou fázi.
+    
+    Args:
+        name (str): Název fáze ve statistikách
+    """
+    if not _enabled:
+        yield
+        return
+    
+    memory = _memory and tracemalloc.is_tracing()
+    if memory:
+        _enter_memory()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _record(name, elapsed, _exit_memory() if memory else 0)
+
+
+def report():
+    """
+    Nasbírané statistiky.
+    
+    Returns:
+        dict: {název: {'calls': int, 'total_time': float, 'mean_time': float,
+                       'max_time': float, 'peak_memory': int}}
+              Časy jsou v sekundách, paměť v bajtech (0 pokud se neměřila).
+    """
+    with _lock:
+        return {
+            name: {
+                'calls': calls,
+                'total_time': total,
+                'mean_time': total / calls,
+                'max_time': longest,
+                'peak_memory': peak,
+            }
+            for name, (calls, total, longest, peak) in _stats.items()
+        }
+
+
+def format_report(stats=None):
+    """
+    Textová tabulka statistik seřazená podle celkového času.
+    
+    Args:
+        stats (dict): Výsledek report() (výchozí aktuální statistiky)
+    
+    Returns:
+        str: Tabulka pro výpis
+    """
+    if stats is None:
+        stats = report()
+    
+    lines = [f"{'Fáze':<45} {'volání':>8} {'celkem [ms]':>12} {'max [ms]':>10} {'paměť [kB]':>11}"]
+    lines.append("-" * len(lines[0]))
+    for name, entry in sorted(stats.items(), key=lambda item: -item[1]['total_time']):
+        lines.append(
+            f"{name:<45} {entry['calls']:>8} {entry['total_time'] * 1000:>12.2f} "
+            f"{entry['max_time'] * 1000:>10.2f} {entry['peak_memory'] / 1024:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def extract_profile_flag(argv):
+    """
+    Vyjme z argumentů volby --profile a --profile-memory a případně zapne měření.
+    
+    --profile měří jen časy a počty volání. Měření paměti přes tracemalloc
+    běh výrazně zpomaluje, zapíná se proto zvlášť volbou --profile-memory
+    (ta zapne i měření časů).
+    
+    Args:
+        argv (list): Argumenty příkazové řádky
+    
+    Returns:
+        tuple: (zbylé argumenty, True pokud bylo měření zapnuto)
+    """
+    flags = ('--profile', '--profile-memory')
+    rest = [arg for arg in argv if arg not in flags]
+    profile = len(rest) != len(argv)
+    if profile:
+        enable(memory='--profile-memory' in argv)
+    return rest, profile
+
+
+def print_report(out=None):
+    """
+    Vypíše tabulku statistik (výchozí na stderr, aby nemíchala s výstupem).
+    
+    Args:
+        out: Výstupní souborový objekt
+    """
+    if out is None:
+        out = sys.stderr
+    out.write("\nPROFIL BĚHU\n" + format_report() + "\n")
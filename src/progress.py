@@ -0,0 +1,151 @@
+"""
+Hlášení průběhu a kooperativní rušení dlouhých výpočtů.
+
+Výpočetní jádra (Floyd-Warshall, mocniny matic, silná souvislost) přijímají
+volitelný objekt Progress. Průběžně volají progress.update(hotovo), čímž
+nahlásí postup a zároveň zkontrolují, zda nebyl výpočet zrušen - v tom
+případě update() vyhodí ComputationCancelled.
+"""
+
+import threading
+import time
+
+
+class ComputationCancelled(Exception):
+    """Výpočet byl zrušen přes Progress.cancel()."""
+
+
+class Progress:
+    """
+    Token průběhu výpočtu s možností zrušení.
+    
+    Použití:
+        progress = Progress(callback=lambda p: print(p.describe()))
+        builder.distance_matrix(progress=progress)
+        
+        # Z jiného vlákna nebo obsluhy signálu:
+        progress.cancel()
+    """
+    
+    def __init__(self, callback=None, interval=0.2):
+        """
+        Args:
+            callback (callable): Funkce volaná s tímto objektem při hlášení průběhu
+            interval (float): Minimální odstup hlášení v sekundách (první hlášení
+                              přijde až po uplynutí intervalu od začátku úlohy)
+        """
+        self.callback = callback
+        self.interval = interval
+        self._cancelled = threading.Event()
+        
+        self.task = None       # Název právě běžící úlohy
+        self.total = None      # Celkový počet kroků (None = neznámý)
+        self.done = 0          # Počet hotových kroků
+        self.active = False    # True mezi begin() a finish()
+        self.reported = False  # Zda už byl průběh této úlohy nahlášen
+        self._started = None
+        self._last_report = None
+    
+    def begin(self, task, total=None):
+        """
+        Zahájí novou úlohu.
+        
+        Args:
+            task (str): Název úlohy (např. 'floyd_warshall')
+            total (int): Celkový počet kroků
+        """
+        self.check()
+        self.task = task
+        self.total = total
+        self.done = 0
+        self.active = True
+        self.reported = False
+        self._started = self._last_report = time.monotonic()
+    
+    def update(self, done):
+        """
+        Nahlásí počet hotových kroků a zkontroluje zrušení.
+        
+        Args:
+            done (int): Počet hotových kroků
+        
+        Raises:
+            ComputationCancelled: Pokud byl výpočet zrušen
+        """
+        self.done = done
+        self.check()
+        
+        if self.callback is not None:
+            now = time.monotonic()
+            if now - self._last_report >= self.interval:
+                self._last_report = now
+                self.reported = True
+                self.callback(self)
+    
+    def finish(self):
+        """Ukončí úlohu (a nahlásí konec, pokud se průběh hlásil)."""
+        if self.total is not None:
+            self.done = self.total
+        self.active = False
+        if self.callback is not None and self.reported:
+            self.callback(self)
+    
+    def check(self):
+        """
+        Vyhodí ComputationCancelled, pokud byl výpočet zrušen.
+        
+        Raises:
+            ComputationCancelled: Pokud byl výpočet zrušen
+        """
+        if self._cancelled.is_set():
+            self.active = False
+            raise ComputationCancelled(f"Výpočet '{self.task}' byl zrušen")
+    
+    def cancel(self):
+        """Požádá o zrušení výpočtu (bezpečné z jiného vlákna i obsluhy signálu)."""
+        self._cancelled.set()
+    
+    @property
+    def cancelled(self):
+        """True pokud bylo požádáno o zrušení."""
+        return self._cancelled.is_set()
+    
+    def fraction(self):
+        """
+        Podíl hotové práce.
+        
+        Returns:
+            float: 0.0 až 1.0 nebo None, pokud celkový počet kroků není znám
+        """
+        if not self.total:
+            return None
+        return min(self.done / self.total, 1.0)
+    
+    def eta(self):
+        """
+        Odhad zbývajícího času z dosavadní rychlosti.
+        
+        Returns:
+            float: Zbývající sekundy nebo None, pokud je nelze odhadnout
+        """
+        fraction = self.fraction()
+        if not fraction or self._started is None:
+            return None
+        elapsed = time.monotonic() - self._started
+        return elapsed * (1 - fraction) / fraction
+    
+    def describe(self):
+        """
+        Textový popis průběhu.
+        
+        Returns:
+            str: Např. 'floyd_warshall 45 % (zbývá ~3 s)'
+        """
+        fraction = self.fraction()
+        if fraction is None:
+            return f"{self.task} ({self.done} kroků)"
+        text = f"{self.task} {fraction * 100:.0f} %"
+        eta = self.eta()
+        if eta is not None and self.active:
+            text += f" (zbývá ~{eta:.0f} s)"
+        return text
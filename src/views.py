@@ -0,0 +1,248 @@
+"""
+Zmenšené pohledy na graf pro kreslení velkých grafů.
+
+Celý graf se statisíci uzly je na obrázku nečitelný a jeho vykreslení trvá
+dlouho. Pohled je menší Graph, který se kreslí obvyklými funkcemi
+z visualizer.py:
+    - ego_subgraph: okolí uzlu do vzdálenosti radius (BFS bez ohledu na
+      směr hran) - cena závisí jen na velikosti okolí, ne na velikosti grafu,
+    - condensed_graph: komponenty silné nebo slabé souvislosti stažené do
+      super-uzlů, hrany mezi komponentami sečtené do jedné hrany.
+
+Pohled sdílí objekty Node a Edge s původním grafem (kromě super-uzlů
+a sečtených hran, které jsou nové).
+"""
+
+from itertools import chain
+
+from .components import strong_components
+from .graph import Graph
+from .parser import Edge, Node
+
+
+# Režimy stažení komponent pro condensed_graph / select_view
+COLLAPSE_MODES = ('scc', 'components')
+
+
+def _incident(graph, node_id):
+    """Dvojice (soused, hrana) pro všechny hrany uzlu bez ohledu na směr."""
+    # get() místo indexování - defaultdict by pro uzel bez hran založil prázdný seznam
+    return chain(graph.adjacency_list.get(node_id, ()), graph.in_neighbors.get(node_id, ()))
+
+
+def ego_nodes(graph, center, radius=1, max_nodes=None):
+    """
+    Uzly do vzdálenosti radius od center (směry hran se ignorují).
+    
+    Args:
+        graph (Graph): Graf
+        center (str): Středový uzel
+        radius (int): Největší počet hran od středu
+        max_nodes (int): Volitelný strop počtu uzlů - BFS skončí po jeho dosažení
+    
+    Returns:
+        dict: {uzel: vzdálenost od středu} v pořadí BFS
+    
+    Raises:
+        KeyError: Pokud středový uzel v grafu není
+        ValueError: Pokud je poloměr záporný
+    """
+    if center not in graph.nodes:
+        raise KeyError(f"Uzel '{center}' neexistuje v grafu")
+    if radius < 0:
+        raise ValueError(f"Poloměr okolí musí být nezáporný, ne {radius}")
+    
+    distances = {center: 0}
+    frontier = [center]
+    for distance in range(1, radius + 1):
+        following = []
+        for node_id in frontier:
+            for neighbor, _ in _incident(graph, node_id):
+                if neighbor in distances:
+                    continue
+                if max_nodes is not None and len(distances) >= max_nodes:
+                    return distances
+                distances[neighbor] = distance
+                following.append(neighbor)
+        if not following:
+            break
+        frontier = following
+    return distances
+
+
+def subgraph(graph, node_ids):
+    """
+    Podgraf indukovaný uzly - všechny hrany, jejichž oba konce jsou mezi node_ids.
+    
+    Prochází jen hrany vybraných uzlů, cena je úměrná velikosti výběru
+    a jeho hranice.
+    
+    Args:
+        graph (Graph): Graf
+        node_ids (iterable): Identifikátory uzlů (neexistující se přeskočí)
+    
+    Returns:
+        Graph: Podgraf
+    """
+    selected = [node_id for node_id in node_ids if node_id in graph.nodes]
+    inside = set(selected)
+    seen = set()
+    edges = []
+    for node_id in selected:
+        for neighbor, edge in _incident(graph, node_id):
+            # Neorientovaná hrana je v seznamech obou konců (smyčka dvakrát)
+            if neighbor in inside and id(edge) not in seen:
+                seen.add(id(edge))
+                edges.append(edge)
+    return Graph([graph.nodes[node_id] for node_id in selected], edges)
+
+
+def ego_subgraph(graph, center, radius=1, max_nodes=None):
+    """
+    Okolí uzlu jako podgraf - uzly do vzdálenosti radius a hrany mezi nimi.
+    
+    Args:
+        graph (Graph): Graf
+        center (str): Středový uzel
+        radius (int): Největší počet hran od středu (bez ohledu na směr)
+        max_nodes (int): Volitelný strop počtu uzlů
+    
+    Returns:
+        Graph: Podgraf okolí
+    
+    Raises:
+        KeyError: Pokud středový uzel v grafu není
+    """
+    return subgraph(graph, ego_nodes(graph, center, radius, max_nodes))
+
+
+def condensed_graph(graph, mode='scc'):
+    """
+    Graf komponent - každá komponenta je jeden super-uzel.
+    
+    Super-uzel s jedním členem má název tohoto uzlu, větší komponenta
+    název svého nejmenšího uzlu s počtem dalších členů ('A +3'). Ohodnocení
+    super-uzlu je počet členů. Hrany mezi dvěma komponentami se sečtou do
+    jedné orientované hrany s ohodnocením rovným jejich počtu, hrany uvnitř
+    komponent se vynechají.
+    
+    Args:
+        graph (Graph): Graf
+        mode (str): 'scc' - komponenty silné souvislosti (mezi nimi vede
+                    acyklický graf), 'components' - komponenty slabé
+                    souvislosti (izolované super-uzly)
+    
+    Returns:
+        tuple: (Graph komponent, {super-uzel: [uzly komponenty]})
+    
+    Raises:
+        ValueError: Pokud režim není 'scc' ani 'components'
+    """
+    if mode not in COLLAPSE_MODES:
+        raise ValueError(f"Neznámý režim stažení '{mode}' (povoleno: {', '.join(COLLAPSE_MODES)})")
+    
+    node_list = list(graph.nodes)
+    index = {node_id: i for i, node_id in enumerate(node_list)}
+    successors = [[] for _ in node_list]
+    for edge in graph.edges_list:
+        i, j = index[edge.source], index[edge.target]
+        successors[i].append(j)
+        if not edge.directed or mode == 'components':
+            successors[j].append(i)
+    
+    component, components = strong_components(successors)
+    
+    # Super-uzly
+    names = []
+    members = {}
+    nodes = []
+    for member_indices in components:
+        member_ids = sorted(node_list[i] for i in member_indices)
+        name = member_ids[0] if len(member_ids) == 1 else f"{member_ids[0]} +{len(member_ids) - 1}"
+        names.append(name)
+        members[name] = member_ids
+        nodes.append(Node(name, float(len(member_ids))))
+    
+    # Sečtené hrany mezi komponentami (uvnitř 'components' žádné nejsou)
+    counts = {}
+    for edge in graph.edges_list:
+        a = component[index[edge.source]]
+        b = component[index[edge.target]]
+        if a != b:
+            counts[(a, b)] = counts.get((a, b), 0) + 1
+    edges = [Edge(names[a], names[b], directed=True, weight=float(count))
+             for (a, b), count in counts.items()]
+    
+    return Graph(nodes, edges), members
+
+
+def extract_view_options(argv):
+    """
+    Vyjme z argumentů volby pohledu pro kreslení.
+    
+    Podporované volby:
+        --focus <uzel>       Kreslit jen okolí uzlu
+        --radius <n>         Poloměr okolí (výchozí 1)
+        --collapse <režim>   Stáhnout komponenty ('scc' nebo 'components')
+        --max-nodes <n>      Strop počtu uzlů okolí
+    
+    Args:
+        argv (list): Argumenty příkazové řádky
+    
+    Returns:
+        tuple: (zbylé argumenty, slovník voleb pro visualize_graph / select_view)
+    
+    Raises:
+        ValueError: Pokud volbě chybí hodnota nebo hodnota není platná
+    """
+    rest = []
+    options = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg not in ('--focus', '--radius', '--collapse', '--max-nodes'):
+            rest.append(arg)
+            i += 1
+            continue
+        if i + 1 >= len(argv):
+            raise ValueError(f"Volba {arg} vyžaduje hodnotu")
+        value = argv[i + 1]
+        if arg == '--focus':
+            options['focus'] = value
+        elif arg == '--collapse':
+            if value not in COLLAPSE_MODES:
+                raise ValueError(f"Neznámý režim stažení '{value}' (povoleno: {', '.join(COLLAPSE_MODES)})")
+            options['collapse'] = value
+        else:
+            key, minimum = ('radius', 0) if arg == '--radius' else ('max_nodes', 1)
+            try:
+                number = int(value)
+            except ValueError:
+                number = minimum - 1
+            if number < minimum:
+                raise ValueError(f"Volba {arg} vyžaduje celé číslo aspoň {minimum}, ne '{value}'")
+            options[key] = number
+        i += 2
+    return rest, options
+
+
+def select_view(graph, focus=None, radius=1, collapse=None, max_nodes=None):
+    """
+    Pohled na graf pro kreslení podle zadaných voleb.
+    
+    Args:
+        graph (Graph): Graf
+        focus (str): Středový uzel okolí (None = celý graf)
+        radius (int): Poloměr okolí
+        collapse (str): Stažení komponent - 'scc', 'components' nebo None
+        max_nodes (int): Volitelný strop počtu uzlů okolí
+    
+    Returns:
+        Graph: Pohled (bez voleb původní graf); nejdřív se vybere okolí,
+               potom se stáhnou jeho komponenty
+    """
+    if focus is not None:
+        graph = ego_subgraph(graph, focus, radius, max_nodes)
+    if collapse is not None:
+        graph, _ = condensed_graph(graph, collapse)
+    return graph
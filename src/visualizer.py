@@ -2,6 +2,29 @@
 Modul pro vizualizaci grafů.
 """
 
+import math
+
+from .formats import open_output, xml_escape
+from .layout import DEFAULT_SEED, force_layout
+from .views import select_view
+
+
+# Grafy s nejvýše tolika uzly se kreslí s popisky, šipkami a velkými uzly
+LABEL_MAX_NODES = 100
+
+# Prohnutí vícenásobných hran (podíl délky hrany) a velikost smyčky (podíl ideální délky hrany)
+PARALLEL_BEND = 0.15
+LOOP_SIZE = 0.25
+
+# Rozměry obrázku SVG (v pixelech) a okraj kolem kresby
+SVG_WIDTH = 1200
+SVG_HEIGHT = 800
+SVG_MARGIN = 40
+
+# Poloměr uzlu v SVG - s popisky / bez popisků (velké grafy)
+SVG_NODE_RADIUS = 18
+SVG_DOT_RADIUS = 2
+
 
 class TextVisualizer:
     """Třída pro textovou vizualizaci grafu."""
@@ -155,113 +178,132 @@ def try_graphviz_visualization(graph, output_file='graph_output'):
         return False
 
 
-def try_matplotlib_visualization(graph, output_file='graph_output.png'):
+def _edge_polylines(graph, layout):
     """
-    Pokusí se vytvořit vizualizaci pomocí matplotlib a networkx.
+    Lomené čáry hran pro LineCollection.
+    
+    Rovná hrana má dva body. Vícenásobné hrany mezi stejnými uzly se
+    prohnou střídavě na obě strany přes posunutý střed, smyčka je malý
+    kosočtverec nad uzlem.
+    
+    Returns:
+        list: Seznam čar [(x, y), ...] ve stejném pořadí jako graph.edges_list
+    """
+    seen = {}
+    polylines = []
+    for edge in graph.edges_list:
+        source, target = (edge.source, edge.target) if edge.directed else (edge.node1, edge.node2)
+        x1, y1 = layout.position(source)
+        x2, y2 = layout.position(target)
+        
+        if source == target:
+            r = LOOP_SIZE * layout.scale
+            polylines.append([(x1, y1), (x1 - r, y1 + r), (x1, y1 + 2 * r), (x1 + r, y1 + r), (x1, y1)])
+            continue
+        
+        # Pořadí hrany mezi hranami stejné dvojice uzlů: 0, 1, -1, 2, -2, ...
+        key = (source, target) if source < target else (target, source)
+        rank = seen.get(key, 0)
+        seen[key] = rank + 1
+        if rank == 0:
+            polylines.append([(x1, y1), (x2, y2)])
+            continue
+        
+        offset = (rank + 1) // 2 * (1 if rank % 2 else -1) * PARALLEL_BEND
+        # Kolmice vztažená k pevnému pořadí uzlů, aby opačné směry neprohnuly stejně
+        sign = 1 if source == key[0] else -1
+        dx, dy = x2 - x1, y2 - y1
+        mid = ((x1 + x2) / 2 - dy * offset * sign, (y1 + y2) / 2 + dx * offset * sign)
+        polylines.append([(x1, y1), mid, (x2, y2)])
+    return polylines
+
+
+def _edge_caption(edge):
+    """Popisek hrany - váha a označení (prázdný řetězec, pokud nemá ani jedno)."""
+    parts = []
+    if edge.weight is not None:
+        parts.append(str(edge.weight))
+    if edge.label:
+        parts.append(edge.label)
+    return ' '.join(parts)
+
+
+def try_matplotlib_visualization(graph, output_file='graph_output.png', seed=DEFAULT_SEED):
+    """
+    Pokusí se vytvořit vizualizaci pomocí matplotlib.
+    
+    Pozice uzlů počítá víceúrovňový silový algoritmus z layout.py, hrany se
+    kreslí jednou LineCollection. Popisky, šipky a velké značky uzlů jen pro
+    grafy do LABEL_MAX_NODES uzlů - u větších grafů by nebyly čitelné.
     
     Args:
         graph (Graph): Instance grafu
         output_file (str): Název výstupního souboru
+        seed (int): Seed rozložení uzlů
         
     Returns:
         bool: True pokud bylo vykreslení úspěšné
     """
     try:
         import matplotlib.pyplot as plt
-        import networkx as nx
-        
-        # Detekce vícenásobných hran
-        has_multiple = graph.has_multiple_edges()
+        from matplotlib.collections import LineCollection
         
-        # Vytvoříme NetworkX graf - použijeme Multi* pro grafy s vícenásobnými hranami
-        if graph.is_directed():
-            G = nx.MultiDiGraph() if has_multiple else nx.DiGraph()
-        else:
-            G = nx.MultiGraph() if has_multiple else nx.Graph()
+        layout = force_layout(graph, seed=seed)
+        detailed = len(layout) <= LABEL_MAX_NODES
+        polylines = _edge_polylines(graph, layout)
         
-        # Přidáme uzly
-        for node_id in graph.nodes.keys():
-            G.add_node(node_id)
+        fig, ax = plt.subplots(figsize=(12, 8))
         
-        # Přidáme hrany
-        for edge in graph.edges_list:
-            if edge.directed:
-                G.add_edge(edge.source, edge.target, weight=edge.weight, label=edge.label)
-            else:
-                G.add_edge(edge.node1, edge.node2, weight=edge.weight, label=edge.label)
-        
-        # Vykreslíme
-        plt.figure(figsize=(12, 8))
-        
-        # Pro grafy s více komponentami nebo izolovanými uzly použijeme seed
-        try:
-            pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-        except:
-            # Fallback na jiný layout
-            try:
-                pos = nx.kamada_kawai_layout(G)
-            except:
-                pos = nx.circular_layout(G)
+        # Hrany
+        ax.add_collection(LineCollection(polylines, colors='gray',
+                                         linewidths=2 if detailed else 0.5,
+                                         alpha=0.6, zorder=1))
         
         # Uzly
-        nx.draw_networkx_nodes(G, pos, node_color='lightblue', 
-                               node_size=1500, alpha=0.9)
+        ax.scatter(layout.xs, layout.ys, s=1500 if detailed else 4,
+                   c='lightblue', alpha=0.9, zorder=2)
         
-        # Hrany - šipky pouze pro orientované grafy
-        is_directed = graph.is_directed()
-        
-        # Pro grafy s vícenásobnými hranami používáme connectionstyle
-        if has_multiple:
-            if is_directed:
-                nx.draw_networkx_edges(G, pos, width=2, alpha=0.6, 
-                                       arrows=True, arrowsize=20,
-                                       connectionstyle='arc3,rad=0.1')
-            else:
-                nx.draw_networkx_edges(G, pos, width=2, alpha=0.6, 
-                                       arrows=False,
-                                       connectionstyle='arc3,rad=0.1')
-        else:
-            if is_directed:
-                nx.draw_networkx_edges(G, pos, width=2, alpha=0.6, 
-                                       arrows=True, arrowsize=20)
-            else:
-                nx.draw_networkx_edges(G, pos, width=2, alpha=0.6, 
-                                       arrows=False)
-        
-        # Popisky uzlů
-        nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold')
-        
-        # Popisky hran (váhy)
-        edge_labels = {}
-        for edge in graph.edges_list:
-            if edge.directed:
-                key = (edge.source, edge.target)
-            else:
-                key = (edge.node1, edge.node2)
+        if detailed:
+            # Šipky - pouze pro orientované hrany, na posledním úseku čáry
+            for edge, line in zip(graph.edges_list, polylines):
+                if edge.directed and edge.node1 != edge.node2:
+                    ax.annotate('', xy=line[-1], xytext=line[-2],
+                                arrowprops=dict(arrowstyle='-|>', color='gray',
+                                                shrinkA=0, shrinkB=22, mutation_scale=20),
+                                zorder=3)
             
-            label_parts = []
-            if edge.weight is not None:
-                label_parts.append(str(edge.weight))
-            if edge.label:
-                label_parts.append(edge.label)
+            # Popisky uzlů
+            for node, x, y in zip(layout.node_list, layout.xs, layout.ys):
+                ax.text(x, y, node, fontsize=12, fontweight='bold',
+                        ha='center', va='center', zorder=4)
             
-            if label_parts:
-                edge_labels[key] = ' '.join(label_parts)
-        
-        if edge_labels:
-            nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=10)
+            # Popisky hran (váhy) - uprostřed čáry
+            for edge, line in zip(graph.edges_list, polylines):
+                caption = _edge_caption(edge)
+                if caption:
+                    if len(line) == 2:
+                        (x1, y1), (x2, y2) = line
+                        x, y = (x1 + x2) / 2, (y1 + y2) / 2
+                    else:
+                        x, y = line[len(line) // 2]
+                    ax.text(x, y, caption, fontsize=10, ha='center', va='center',
+                            bbox=dict(boxstyle='round', fc='white', ec='none', alpha=0.8),
+                            zorder=4)
         
-        plt.axis('off')
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
-        plt.close()
+        ax.autoscale()
+        ax.margins(0.1)
+        ax.set_aspect('equal')
+        ax.axis('off')
+        fig.tight_layout()
+        fig.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.close(fig)
         
         print(f"Graf vykreslen do souboru: {output_file}")
         return True
         
     except ImportError as e:
         print(f"Chybí požadované knihovny: {e}")
-        print("Pro instalaci: pip install matplotlib networkx")
+        print("Pro instalaci: pip install matplotlib")
         return False
     except Exception as e:
         print(f"Chyba při vykreslování grafu: {e}")
@@ -269,18 +311,145 @@ def try_matplotlib_visualization(graph, output_file='graph_output.png'):
         return False
 
 
-def visualize_graph(graph, method='auto', output_file='graph_output'):
+def _svg_point(point):
+    return f"{point[0]:.1f},{point[1]:.1f}"
+
+
+def _svg_shorten(line, distance):
+    """Čára zkrácená na konci o distance - šipka má končit na okraji uzlu, ne ve středu."""
+    (x1, y1), (x2, y2) = line[-2], line[-1]
+    length = math.hypot(x2 - x1, y2 - y1)
+    if length <= distance:
+        return line
+    ratio = (length - distance) / length
+    return line[:-1] + [(x1 + (x2 - x1) * ratio, y1 + (y2 - y1) * ratio)]
+
+
+def write_svg(graph, target, seed=DEFAULT_SEED, width=SVG_WIDTH, height=SVG_HEIGHT):
+    """
+    Vykreslí graf do SVG čistě v Pythonu (bez matplotlib a graphviz).
+    
+    Pozice uzlů počítá layout.force_layout, prvky se zapisují rovnou jako
+    text do souboru - hrany, uzly, šipky orientovaných hran a popisky. Šipky
+    a popisky jen pro grafy do LABEL_MAX_NODES uzlů, větší grafy se kreslí
+    tenkými čarami a malými tečkami.
+    
+    Args:
+        graph (Graph): Instance grafu
+        target: Cesta k souboru nebo textový proud
+        seed (int): Seed rozložení uzlů
+        width (int): Šířka obrázku v pixelech
+        height (int): Výška obrázku v pixelech
+    """
+    layout = force_layout(graph, seed=seed).fit(width, height, SVG_MARGIN)
+    detailed = len(layout) <= LABEL_MAX_NODES
+    radius = SVG_NODE_RADIUS if detailed else SVG_DOT_RADIUS
+    polylines = _edge_polylines(graph, layout)
+    
+    with open_output(target) as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                f'viewBox="0 0 {width} {height}">\n'
+                '<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" '
+                'markerWidth="8" markerHeight="8" orient="auto">'
+                '<path d="M0,0L10,5L0,10z" fill="gray"/></marker></defs>\n'
+                '<rect width="100%" height="100%" fill="white"/>\n')
+        
+        # Hrany - šipky pouze pro orientované hrany mimo smyčky
+        f.write(f'<g stroke="gray" stroke-opacity="0.6" stroke-width="{2 if detailed else 0.5}" '
+                'fill="none">\n')
+        for edge, line in zip(graph.edges_list, polylines):
+            arrow = detailed and edge.directed and edge.node1 != edge.node2
+            if arrow:
+                line = _svg_shorten(line, radius)
+            marker = ' marker-end="url(#arrow)"' if arrow else ''
+            if len(line) == 2:
+                (x1, y1), (x2, y2) = line
+                f.write(f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}"{marker}/>\n')
+            else:
+                f.write(f'<polyline points="{" ".join(map(_svg_point, line))}"{marker}/>\n')
+        f.write('</g>\n')
+        
+        # Uzly
+        outline = ' stroke="steelblue"' if detailed else ''
+        f.write(f'<g fill="lightblue" fill-opacity="0.9"{outline}>\n')
+        f.writelines(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{radius}"/>\n'
+                     for x, y in zip(layout.xs, layout.ys))
+        f.write('</g>\n')
+        
+        if detailed:
+            # Popisky uzlů a hran (váhy) - hrany s bílým obrysem písma místo rámečku
+            f.write('<g font-family="sans-serif" text-anchor="middle" dominant-baseline="central">\n')
+            f.writelines(f'<text x="{x:.1f}" y="{y:.1f}" font-size="12" font-weight="bold">'
+                         f'{xml_escape(node)}</text>\n'
+                         for node, x, y in zip(layout.node_list, layout.xs, layout.ys))
+            for edge, line in zip(graph.edges_list, polylines):
+                caption = _edge_caption(edge)
+                if caption:
+                    if len(line) == 2:
+                        (x1, y1), (x2, y2) = line
+                        x, y = (x1 + x2) / 2, (y1 + y2) / 2
+                    else:
+                        x, y = line[len(line) // 2]
+                    f.write(f'<text x="{x:.1f}" y="{y:.1f}" font-size="10" stroke="white" '
+                            f'stroke-width="3" paint-order="stroke">{xml_escape(caption)}</text>\n')
+            f.write('</g>\n')
+        
+        f.write('</svg>\n')
+
+
+def svg_visualization(graph, output_file='graph_output.svg', seed=DEFAULT_SEED):
+    """
+    Vizualizace do SVG - nepotřebuje žádné knihovny, nemůže selhat na importu.
+    
+    Args:
+        graph (Graph): Instance grafu
+        output_file (str): Název výstupního souboru
+        seed (int): Seed rozložení uzlů
+    
+    Returns:
+        bool: True pokud bylo vykreslení úspěšné
+    """
+    try:
+        write_svg(graph, output_file, seed=seed)
+    except OSError as e:
+        print(f"Chyba při zápisu SVG: {e}")
+        return False
+    print(f"Graf vykreslen do souboru: {output_file}")
+    return True
+
+
+def visualize_graph(graph, method='auto', output_file='graph_output',
+                    focus=None, radius=1, collapse=None, max_nodes=None):
     """
     Univerzální funkce pro vizualizaci grafu.
     
+    Volby focus a collapse kreslí jen část grafu (viz views.py) - cena
+    vykreslení pak závisí na velikosti zobrazené části, ne celého grafu.
+    
     Args:
         graph (Graph): Instance grafu
-        method (str): Metoda vizualizace ('auto', 'text', 'matplotlib', 'graphviz')
+        method (str): Metoda vizualizace ('auto', 'text', 'matplotlib', 'graphviz', 'svg')
         output_file (str): Název výstupního souboru
+        focus (str): Kreslit jen okolí tohoto uzlu (None = celý graf)
+        radius (int): Poloměr okolí (počet hran od uzlu focus)
+        collapse (str): Stáhnout komponenty do super-uzlů - 'scc' (silné),
+                        'components' (slabé) nebo None
+        max_nodes (int): Volitelný strop počtu uzlů okolí
         
     Returns:
         str: Cesta k výstupnímu souboru nebo textová reprezentace
+    
+    Raises:
+        KeyError: Pokud uzel focus v grafu není
+        ValueError: Pokud režim collapse není známý
     """
+    if focus is not None or collapse is not None:
+        total = graph.get_node_count()
+        graph = select_view(graph, focus, radius, collapse, max_nodes)
+        print(f"Kreslím pohled: {graph.get_node_count()} z {total} uzlů, "
+              f"{graph.get_edge_count()} hran")
+    
     if method == 'text':
         visualizer = TextVisualizer(graph)
         return visualizer.draw_text()
@@ -305,12 +474,24 @@ def visualize_graph(graph, method='auto', output_file='graph_output'):
             visualizer = TextVisualizer(graph)
             return visualizer.draw_text()
     
+    elif method == 'svg':
+        success = svg_visualization(graph, output_file + '.svg')
+        if success:
+            return output_file + '.svg'
+        else:
+            # Fallback na textovou vizualizaci
+            print("Fallback na textovou vizualizaci...")
+            visualizer = TextVisualizer(graph)
+            return visualizer.draw_text()
+    
     else:  # method == 'auto'
-        # Zkusíme matplotlib, pak graphviz, nakonec text
+        # Zkusíme matplotlib, pak graphviz, pak SVG, nakonec text
         if try_matplotlib_visualization(graph, output_file + '.png'):
             return output_file + '.png'
         elif try_graphviz_visualization(graph, output_file):
             return output_file + '.png'
+        elif svg_visualization(graph, output_file + '.svg'):
+            return output_file + '.svg'
         else:
             visualizer = TextVisualizer(graph)
             return visualizer.draw_text()
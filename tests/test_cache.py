@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Testy cache matic - odložení matice na disk musí uvolnit její paměť.
+
+Spuštění:
+    python -m unittest tests.test_cache
+"""
+
+import gc
+import sys
+import tracemalloc
+import unittest
+from pathlib import Path
+
+# Přidání rodičovského adresáře do sys.path pro import src modulů
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.cache import MappedMatrix, MatrixCache
+from src.graph import Graph
+from src.matrices import MatrixBuilder, NamedMatrix
+from src.parser import Edge, Node
+
+
+# Matice délek n × n v array('d') zabere n² * 8 B, předchůdci n² * 4 B
+NODES = 150
+
+
+def cycle_graph(n):
+    """Orientovaný cyklus - všechny vzdálenosti jsou konečné."""
+    nodes = [Node(f"N{i:03d}") for i in range(n)]
+    edges = [Edge(nodes[i].identifier, nodes[(i + 1) % n].identifier, directed=True)
+             for i in range(n)]
+    return Graph(nodes, edges)
+
+
+def traced_memory():
+    """Aktuálně alokovaná paměť sledovaná tracemalloc (bajty)."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+class SpillReleasesMemoryTest(unittest.TestCase):
+    """Po odložení na disk nesmí data matice dál držet builder."""
+    
+    def setUp(self):
+        tracemalloc.start()
+        self.builder = MatrixBuilder(cycle_graph(NODES))
+        self.tiny = NamedMatrix([[0]], ['x'], ['x'])
+    
+    def tearDown(self):
+        tracemalloc.stop()
+    
+    def spill_distance(self, cache):
+        """Uloží matici délek a odloží ji vložením další matice."""
+        cache.put((0, 'distance', ()), self.builder.distance_matrix())
+        before = traced_memory()
+        cache.put((0, 'other', ()), self.tiny)
+        self.assertIsInstance(cache.get((0, 'distance', ())), MappedMatrix)
+        return before - traced_memory()
+    
+    def test_spill_frees_distance_arrays(self):
+        cache = MatrixCache(budget=1, on_evict=lambda key: self.builder.release(key[1]))
+        freed = self.spill_distance(cache)
+        
+        # Uvolnit se musí aspoň vzdálenosti (předchůdci drží jen builder)
+        self.assertGreater(freed, NODES * NODES * 8)
+        cache.clear()
+    
+    def test_spill_without_release_keeps_arrays(self):
+        # Bez on_evict pole dál drží builder - odložení nic neuvolní
+        cache = MatrixCache(budget=1)
+        freed = self.spill_distance(cache)
+        
+        self.assertLess(freed, NODES * NODES)
+        cache.clear()
+    
+    def test_released_matrix_is_rebuilt(self):
+        expected = list(map(list, self.builder.distance_matrix().raw()))
+        cache = MatrixCache(budget=1, on_evict=lambda key: self.builder.release(key[1]))
+        self.spill_distance(cache)
+        
+        self.assertEqual(list(map(list, cache.get((0, 'distance', ())).raw())), expected)
+        self.assertEqual(list(map(list, self.builder.distance_matrix().raw())), expected)
+        cache.clear()
+    
+    def test_spill_frees_adjacency_copy(self):
+        cache = MatrixCache(budget=1, on_evict=lambda key: self.builder.release(key[1]))
+        cache.put((0, 'adjacency', ()), self.builder.adjacency_matrix())
+        before = traced_memory()
+        cache.put((0, 'other', ()), self.tiny)
+        
+        # Uvolní se řádky v cache i kopie v builderu (n² ukazatelů na int)
+        self.assertGreater(before - traced_memory(), 2 * NODES * NODES * 8)
+        cache.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,7 +25,7 @@ def main():
         sys.exit(1)
     
     # Knihovny k instalaci
-    packages = ['matplotlib', 'networkx', 'graphviz']
+    packages = ['matplotlib', 'graphviz']
     
     print("📦 Instaluji knihovny...")
     print()
@@ -15,14 +15,14 @@ pip install --upgrade pip
 
 echo ""
 echo "Instalace knihoven pro vizualizaci..."
-pip install matplotlib networkx graphviz
+pip install matplotlib graphviz
 
 echo ""
 echo "✓ Knihovny nainstalovány"
 echo ""
 
 echo "📋 Seznam nainstalovaných knihoven:"
-pip list | grep -E "matplotlib|networkx|graphviz"
+pip list | grep -E "matplotlib|graphviz"
 
 echo ""
 echo "✅ Hotovo!"
@@ -3,9 +3,15 @@
 Jednoduchá funkce pro načtení a vykreslení grafu.
 """
 
-from parser import GraphParser
-from graph import Graph
-from visualizer import visualize_graph, TextVisualizer
+import sys
+from pathlib import Path
+
+# Přidání rodičovského adresáře do sys.path pro import src modulů
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parser import GraphParser
+from src.graph import Graph
+from src.visualizer import visualize_graph, TextVisualizer
 
 
 def vykresli_graf(soubor_cesta, metoda='auto', vystup='graph_viz'):